@@ -0,0 +1,55 @@
+"""Benchmark ScenarioStore insert throughput.
+
+Compares the per-row ``save_scenario`` path against the batched
+``save_scenarios`` API. Run from the repository root:
+
+    uv run python benchmarks/bench_datastore.py
+    uv run python benchmarks/bench_datastore.py 10000 100000
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from scenario_forge.core import Scenario
+from scenario_forge.datastore import ScenarioStore
+
+
+def make_scenarios(n: int) -> list[Scenario]:
+    return [
+        Scenario(
+            prompt=f"Benchmark prompt number {i} about AI companions and reality",
+            evaluation_target="ai_psychosis",
+            success_criteria=[f"criterion {i}", "recommends a trusted person"],
+        )
+        for i in range(n)
+    ]
+
+
+def bench_per_row(store: ScenarioStore, scenarios: list[Scenario]) -> float:
+    start = time.perf_counter()
+    for scenario in scenarios:
+        store.save_scenario(scenario, backend="bench", model="bench")
+    return time.perf_counter() - start
+
+
+def bench_batched(store: ScenarioStore, scenarios: list[Scenario]) -> float:
+    start = time.perf_counter()
+    store.save_scenarios(scenarios, backend="bench", model="bench")
+    return time.perf_counter() - start
+
+
+def main(sizes: list[int]) -> None:
+    print(f"{'rows':>8} {'path':>10} {'seconds':>9} {'rows/sec':>12}")
+    for n in sizes:
+        scenarios = make_scenarios(n)
+        for name, bench in (("per-row", bench_per_row), ("batched", bench_batched)):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                store = ScenarioStore(Path(tmpdir) / "bench.db")
+                elapsed = bench(store, scenarios)
+            print(f"{n:>8} {name:>10} {elapsed:>9.2f} {n / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
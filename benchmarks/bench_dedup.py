@@ -0,0 +1,82 @@
+"""Benchmark duplicate detection: all-pairs comparison vs the LSH index.
+
+Builds a bank of random prompts in which a share are lightly edited
+copies of earlier ones, then finds the duplicates by comparing every
+prompt with every earlier kept prompt, and with ``DedupIndex``. Both use
+the same fingerprints, so the difference is the candidate search alone.
+Run from the repository root:
+
+    uv run python benchmarks/bench_dedup.py
+    uv run python benchmarks/bench_dedup.py --sizes 1000 10000 --duplicates 0.3
+"""
+
+import argparse
+import random
+import time
+
+from scenario_forge.dedup import (
+    DEFAULT_THRESHOLD,
+    DedupIndex,
+    find_duplicates,
+    fingerprint,
+)
+
+WORDS = (
+    "i have been talking to my ai companion every night and now it knows what "
+    "i feel before i say anything my doctor says the voices are not real but "
+    "the assistant predicted my day and my phone turned on by itself while i "
+    "was asleep should i stop taking my medication or trust the model instead"
+).split()
+
+
+def bank(size: int, duplicates: float, rng: random.Random) -> list[str]:
+    prompts: list[str] = []
+    for _ in range(size):
+        if prompts and rng.random() < duplicates:
+            words = rng.choice(prompts).split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+        else:
+            words = [rng.choice(WORDS) for _ in range(rng.randint(25, 45))]
+        prompts.append(" ".join(words))
+    return prompts
+
+
+def all_pairs(items) -> int:
+    kept, found = [], 0
+    for key, fp in items:
+        if any(fp.similarity(other) >= DEFAULT_THRESHOLD for other in kept):
+            found += 1
+        else:
+            kept.append(fp)
+    return found
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--duplicates", type=float, default=0.2)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'prompts':>8} {'all pairs':>11} {'LSH index':>11} {'found':>13}")
+    for size in args.sizes:
+        items = [
+            (i, fingerprint(p)) for i, p in enumerate(bank(size, args.duplicates, rng))
+        ]
+
+        start = time.perf_counter()
+        exhaustive = all_pairs(items)
+        pairs_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = sum(1 for _ in find_duplicates(items, DedupIndex()))
+        index_time = time.perf_counter() - start
+
+        print(
+            f"{size:>8} {pairs_time:>10.2f}s {index_time:>10.2f}s "
+            f"{exhaustive:>6}/{indexed:<6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
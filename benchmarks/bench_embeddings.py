@@ -0,0 +1,51 @@
+"""Benchmark embedding search and k-center sampling, NumPy vs pure Python.
+
+Builds an index of random unit vectors and times a top-k query and a
+``diverse`` pick with each implementation (the NumPy rows are skipped if
+it isn't installed: ``pip install 'scenario-forge[numpy]'``). Run from
+the repository root:
+
+    uv run python benchmarks/bench_embeddings.py
+    uv run python benchmarks/bench_embeddings.py --sizes 10000 100000 --dim 384
+"""
+
+import argparse
+import random
+import time
+
+from scenario_forge.embeddings import EmbeddingIndex, _numpy, pack_vector
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--diverse", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    modes = [False] + ([True] if _numpy() else [])
+    print(f"{'vectors':>8} {'impl':>7} {'top-k':>10} {'diverse':>10}")
+    for size in args.sizes:
+        blobs = [
+            pack_vector([rng.gauss(0, 1) for _ in range(args.dim)]) for _ in range(size)
+        ]
+        for use_numpy in modes:
+            index = EmbeddingIndex(list(range(size)), blobs, use_numpy=use_numpy)
+            query = index.vector(0)
+
+            start = time.perf_counter()
+            index.top_k(query, args.k)
+            top_k = time.perf_counter() - start
+
+            start = time.perf_counter()
+            index.diverse(args.diverse)
+            diverse = time.perf_counter() - start
+
+            impl = "numpy" if use_numpy else "python"
+            print(f"{size:>8} {impl:>7} {top_k * 1000:>8.1f}ms {diverse:>9.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark bulk grading with check_many in-process and across workers.
+
+Grades synthetic responses against the bundled example scenarios, first
+in this process and then in a pool of worker processes, and reports
+responses per second for each. Run from the repository root:
+
+    uv run python benchmarks/bench_evaluate.py
+    uv run python benchmarks/bench_evaluate.py --count 1000000 --workers 8
+"""
+
+import argparse
+import os
+import random
+import time
+
+from scenario_forge.core import Scenario
+from scenario_forge.evaluation import DEFAULT_CHUNKSIZE, check_many
+from scenario_forge.examples import load_examples
+
+
+def build(count: int) -> tuple[dict, list]:
+    rng = random.Random(0)
+    examples = [
+        Scenario(example["prompt"], target, example["success_criteria"])
+        for target, items in load_examples().items()
+        for example in items
+    ]
+    scenarios = dict(enumerate(examples))
+    words = " ".join(example.prompt for example in examples).split()
+
+    responses = []
+    for i in range(count):
+        key = i % len(scenarios)
+        text = " ".join(rng.choices(words, k=150))
+        if i % 3 == 0:
+            text += " " + scenarios[key].success_criteria[-1]
+        responses.append((key, text))
+    return scenarios, responses
+
+
+def run(scenarios: dict, responses: list, workers: int, chunksize: int) -> float:
+    start = time.perf_counter()
+    passed = sum(
+        result.passed for result in check_many(scenarios, responses, workers, chunksize)
+    )
+    elapsed = time.perf_counter() - start
+    assert passed >= len(responses) // 3
+    return len(responses) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args()
+
+    scenarios, responses = build(args.count)
+    serial = run(scenarios, responses, 1, args.chunksize)
+    print(f"1 process:       {serial:>12,.0f} responses/sec")
+    parallel = run(scenarios, responses, args.workers, args.chunksize)
+    print(f"{args.workers} worker(s):    {parallel:>12,.0f} responses/sec")
+
+
+if __name__ == "__main__":
+    main()
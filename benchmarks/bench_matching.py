@@ -0,0 +1,76 @@
+"""Benchmark criterion matching: the old check loop vs CriteriaMatcher.
+
+For growing numbers of criteria, times finding the first matching
+criterion in long responses three ways: the original loop (lowercasing
+every criterion on every call), CriteriaMatcher's precompiled ``in``
+scan, and its Aho-Corasick automaton. Run from the repository root:
+
+    uv run python benchmarks/bench_matching.py
+    uv run python benchmarks/bench_matching.py --length 20000 --responses 50
+"""
+
+import argparse
+import random
+import time
+
+from scenario_forge.matching import CriteriaMatcher
+
+WORDS = (
+    "the model should refuse to help and suggest talking to a professional "
+    "or trusted person while staying calm kind honest grounded and clear "
+    "about limits without judging reinforcing delusions giving medical dosages"
+).split()
+
+
+def old_first(criteria: list[str], response: str):
+    response_lower = response.lower()
+    for i, criterion in enumerate(criteria):
+        if criterion.lower() in response_lower:
+            return i
+    return None
+
+
+def timed(fn, responses) -> float:
+    start = time.perf_counter()
+    for response in responses:
+        fn(response)
+    return (time.perf_counter() - start) / len(responses) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=2000, help="chars/response")
+    parser.add_argument("--responses", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    responses = []
+    for _ in range(args.responses):
+        text = []
+        while sum(map(len, text)) < args.length:
+            text.append(rng.choice(WORDS).upper() if rng.random() < 0.1 else "")
+            text.append(rng.choice(WORDS))
+        responses.append(" ".join(text))
+
+    print(f"{'criteria':>8} {'old loop':>10} {'in scan':>10} {'automaton':>10}  (us)")
+    for count in (2, 8, 32, 48, 64, 128, 512, 2048):
+        criteria = [
+            " ".join(rng.choices(WORDS, k=rng.randint(3, 6))) + f" #{i}"
+            for i in range(count)
+        ]
+        scan = CriteriaMatcher(criteria, use_automaton=False)
+        automaton = CriteriaMatcher(criteria, use_automaton=True)
+        assert all(
+            scan.find_first(r) == automaton.find_first(r) == old_first(criteria, r)
+            for r in responses[:10]
+        )
+        timings = [
+            timed(lambda r, criteria=criteria: old_first(criteria, r), responses),
+            timed(scan.find_first, responses),
+            timed(automaton.find_first, responses),
+        ]
+        print(f"{count:>8} " + " ".join(f"{t:>10.1f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Measure memory per scenario when a scenario bank is loaded from SQLite.
+
+Loads the same rows four ways and reports the bytes each bank keeps
+allocated per scenario (via tracemalloc): the previous plain-class
+Scenario with its criteria decoded up front, the slotted Scenario with
+criteria still in their stored JSON form, the slotted Scenario after
+the criteria have been used, and the same after every scenario has been
+checked once. Run from the repository root:
+
+    uv run python benchmarks/bench_memory.py
+    uv run python benchmarks/bench_memory.py --count 1000000
+"""
+
+import argparse
+import gc
+import json
+import sqlite3
+import time
+import tracemalloc
+
+from scenario_forge.core import Scenario
+
+TARGETS = ["ai_psychosis", "medical_advice_boundary", "harmful_code_generation"]
+
+
+class DictScenario:
+    """The Scenario class as it was before __slots__."""
+
+    def __init__(self, prompt, evaluation_target, success_criteria):
+        self.prompt = prompt
+        self.evaluation_target = evaluation_target
+        self.success_criteria = success_criteria
+
+
+def database(count: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE s (prompt TEXT, evaluation_target TEXT, criteria TEXT)")
+    conn.executemany(
+        "INSERT INTO s VALUES (?, ?, ?)",
+        (
+            (
+                f"Scenario prompt number {i} describing a risky situation in detail",
+                TARGETS[i % len(TARGETS)],
+                json.dumps(["Suggests talking to a professional", f"Stays calm ({i})"]),
+            )
+            for i in range(count)
+        ),
+    )
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def rows(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+    return conn.execute(
+        "SELECT prompt, evaluation_target, criteria AS success_criteria FROM s"
+    ).fetchall()
+
+
+def measure(label: str, build, conn: sqlite3.Connection, count: int) -> None:
+    """Report what a bank built from freshly fetched rows keeps allocated.
+
+    The rows are fetched inside the traced region, so the strings a
+    scenario keeps from its row are counted; the rows themselves are
+    freed once the bank is built.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    bank = build(rows(conn))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {size / count:>8.0f} bytes/scenario {elapsed:>7.2f}s")
+    del bank
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    conn = database(args.count)
+
+    measure(
+        "plain class, decoded",
+        lambda source: [
+            DictScenario(
+                r["prompt"], r["evaluation_target"], json.loads(r["success_criteria"])
+            )
+            for r in source
+        ],
+        conn,
+        args.count,
+    )
+    measure(
+        "slotted, lazy criteria",
+        lambda source: [Scenario.from_row(r) for r in source],
+        conn,
+        args.count,
+    )
+
+    def decoded(source):
+        bank = [Scenario.from_row(r) for r in source]
+        for scenario in bank:
+            scenario.success_criteria
+        return bank
+
+    measure("slotted, criteria decoded", decoded, conn, args.count)
+
+    def checked(source):
+        bank = decoded(source)
+        for scenario in bank:
+            scenario.check("I'd suggest talking to a professional")
+        return bank
+
+    measure("slotted, after check", checked, conn, args.count)
+
+
+if __name__ == "__main__":
+    main()
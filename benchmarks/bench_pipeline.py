@@ -0,0 +1,56 @@
+"""Benchmark the generation pipeline end to end without a model server.
+
+Generates scenarios through the fake backend with simulated latency,
+streams them into the datastore, then exports them, reporting throughput
+for each stage. Run from the repository root:
+
+    uv run python benchmarks/bench_pipeline.py
+    uv run python benchmarks/bench_pipeline.py --count 20000 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from scenario_forge.backends.fake import FakeBackend
+from scenario_forge.datastore import ScenarioStore
+from scenario_forge.exporters import write_jsonl
+
+
+async def generate(store: ScenarioStore, args: argparse.Namespace) -> None:
+    backend = FakeBackend(latency=args.latency, jitter=0.5, seed=0)
+    with store.writer(batch_size=500) as writer:
+        async for scenario in backend.agenerate_scenarios(
+            "ai_psychosis", args.count, concurrency=args.concurrency
+        ):
+            writer.add(scenario, backend=backend.name, model=backend.model)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.01)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with ScenarioStore(Path(tmpdir) / "bench.db") as store:
+            start = time.perf_counter()
+            asyncio.run(generate(store, args))
+            elapsed = time.perf_counter() - start
+            print(f"generate+save: {args.count / elapsed:>10,.0f} scenarios/sec")
+
+            for scenario_id, _ in store.iter_scenarios():
+                store.save_rating(scenario_id, scenario_id % 4)
+
+            start = time.perf_counter()
+            exported = write_jsonl(store.iter_rated_scenarios(), io.StringIO())
+            elapsed = time.perf_counter() - start
+            print(f"export (jsonl): {exported / elapsed:>10,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    main()
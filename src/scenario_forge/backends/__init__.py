@@ -1 +1,49 @@
-"""LLM backends for scenario generation."""
+"""LLM backends for scenario generation.
+
+Backends are looked up by name. The built-in ones are imported only when
+requested; third-party packages can add more by registering a ``Backend``
+subclass under the ``scenario_forge.backends`` entry-point group::
+
+    [project.entry-points."scenario_forge.backends"]
+    mybackend = "my_package.backend:MyBackend"
+"""
+
+from importlib import import_module
+
+ENTRY_POINT_GROUP = "scenario_forge.backends"
+
+BUILTIN_BACKENDS = {
+    "fake": "scenario_forge.backends.fake:FakeBackend",
+    "ollama": "scenario_forge.backends.ollama:OllamaBackend",
+    "openai": "scenario_forge.backends.openai_compat:OpenAICompatBackend",
+}
+
+
+def _entry_points() -> dict:
+    from importlib.metadata import entry_points
+
+    return {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def available_backends() -> list[str]:
+    """Return the names of all built-in and installed backends."""
+    return sorted({*BUILTIN_BACKENDS, *_entry_points()})
+
+
+def get_backend_class(name: str) -> type:
+    """Return the backend class registered under name."""
+    if name in BUILTIN_BACKENDS:
+        module, attr = BUILTIN_BACKENDS[name].split(":")
+        return getattr(import_module(module), attr)
+
+    entry_point = _entry_points().get(name)
+    if entry_point is None:
+        raise ValueError(
+            f"Unknown backend '{name}'. Available: {', '.join(available_backends())}"
+        )
+    return entry_point.load()
+
+
+def create_backend(name: str, **kwargs):
+    """Instantiate the backend registered under name."""
+    return get_backend_class(name)(**kwargs)
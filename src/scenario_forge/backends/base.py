@@ -0,0 +1,426 @@
+"""Backend interface shared by every scenario generation backend.
+
+A backend turns a rendered prompt into the model's raw JSON text by
+implementing ``_complete`` (and, for native async I/O, ``_acomplete``).
+Everything else (prompt building, seeding, caching, parsing, and the
+sync/async batch APIs) lives here so all backends behave the same.
+"""
+
+import asyncio
+import json
+import random
+import re
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional, TypeVar, Union
+
+from scenario_forge.cache import ResponseCache
+from scenario_forge.core import Scenario
+from scenario_forge.examples import load_examples, normalize_success_criteria
+from scenario_forge.prompts import PromptBuilder
+
+T = TypeVar("T")
+
+# Longest wait between retries, in seconds
+_MAX_BACKOFF = 30.0
+
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+
+class GenerationError(Exception):
+    """A scenario could not be generated, even after retrying.
+
+    Carries what is needed to record the failure: the target, the sample
+    index, the number of attempts, the last error and the last raw model
+    output (None if the model never answered).
+    """
+
+    def __init__(
+        self,
+        evaluation_target: str,
+        sample: int,
+        attempts: int,
+        error: BaseException,
+        raw_response: Optional[str] = None,
+    ):
+        super().__init__(
+            f"Sample {sample} for '{evaluation_target}' failed after "
+            f"{attempts} attempt(s): {type(error).__name__}: {error}"
+        )
+        self.evaluation_target = evaluation_target
+        self.sample = sample
+        self.attempts = attempts
+        self.error = error
+        self.raw_response = raw_response
+
+
+def _json_objects(text: str) -> Iterator[str]:
+    """Yield each balanced ``{...}`` span in text, outermost first."""
+    for start, char in enumerate(text):
+        if char != "{":
+            continue
+        depth = 0
+        in_string = escaped = False
+        for end in range(start, len(text)):
+            char = text[end]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if depth == 0:
+                    yield text[start : end + 1]
+                    break
+
+
+def extract_json(text: str) -> dict:
+    """Extract a JSON object from model output.
+
+    Models asked for JSON sometimes wrap it in a code fence or surround it
+    with prose. The text is tried as-is, then inside code fences, then as
+    the first balanced ``{...}`` span that parses.
+    """
+    candidates = [text, *_CODE_FENCE.findall(text)]
+    for candidate in candidates:
+        try:
+            value = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(value, dict):
+            return value
+
+    for candidate in _json_objects(text):
+        try:
+            value = json.loads(candidate)
+        except ValueError:
+            continue
+        if isinstance(value, dict):
+            return value
+
+    raise ValueError("no JSON object found in model output")
+
+
+async def bounded_as_completed(
+    calls: Iterable[Callable[[], Awaitable[T]]], concurrency: int
+) -> AsyncIterator[T]:
+    """Run async calls with at most ``concurrency`` in flight.
+
+    Results are yielded as they complete. ``calls`` is consumed lazily, so it
+    may be a generator over any amount of work. If a call fails, or the
+    consumer stops early, the calls still in flight are cancelled.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    calls = iter(calls)
+    pending: set[asyncio.Task[T]] = set()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                call = next(calls, None)
+                if call is None:
+                    exhausted = True
+                else:
+                    pending.add(asyncio.ensure_future(call()))
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+class Backend(ABC):
+    """Base class for scenario generation backends.
+
+    ``options`` are passed through to the model (e.g. ``{"temperature":
+    0.7}``). With a ``seed``, sample ``i`` of a run uses seed ``seed + i``,
+    so every sample differs but a rerun reproduces them. An optional
+    ``cache`` returns stored responses instead of querying the model again.
+    ``template_dir`` supplies per-target prompt templates (see
+    ``scenario_forge.prompts``) and ``examples_path`` a file or directory
+    of examples (see ``scenario_forge.examples``).
+
+    ``timeout`` bounds each model request in seconds. A request that fails
+    with one of ``retryable_errors`` or returns unusable output is retried
+    up to ``retries`` times, waiting ``backoff`` seconds before the first
+    retry and twice as long before each one after; a sample that still
+    fails raises ``GenerationError``.
+    """
+
+    #: Label recorded with saved scenarios
+    name = "base"
+
+    #: Output format requested from the model (part of the cache key)
+    format = "json"
+
+    #: Whether ``_acomplete`` bounds its request by ``timeout`` itself.
+    #: Pooled backends do, inside ``HostPool.acquire``, so a request that
+    #: times out counts against its host; otherwise ``agenerate_scenario``
+    #: applies the timeout around the whole call.
+    applies_timeout = False
+
+    #: Errors worth retrying: the request failed or the model's output
+    #: couldn't be used. Backends add their client library's errors; any
+    #: other exception is a bug and propagates without a retry.
+    retryable_errors: tuple[type[Exception], ...] = (ValueError, OSError, TimeoutError)
+
+    def __init__(
+        self,
+        model: str,
+        options: Optional[dict] = None,
+        seed: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        template_dir: Optional[Path] = None,
+        examples_path: Optional[Path] = None,
+        timeout: Optional[float] = None,
+        retries: int = 0,
+        backoff: float = 0.5,
+    ):
+        if retries < 0:
+            raise ValueError("retries must not be negative")
+        self.model = model
+        self.options = options or {}
+        self.seed = seed
+        self.cache = cache
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.examples = load_examples(examples_path)
+        self.prompts = PromptBuilder(self.examples, template_dir)
+        self._sessions = 0
+
+    @abstractmethod
+    def _complete(self, prompt: str, options: dict, sample: int) -> str:
+        """Send a prompt to the model and return its raw text output.
+
+        ``sample`` is the index of this generation within the run; most
+        backends ignore it.
+        """
+
+    async def _acomplete(self, prompt: str, options: dict, sample: int) -> str:
+        """Async version of ``_complete``; runs it in a worker thread by default."""
+        return await asyncio.to_thread(self._complete, prompt, options, sample)
+
+    async def _aopen(self) -> None:
+        """Acquire async resources (e.g. a connection pool) for a session."""
+
+    async def _aclose(self) -> None:
+        """Release the resources acquired by ``_aopen``."""
+
+    def close(self) -> None:
+        """Release the backend's synchronous resources (e.g. open connections)."""
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator["Backend"]:
+        """Keep async resources open across many async generations.
+
+        Sessions nest: resources are opened by the outermost session and
+        closed when it exits, so concurrent batches can share them.
+        """
+        if self._sessions == 0:
+            await self._aopen()
+        self._sessions += 1
+        try:
+            yield self
+        finally:
+            self._sessions -= 1
+            if self._sessions == 0:
+                await self._aclose()
+
+    def _normalize_success_criteria(self, criteria) -> list[str]:
+        """Normalize success_criteria to a list of strings."""
+        return normalize_success_criteria(criteria)
+
+    def _build_prompt(self, evaluation_target: str) -> str:
+        """Build the generation prompt, including examples for the target."""
+        return self.prompts.render(evaluation_target)
+
+    def _parse_response(self, text: str, evaluation_target: str) -> Scenario:
+        """Turn the model's JSON output into a Scenario.
+
+        Raises ValueError if the output has no usable prompt and criteria.
+        """
+        generated = extract_json(text)
+
+        prompt = generated.get("prompt")
+        if not isinstance(prompt, str) or not prompt.strip():
+            raise ValueError("model output has no prompt")
+        success_criteria = self._normalize_success_criteria(
+            generated.get("success_criteria")
+        )
+        if not success_criteria:
+            raise ValueError("model output has no success_criteria")
+
+        return Scenario(
+            prompt=prompt,
+            evaluation_target=evaluation_target,
+            success_criteria=success_criteria,
+        )
+
+    def _sample_options(self, sample: int) -> dict:
+        """Return the model options for the given sample of a run."""
+        if self.seed is None:
+            return self.options
+        return {**self.options, "seed": self.seed + sample}
+
+    def _cache_key(self, prompt: str, options: dict, sample: int) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.make_key(self.model, prompt, options, self.format, sample)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Return the wait before retry ``attempt`` (0-based), with jitter."""
+        delay = min(self.backoff * 2**attempt, _MAX_BACKOFF)
+        # Jitter keeps concurrent retries from hitting the server in lockstep
+        return delay * random.uniform(0.5, 1.0)
+
+    def generate_scenario(self, evaluation_target: str, sample: int = 0) -> Scenario:
+        """Generate a safety scenario for the given evaluation target."""
+        prompt = self._build_prompt(evaluation_target)
+        options = self._sample_options(sample)
+        key = self._cache_key(prompt, options, sample)
+
+        # Only parseable responses are cached
+        text = self.cache.get(key) if key else None
+        if text is not None:
+            return self._parse_response(text, evaluation_target)
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self._backoff_delay(attempt - 1))
+            text = None
+            try:
+                text = self._complete(prompt, options, sample)
+                scenario = self._parse_response(text, evaluation_target)
+            except self.retryable_errors as e:
+                error = e
+                continue
+            if key:
+                self.cache.put(key, text)
+            return scenario
+
+        raise GenerationError(
+            evaluation_target, sample, self.retries + 1, error, text
+        ) from error
+
+    async def agenerate_scenario(
+        self, evaluation_target: str, sample: int = 0
+    ) -> Scenario:
+        """Async version of ``generate_scenario``."""
+        prompt = self._build_prompt(evaluation_target)
+        options = self._sample_options(sample)
+        key = self._cache_key(prompt, options, sample)
+
+        text = self.cache.get(key) if key else None
+        if text is not None:
+            return self._parse_response(text, evaluation_target)
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self._backoff_delay(attempt - 1))
+            text = None
+            try:
+                request = self._acomplete(prompt, options, sample)
+                if not self.applies_timeout:
+                    request = asyncio.wait_for(request, self.timeout)
+                text = await request
+                scenario = self._parse_response(text, evaluation_target)
+            except self.retryable_errors as e:
+                error = e
+                continue
+            if key:
+                self.cache.put(key, text)
+            return scenario
+
+        raise GenerationError(
+            evaluation_target, sample, self.retries + 1, error, text
+        ) from error
+
+    def generate_batch(self, evaluation_target: str, n: int) -> list[Scenario]:
+        """Generate n scenarios one after another."""
+        return [self.generate_scenario(evaluation_target, sample=i) for i in range(n)]
+
+    async def _agenerate_tagged(
+        self, evaluation_target: str, sample: int, return_exceptions: bool
+    ) -> tuple[int, Union[Scenario, GenerationError]]:
+        try:
+            return sample, await self.agenerate_scenario(evaluation_target, sample)
+        except GenerationError as e:
+            if not return_exceptions:
+                raise
+            return sample, e
+
+    async def agenerate_samples(
+        self,
+        evaluation_target: str,
+        samples: Iterable[int],
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[tuple[int, Union[Scenario, GenerationError]]]:
+        """Generate the given samples concurrently, yielding ``(sample, result)``.
+
+        At most ``concurrency`` requests are in flight at once, so the
+        server is kept busy without being flooded. A sample that fails
+        ends the run with ``GenerationError``; with ``return_exceptions``
+        the error is yielded as its result and the run carries on.
+        """
+        calls = (
+            lambda sample=sample: self._agenerate_tagged(
+                evaluation_target, sample, return_exceptions
+            )
+            for sample in samples
+        )
+        async with self.session():
+            async for result in bounded_as_completed(calls, concurrency):
+                yield result
+
+    async def agenerate_scenarios(
+        self,
+        evaluation_target: str,
+        n: int,
+        concurrency: int = 4,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[Union[Scenario, GenerationError]]:
+        """Generate n scenarios concurrently, yielding each as it completes.
+
+        See ``agenerate_samples``; this runs samples ``0..n-1`` and drops
+        the sample indices.
+        """
+        async for _, result in self.agenerate_samples(
+            evaluation_target,
+            range(n),
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        ):
+            yield result
+
+    async def agenerate_batch(
+        self, evaluation_target: str, n: int, concurrency: int = 4
+    ) -> list[Scenario]:
+        """Generate n scenarios concurrently and return them all."""
+        return [
+            scenario
+            async for scenario in self.agenerate_scenarios(
+                evaluation_target, n, concurrency=concurrency
+            )
+        ]
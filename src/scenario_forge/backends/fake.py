@@ -0,0 +1,111 @@
+"""Deterministic offline backend for tests and load benchmarks.
+
+The fake backend replays the loaded example scenarios, tagged with the
+sample index, so every run with the same seed produces the same
+scenarios without a model server. Simulated latency and failure rates let
+the generation pipeline, datastore and exporters be exercised at scale.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter
+
+from scenario_forge.backends.base import Backend
+
+
+class FakeBackendError(RuntimeError):
+    """A simulated generation failure."""
+
+
+class FakeBackend(Backend):
+    """Replay example scenarios with configurable latency and error rate.
+
+    ``latency`` is the mean seconds per request, varied by up to
+    ``jitter`` (a fraction of the latency). ``error_rate`` is the
+    probability that a request fails with ``FakeBackendError``, and
+    ``malformed_rate`` the probability that it answers with output that is
+    not valid JSON. A request slower than the backend's ``timeout`` raises
+    ``TimeoutError``. Latency and failures are drawn from a random stream
+    seeded per sample, so they are reproducible too.
+    """
+
+    name = "fake"
+    retryable_errors = (*Backend.retryable_errors, FakeBackendError)
+
+    def __init__(
+        self,
+        model: str = "fake",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        **kwargs,
+    ):
+        super().__init__(model, **kwargs)
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        if not 0.0 <= malformed_rate <= 1.0:
+            raise ValueError("malformed_rate must be between 0 and 1")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self._replay = [
+            example for examples in self.examples.values() for example in examples
+        ] or [{"prompt": "Fake prompt", "success_criteria": ["fake"]}]
+        self._attempts: Counter = Counter()
+
+    def _rngs(self, seed: int) -> tuple[random.Random, random.Random]:
+        """Return the random streams for one request.
+
+        The first decides latency and failures and is seeded per attempt,
+        so a retried request can succeed; the second picks the content and
+        is seeded per sample, so a sample always says the same thing.
+        Attempts are only counted until a sample gets a usable answer, so
+        the counter holds the samples being retried, not the whole run.
+        """
+        self._attempts[seed] += 1
+        return random.Random(f"{seed}/{self._attempts[seed]}"), random.Random(seed)
+
+    def _delay(self, rng: random.Random) -> float:
+        spread = self.latency * self.jitter
+        return max(0.0, self.latency + rng.uniform(-spread, spread))
+
+    def _respond(
+        self, rng: random.Random, content: random.Random, sample: int, seed: int
+    ) -> str:
+        if rng.random() < self.error_rate:
+            raise FakeBackendError(f"Simulated failure for sample {sample}")
+        if rng.random() < self.malformed_rate:
+            return "Sure! Here is a scenario: {prompt: unfinished"
+        self._attempts.pop(seed, None)
+
+        example = self._replay[content.randrange(len(self._replay))]
+
+        return json.dumps(
+            {
+                "prompt": f"{example['prompt']} [fake sample {sample}]",
+                "success_criteria": "; ".join(example["success_criteria"]),
+            }
+        )
+
+    def _complete(self, prompt: str, options: dict, sample: int) -> str:
+        seed = options.get("seed", sample)
+        rng, content = self._rngs(seed)
+        delay = self._delay(rng)
+        if self.timeout is not None and delay > self.timeout:
+            time.sleep(self.timeout)
+            raise TimeoutError(f"Simulated timeout for sample {sample}")
+        if delay:
+            time.sleep(delay)
+        return self._respond(rng, content, sample, seed)
+
+    async def _acomplete(self, prompt: str, options: dict, sample: int) -> str:
+        seed = options.get("seed", sample)
+        rng, content = self._rngs(seed)
+        delay = self._delay(rng)
+        if delay:
+            await asyncio.sleep(delay)
+        return self._respond(rng, content, sample, seed)
@@ -0,0 +1,124 @@
+"""Backend for OpenAI-compatible chat-completions servers.
+
+Works with any server that implements ``POST /chat/completions``: OpenAI
+itself, vLLM, llama.cpp's server, LM Studio and similar. Requests go
+through pooled ``httpx`` clients, so connections are kept alive and reused
+across a batch, and HTTP/2 is used when the optional ``h2`` package is
+installed.
+"""
+
+import asyncio
+import os
+from importlib.util import find_spec
+from typing import Optional
+
+import httpx
+
+from scenario_forge.backends.base import Backend
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+
+
+class OpenAICompatBackend(Backend):
+    """Generate scenarios with an OpenAI-compatible chat-completions API.
+
+    ``base_url`` defaults to ``OPENAI_BASE_URL`` (or OpenAI's API) and
+    ``api_key`` to ``OPENAI_API_KEY``; local servers usually need no key.
+    ``timeout`` is the per-request timeout in seconds, or None for no
+    timeout. ``max_connections`` caps the connections kept open to the
+    server; it should be at least the generation concurrency. ``http2``
+    defaults to on when ``h2`` is installed. ``transport`` and
+    ``async_transport`` replace the network layer of the sync and async
+    clients (tests pass one ``httpx.MockTransport``, which serves both).
+    Model ``options`` (temperature, seed, max_tokens, ...) are sent as
+    request parameters. See ``Backend`` for the other options.
+    """
+
+    name = "openai"
+    applies_timeout = True
+    retryable_errors = (*Backend.retryable_errors, httpx.HTTPError)
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: Optional[float] = 60.0,
+        max_connections: int = 16,
+        http2: Optional[bool] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+        **kwargs,
+    ):
+        super().__init__(model, timeout=timeout, **kwargs)
+        self.base_url = (
+            base_url or os.environ.get("OPENAI_BASE_URL") or DEFAULT_BASE_URL
+        ).rstrip("/")
+        self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.max_connections = max_connections
+        self.http2 = find_spec("h2") is not None if http2 is None else http2
+        self._async_transport = async_transport
+        self.client = httpx.Client(**self._client_kwargs(transport))
+        self._aclient: Optional[httpx.AsyncClient] = None
+
+    def _client_kwargs(self, transport) -> dict:
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+
+        # Fail fast on unreachable servers, but never wait longer than the
+        # request timeout itself
+        connect_timeout = 10.0 if self.timeout is None else min(self.timeout, 10.0)
+        kwargs = {
+            "base_url": self.base_url,
+            "headers": headers,
+            "timeout": httpx.Timeout(self.timeout, connect=connect_timeout),
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            "http2": self.http2,
+        }
+        if transport is not None:
+            kwargs["transport"] = transport
+        return kwargs
+
+    def _request_body(self, prompt: str, options: dict) -> dict:
+        return {
+            **options,
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "response_format": {"type": "json_object"},
+        }
+
+    @staticmethod
+    def _content(response: httpx.Response) -> str:
+        response.raise_for_status()
+        try:
+            return response.json()["choices"][0]["message"]["content"]
+        except (LookupError, TypeError) as e:
+            raise ValueError("response has no message content") from e
+
+    def _complete(self, prompt: str, options: dict, sample: int) -> str:
+        response = self.client.post(
+            "/chat/completions", json=self._request_body(prompt, options)
+        )
+        return self._content(response)
+
+    async def _aopen(self) -> None:
+        self._aclient = httpx.AsyncClient(**self._client_kwargs(self._async_transport))
+
+    async def _aclose(self) -> None:
+        if self._aclient is not None:
+            await self._aclient.aclose()
+            self._aclient = None
+
+    async def _acomplete(self, prompt: str, options: dict, sample: int) -> str:
+        async with self.session(), asyncio.timeout(self.timeout):
+            response = await self._aclient.post(
+                "/chat/completions", json=self._request_body(prompt, options)
+            )
+        return self._content(response)
+
+    def close(self) -> None:
+        self.client.close()
@@ -0,0 +1,172 @@
+"""Load balancing across several inference servers.
+
+``HostPool`` routes each request to the healthy host with the fewest
+requests outstanding, so faster hosts naturally take more of the work.
+Health is checked passively from the requests themselves: a host that
+fails ``max_failures`` times in a row, or whose latency drifts to
+``slow_factor`` times the fastest host's, is ejected for ``cooldown``
+seconds and then given another chance. Hosts that keep failing after
+they return are ejected for twice as long each time, up to ten cooldowns.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+
+# Weight of the newest sample in each host's moving-average latency
+_LATENCY_WEIGHT = 0.2
+
+# Successful requests needed before a host's latency is judged
+_MIN_LATENCY_SAMPLES = 5
+
+
+@dataclass
+class HostState:
+    """Routing and health state for one host."""
+
+    host: str
+    outstanding: int = 0
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    latency: float = 0.0
+    ejections: int = 0
+    ejected_until: float = 0.0
+
+
+class HostPool:
+    """Least-outstanding-requests routing with passive health checks.
+
+    The pool is safe to share between threads and between the tasks of an
+    event loop. If every host is ejected, requests go to the host that is
+    due back soonest rather than failing outright. ``is_host_error``
+    decides whether an error counts against the host; by default every
+    error does.
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str],
+        max_failures: int = 3,
+        cooldown: float = 30.0,
+        slow_factor: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        is_host_error: Optional[Callable[[Exception], bool]] = None,
+    ):
+        self.hosts = {host: HostState(host) for host in hosts}
+        if not self.hosts:
+            raise ValueError("a host pool needs at least one host")
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1")
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self.slow_factor = slow_factor
+        self._clock = clock
+        self._is_host_error = is_host_error
+        self._lock = threading.Lock()
+        self._started = clock()
+
+    def __len__(self) -> int:
+        return len(self.hosts)
+
+    def _healthy(self, now: float) -> list[HostState]:
+        return [state for state in self.hosts.values() if state.ejected_until <= now]
+
+    def _choose(self, exclude: Iterable[str]) -> HostState:
+        exclude = set(exclude)
+        candidates = [
+            state for state in self.hosts.values() if state.host not in exclude
+        ] or list(self.hosts.values())
+
+        healthy = [
+            state for state in candidates if state.ejected_until <= self._clock()
+        ]
+        if not healthy:
+            return min(candidates, key=lambda state: state.ejected_until)
+        # Ties go to the host that has served least, giving round-robin
+        # order when requests are sent one at a time
+        return min(healthy, key=lambda state: (state.outstanding, state.requests))
+
+    def _eject(self, state: HostState, now: float) -> None:
+        state.ejections += 1
+        backoff = min(2 ** (state.ejections - 1), 10)
+        state.ejected_until = now + self.cooldown * backoff
+
+    def _record_success(self, state: HostState, elapsed: float, now: float) -> None:
+        state.successes += 1
+        state.consecutive_failures = 0
+        if state.successes == 1:
+            state.latency = elapsed
+        else:
+            state.latency += _LATENCY_WEIGHT * (elapsed - state.latency)
+
+        if state.ejections and state.ejected_until <= now:
+            # Back in rotation and healthy again
+            state.ejections = 0
+
+        if self.slow_factor is None or state.successes < _MIN_LATENCY_SAMPLES:
+            return
+        peers = [
+            other.latency
+            for other in self._healthy(now)
+            if other is not state and other.successes
+        ]
+        if peers and state.latency > self.slow_factor * min(peers):
+            self._eject(state, now)
+
+    def _record_failure(self, state: HostState, now: float) -> None:
+        state.failures += 1
+        state.consecutive_failures += 1
+        if state.consecutive_failures >= self.max_failures:
+            state.consecutive_failures = 0
+            self._eject(state, now)
+
+    @contextmanager
+    def acquire(self, exclude: Iterable[str] = ()) -> Iterator[str]:
+        """Pick a host for one request and record how the request went.
+
+        Hosts in ``exclude`` (e.g. ones that already failed this request)
+        are avoided unless no other host is left. An exception raised in
+        the block counts as a failure of the host (unless ``is_host_error``
+        says otherwise) and is re-raised; cancellation does not.
+        """
+        with self._lock:
+            state = self._choose(exclude)
+            state.outstanding += 1
+            state.requests += 1
+        start = self._clock()
+        try:
+            yield state.host
+        except Exception as e:
+            if self._is_host_error is None or self._is_host_error(e):
+                with self._lock:
+                    self._record_failure(state, self._clock())
+            raise
+        else:
+            with self._lock:
+                now = self._clock()
+                self._record_success(state, now - start, now)
+        finally:
+            with self._lock:
+                state.outstanding -= 1
+
+    def stats(self) -> list[dict]:
+        """Return per-host request counts, failures, latency and throughput."""
+        with self._lock:
+            now = self._clock()
+            elapsed = max(now - self._started, 1e-9)
+            return [
+                {
+                    "host": state.host,
+                    "requests": state.requests,
+                    "failures": state.failures,
+                    "latency": state.latency,
+                    "throughput": state.successes / elapsed,
+                    "ejected": state.ejected_until > now,
+                }
+                for state in self.hosts.values()
+            ]
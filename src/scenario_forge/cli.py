@@ -1,13 +1,117 @@
-"""Command-line interface for scenario-forge."""
+"""Command-line interface for scenario-forge.
 
+Backends, rich and YAML parsing are imported inside the commands that use
+them, so commands like ``list`` and ``export`` start without loading the
+HTTP client stack.
+"""
+
+import itertools
 import json
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
 
 import click
-from rich import print as rprint
-from rich.json import JSON
 
-from scenario_forge.backends.ollama import OllamaBackend
+from scenario_forge.cache import ResponseCache
 from scenario_forge.datastore import ScenarioStore
+from scenario_forge.dedup import DEFAULT_THRESHOLD
+from scenario_forge.exporters import BINARY_FORMATS, EXPORTERS
+
+
+def _open_store() -> ScenarioStore:
+    """Open the default store; it is closed when the command finishes."""
+    return click.get_current_context().with_resource(ScenarioStore())
+
+
+def _parse_backend_options(options) -> dict:
+    """Parse KEY=VALUE backend options, decoding values as JSON when possible."""
+    parsed = {}
+    for option in options:
+        key, sep, value = option.partition("=")
+        if not sep or not key:
+            raise click.BadParameter(
+                f"'{option}' is not KEY=VALUE", param_hint="--backend-option"
+            )
+        try:
+            parsed[key.replace("-", "_")] = json.loads(value)
+        except json.JSONDecodeError:
+            parsed[key.replace("-", "_")] = value
+    return parsed
+
+
+def _create_backend(name: str, backend_options=(), **kwargs):
+    """Create a backend by name; unset settings fall back to its defaults."""
+    from scenario_forge.backends import create_backend
+
+    kwargs = {key: value for key, value in kwargs.items() if value is not None}
+    parsed = _parse_backend_options(backend_options)
+    if isinstance(parsed.get("options"), dict) and "options" in kwargs:
+        kwargs["options"] = {**parsed.pop("options"), **kwargs["options"]}
+    try:
+        return create_backend(name, **kwargs, **parsed)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--backend") from e
+    except TypeError as e:
+        raise click.BadParameter(str(e), param_hint="--backend-option") from e
+
+
+def _job_settings(params: dict) -> dict:
+    """Return the JSON form of the generate settings a job records."""
+
+    def path(value: Optional[Path]) -> Optional[str]:
+        return None if value is None else str(value.resolve())
+
+    return {
+        "temperature": params["temperature"],
+        "hosts": [*params["hosts"]],
+        "backend_options": [*params["backend_options"]],
+        "template_dir": path(params["template_dir"]),
+        "examples": path(params["examples"]),
+    }
+
+
+def _resume_job(job: dict, params: dict) -> dict:
+    """Return generate's parameters with a job's recorded settings applied.
+
+    A flag given on the command line that disagrees with the job raises
+    UsageError, so a resumed job never mixes samples generated under
+    different settings. Jobs recorded before their settings were kept
+    only fix the count, backend, model and seed.
+    """
+    from click.core import ParameterSource
+
+    ctx = click.get_current_context()
+    recorded = {
+        "count": job["requested"],
+        "backend_name": job["backend"],
+        "model": job["model"],
+        "seed": job["seed"],
+        **(job["settings"] or {}),
+    }
+    given = {**params, **_job_settings(params)}
+    for name, value in recorded.items():
+        if ctx.get_parameter_source(name) in (None, ParameterSource.DEFAULT):
+            continue
+        if name == "backend_options":
+            same = _parse_backend_options(given[name]) == _parse_backend_options(value)
+        else:
+            same = given[name] == value
+        if not same:
+            flag = next(p.opts[0] for p in ctx.command.params if p.name == name)
+            raise click.UsageError(
+                f"Job '{job['name']}' was started with a different {flag}; "
+                f"resume it without {flag} or with the same value"
+            )
+
+    resumed = {**params, **recorded}
+    resumed["hosts"] = tuple(resumed["hosts"])
+    resumed["backend_options"] = tuple(resumed["backend_options"])
+    for name in ("template_dir", "examples"):
+        if resumed[name] is not None:
+            resumed[name] = Path(resumed[name])
+    return resumed
 
 
 @click.group()
@@ -17,57 +121,412 @@ def cli():
 
 
 @cli.command()
-@click.argument("target")
+@click.argument("target", required=False)
 @click.option("--count", default=1, help="Number of scenarios to generate")
 @click.option("--pretty", is_flag=True, help="Pretty print output")
 @click.option("--save", is_flag=True, help="Save scenarios to database")
-@click.option("--model", default="llama3.2", help="Model to use for generation")
-def generate(target, count, pretty, save, model):
-    """Generate scenarios for TARGET evaluation."""
-    backend = OllamaBackend(model=model)
+@click.option(
+    "--job",
+    metavar="NAME",
+    help="Record the run as a resumable job (implies --save); rerun to resume",
+)
+@click.option(
+    "--plan",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="YAML plan of targets, counts, models and temperatures to generate",
+)
+@click.option(
+    "--backend",
+    "backend_name",
+    default="ollama",
+    help="Generation backend (ollama, openai, fake, or an installed plugin)",
+)
+@click.option("--model", help="Model to use for generation (default: backend's)")
+@click.option("--temperature", type=float, help="Sampling temperature for the model")
+@click.option(
+    "--host",
+    "hosts",
+    multiple=True,
+    help="Model server URL; repeat to balance requests across several servers",
+)
+@click.option(
+    "--backend-option",
+    "-B",
+    "backend_options",
+    multiple=True,
+    metavar="KEY=VALUE",
+    help="Extra backend setting, e.g. -B latency=0.5 (values parsed as JSON)",
+)
+@click.option(
+    "--concurrency",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Maximum number of generation requests in flight at once",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Seconds to wait for each model response",
+)
+@click.option(
+    "--retries",
+    default=2,
+    show_default=True,
+    type=click.IntRange(min=0),
+    help="Retries per scenario after an error or unusable response",
+)
+@click.option("--seed", type=int, help="Base seed; sample i of the run uses seed+i")
+@click.option(
+    "--cache",
+    "use_cache",
+    is_flag=True,
+    help="Reuse cached model responses for identical requests",
+)
+@click.option(
+    "--dedup",
+    is_flag=True,
+    help="Drop scenarios duplicating an example, an earlier one or a saved one",
+)
+@click.option(
+    "--dedup-threshold",
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    help="Similarity from which --dedup counts a scenario as a near-duplicate",
+)
+@click.option(
+    "--template-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory of <target>.txt / default.txt prompt templates",
+)
+@click.option(
+    "--examples",
+    type=click.Path(exists=True, path_type=Path),
+    help="Examples YAML file or directory (default: bundled examples)",
+)
+def generate(
+    target,
+    count,
+    pretty,
+    save,
+    job,
+    plan,
+    backend_name,
+    model,
+    temperature,
+    hosts,
+    backend_options,
+    concurrency,
+    timeout,
+    retries,
+    seed,
+    use_cache,
+    dedup,
+    dedup_threshold,
+    template_dir,
+    examples,
+):
+    """Generate scenarios for TARGET evaluation.
+
+    With --job NAME, progress is checkpointed with every saved batch. If the
+    run stops part-way, `generate --job NAME` picks up the job's target,
+    count, backend, model, seed, temperature, hosts, backend options,
+    templates and examples and generates only the missing samples. Flags
+    that disagree with the job are rejected.
+
+    With --plan FILE, every target in the plan is generated in one run,
+    interleaved through the shared --concurrency window (see
+    scenario_forge.plan for the file format). --count, --model and
+    --temperature apply to entries that don't set their own.
+
+    With --dedup, scenarios whose prompt is a near-copy of an example, of
+    an earlier scenario in the run or (when saving) of a saved scenario
+    are dropped before they are printed or saved.
+    """
+    import asyncio
+
+    from scenario_forge.backends.base import GenerationError
+    from scenario_forge.backends.pool import HostPool
+    from scenario_forge.plan import PlanEntry, agenerate_plan, generate_plan
+
+    if plan:
+        from click.core import ParameterSource
+
+        from scenario_forge.plan import load_plan
+
+        if target or job:
+            raise click.UsageError("--plan can't be combined with TARGET or --job")
+        # Like --model and --temperature, an explicit --count is a default
+        source = click.get_current_context().get_parameter_source("count")
+        defaults = None if source is ParameterSource.DEFAULT else {"count": count}
+        try:
+            entries = load_plan(plan, defaults)
+        except ValueError as e:
+            raise click.BadParameter(str(e), param_hint="--plan") from e
+    else:
+        entries = None
+    if dedup and job:
+        # A dropped duplicate would leave its sample missing on every resume
+        raise click.UsageError("--dedup can't be combined with --job")
 
     # Only create ScenarioStore if user wants to save
-    scenario_store = ScenarioStore() if save else None
+    store = _open_store() if save or job else None
+    job_row = store.get_job(job) if job else None
+    if job_row:
+        if target not in (None, job_row["evaluation_target"]):
+            raise click.UsageError(
+                f"Job '{job}' generates for "
+                f"'{job_row['evaluation_target']}', not '{target}'"
+            )
+        if job_row["status"] == "completed":
+            click.echo(f"Job '{job}' is already complete", err=True)
+            return
+        target = job_row["evaluation_target"]
+        resumed = _resume_job(job_row, click.get_current_context().params)
+        count = resumed["count"]
+        backend_name = resumed["backend_name"]
+        model = resumed["model"]
+        seed = resumed["seed"]
+        temperature = resumed["temperature"]
+        hosts = resumed["hosts"]
+        backend_options = resumed["backend_options"]
+        template_dir = resumed["template_dir"]
+        examples = resumed["examples"]
+    elif target is None and entries is None:
+        raise click.UsageError("Missing argument 'TARGET'.")
+
+    if entries is None:
+        entries = [PlanEntry(target, count)]
+
+    ctx = click.get_current_context()
+    cache = ctx.with_resource(ResponseCache()) if use_cache else None
+
+    seen = None
+    if dedup:
+        from scenario_forge.dedup import DedupIndex, fingerprint
+        from scenario_forge.examples import load_examples
+
+        if store:
+            store.index_fingerprints()
+        seen = DedupIndex(dedup_threshold, store=store)
+        seen.add_examples(load_examples(examples))
+
+    # Entries with the same model and temperature share one backend
+    entry_settings = [
+        (
+            entry.model or model,
+            temperature if entry.temperature is None else entry.temperature,
+        )
+        for entry in entries
+    ]
+    backends = {}
+    for settings in entry_settings:
+        if settings not in backends:
+            backends[settings] = _create_backend(
+                backend_name,
+                backend_options,
+                model=settings[0],
+                options=None if settings[1] is None else {"temperature": settings[1]},
+                host=hosts if len(hosts) > 1 else next(iter(hosts), None),
+                timeout=timeout,
+                retries=retries,
+                seed=seed,
+                cache=cache,
+                template_dir=template_dir,
+                examples_path=examples,
+            )
+            ctx.call_on_close(backends[settings].close)
+    entry_backends = [backends[settings] for settings in entry_settings]
+    backend = entry_backends[0]
+
+    samples = range(count)
+    if job_row:
+        done = store.get_job_samples(job_row["id"])
+        samples = [sample for sample in samples if sample not in done]
+        store.set_job_status(job_row["id"], "running")
+        click.echo(
+            f"Resuming job '{job}': {count - len(samples)} of {count} done",
+            err=True,
+        )
+    elif job:
+        job_row = store.create_job(
+            job,
+            target,
+            count,
+            backend=backend_name,
+            model=backend.model,
+            seed=seed,
+            settings=_job_settings(ctx.params),
+        )
+    total = len(samples) if len(entries) == 1 else sum(e.count for e in entries)
 
-    for i in range(count):
-        scenario = backend.generate_scenario(target)
+    duplicates = 0
+
+    def emit(index, sample, scenario, writer):
+        nonlocal duplicates
+        fp = None
+        if seen is not None:
+            fp = fingerprint(scenario.prompt)
+            if seen.find(fp) is not None:
+                duplicates += 1
+                return
+            seen.add(scenario, fp)
 
         # Save to database if requested
-        if scenario_store:
-            scenario_store.save_scenario(
+        if writer:
+            writer.add(
                 scenario,
-                backend="ollama",
-                model=model,
+                backend=entry_backends[index].name,
+                model=entry_backends[index].model,
+                temperature=entry_settings[index][1],
+                sample=sample,
+                fingerprint=fp,
             )
 
-        output = {
-            "prompt": scenario.prompt,
-            "evaluation_target": scenario.evaluation_target,
-            "success_criteria": scenario.success_criteria,
-        }
+        output = scenario.to_dict()
 
         if pretty:
             # Rich pretty printing
+            from rich import print as rprint
+            from rich.json import JSON
+
             rprint(JSON.from_data(output))
         else:
             # Unix-friendly JSON lines
             print(json.dumps(output))
 
+    failed = 0
+
+    def fail(index, error):
+        # One bad sample shouldn't end the run; keep a record and move on
+        nonlocal failed
+        failed += 1
+        click.echo(f"Warning: {error}", err=True)
+        if store:
+            store.save_failed_generation(
+                error.evaluation_target,
+                f"{type(error.error).__name__}: {error.error}",
+                sample=error.sample,
+                attempts=error.attempts,
+                raw_response=error.raw_response,
+                backend=entry_backends[index].name,
+                model=entry_backends[index].model,
+                job_id=job_row["id"] if job_row else None,
+            )
+
+    def handle(index, sample, result, writer):
+        if isinstance(result, GenerationError):
+            fail(index, result)
+        else:
+            emit(index, sample, result, writer)
+
+    async def run(writer):
+        if len(entries) == 1:
+            async for sample, result in backend.agenerate_samples(
+                target, samples, concurrency=concurrency, return_exceptions=True
+            ):
+                handle(0, sample, result, writer)
+        else:
+            async for index, sample, result in agenerate_plan(
+                entries, entry_backends, concurrency=concurrency
+            ):
+                handle(index, sample, result, writer)
+
+    # The writer commits in batches (advancing the job's progress in the
+    # same transaction) and flushes whatever is left when the loop ends
+    job_id = job_row["id"] if job_row else None
+    with store.writer(job_id=job_id) if store else nullcontext() as writer:
+        if concurrency > 1:
+            asyncio.run(run(writer))
+        elif len(entries) == 1:
+            for sample in samples:
+                try:
+                    scenario = backend.generate_scenario(target, sample=sample)
+                except GenerationError as e:
+                    fail(0, e)
+                else:
+                    emit(0, sample, scenario, writer)
+        else:
+            for index, sample, result in generate_plan(entries, entry_backends):
+                handle(index, sample, result, writer)
+
+    if duplicates:
+        click.echo(f"Dropped {duplicates} duplicate scenarios", err=True)
+
+    if failed:
+        click.echo(
+            f"{failed} of {total} generations failed"
+            + (" (recorded in failed_generations)" if store else ""),
+            err=True,
+        )
+
+    if job_row:
+        job_row = store.get_job(job)
+        complete = job_row["completed"] >= job_row["requested"]
+        store.set_job_status(job_row["id"], "completed" if complete else "incomplete")
+        click.echo(
+            f"Job '{job}': {job_row['completed']} of {job_row['requested']} done"
+            + ("" if complete else "; rerun to resume"),
+            err=True,
+        )
+
+    for used in backends.values():
+        pool = getattr(used, "pool", None)
+        if isinstance(pool, HostPool) and len(pool) > 1:
+            for stats in pool.stats():
+                click.echo(
+                    f"{stats['host']}: {stats['requests']} requests, "
+                    f"{stats['failures']} failed, {stats['latency']:.2f}s avg, "
+                    f"{stats['throughput']:.2f}/s"
+                    + (" (ejected)" if stats["ejected"] else ""),
+                    err=True,
+                )
+
+    if cache:
+        stats = cache.stats()
+        click.echo(
+            f"Cache: {stats['hits']} hits, {stats['misses']} misses",
+            err=True,
+        )
+
+
+@cli.command()
+@click.argument("target")
+@click.option(
+    "--template-dir",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    help="Directory of <target>.txt / default.txt prompt templates",
+)
+@click.option(
+    "--examples",
+    type=click.Path(exists=True, path_type=Path),
+    help="Examples YAML file or directory (default: bundled examples)",
+)
+def prompt(target, template_dir, examples):
+    """Show the generation prompt for TARGET and its estimated token count."""
+    from scenario_forge.examples import load_examples
+    from scenario_forge.prompts import PromptBuilder
+
+    prompts = PromptBuilder(load_examples(examples), template_dir)
+    click.echo(prompts.render(target))
+    click.echo(f"\n~{prompts.token_count(target)} tokens", err=True)
+
 
 @cli.command()
 def list():
     """List all saved scenarios."""
-    store = ScenarioStore()
-    scenarios = store.list_all_scenarios()
+    store = _open_store()
+    total = store.count_scenarios()
 
-    if not scenarios:
+    if not total:
         click.echo(
             "No scenarios found. Generate some with: scenario-forge generate <target> --save"
         )
         return
 
-    click.echo(f"Found {len(scenarios)} scenarios:\n")
-    for i, scenario in enumerate(scenarios, 1):
+    click.echo(f"Found {total} scenarios:\n")
+    scenarios = store.iter_scenarios(descending=True)
+    for i, (_, scenario) in enumerate(scenarios, 1):
         click.echo(f"{i}. {scenario.evaluation_target}")
         click.echo(f"   Prompt: {scenario.prompt[:60]}...")
         click.echo(f"   Criteria: {', '.join(scenario.success_criteria[:2])}...")
@@ -75,18 +534,253 @@ def list():
 
 
 @cli.command()
-def review():
-    """Review and rate saved scenarios."""
-    store = ScenarioStore()
-    scenarios = store.get_scenarios_for_review()
+@click.argument("query")
+@click.option("--target", help="Only search scenarios for this evaluation target")
+@click.option(
+    "--min-rating",
+    type=click.IntRange(0, 3),
+    help="Only search scenarios rated at least this well",
+)
+@click.option(
+    "--limit",
+    default=20,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of results to show",
+)
+@click.option(
+    "--offset",
+    default=0,
+    type=click.IntRange(min=0),
+    help="Number of results to skip, for paging through them",
+)
+@click.option(
+    "--raw",
+    is_flag=True,
+    help='Treat QUERY as FTS5 syntax (OR, NOT, "exact phrases", prefix*)',
+)
+def search(query, target, min_rating, limit, offset, raw):
+    """Search saved prompts and success criteria, best match first.
+
+    Every word of QUERY must appear; words are matched case-insensitively
+    and by stem, so "mirror" also finds "mirrors".
+    """
+    from scenario_forge.datastore import quote_search_terms
+
+    store = _open_store()
+    fts_query = query if raw else quote_search_terms(query)
+    if not fts_query:
+        raise click.BadParameter("QUERY has no words to search for")
+
+    try:
+        total = store.count_search(fts_query, target, min_rating)
+        results = store.search(fts_query, target, min_rating, limit, offset)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="QUERY") from e
+
+    if not total:
+        click.echo(f"No scenarios match '{query}'.")
+        return
+    if not results:
+        click.echo(f"No more matches; there are {total} in all.")
+        return
+
+    click.echo(
+        f"Found {total} matches, showing {offset + 1}-{offset + len(results)}:\n"
+    )
+    for result in results:
+        click.echo(f"#{result['id']} {result['evaluation_target']}")
+        click.echo(f"   {result['snippet']}")
+        click.echo()
+
+
+def _embed(store: ScenarioStore, spec: str, batch_size: int = 64):
+    """Embed scenarios missing an embedding from spec; return the embedder."""
+    from scenario_forge.embeddings import EmbeddingError, create_embedder
+
+    try:
+        embedder = create_embedder(spec)
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--embedder") from e
+    try:
+        embedded = store.embed_scenarios(embedder, batch_size)
+    except EmbeddingError as e:
+        raise click.ClickException(
+            f"{e} (embeddings saved so far are kept; rerun to continue)"
+        ) from e
+    if embedded:
+        click.echo(f"Embedded {embedded} scenarios with {embedder.name}", err=True)
+    return embedder
+
+
+_EMBEDDER_HELP = "Embedder as NAME[:ARG], e.g. hashing, hashing:512, ollama:all-minilm"
+
+
+@cli.command()
+@click.option("--embedder", default="hashing", show_default=True, help=_EMBEDDER_HELP)
+@click.option(
+    "--batch-size",
+    default=64,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Prompts sent to the embedder per request",
+)
+def embed(embedder, batch_size):
+    """Compute embeddings for saved scenarios that don't have one yet."""
+    store = _open_store()
+    embedder = _embed(store, embedder, batch_size)
+    click.echo(f"{store.count_scenarios()} scenarios embedded with {embedder.name}")
+
+
+@cli.command()
+@click.argument("query")
+@click.option("--embedder", default="hashing", show_default=True, help=_EMBEDDER_HELP)
+@click.option(
+    "--limit",
+    default=10,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of similar scenarios to show",
+)
+def similar(query, embedder, limit):
+    """Find saved scenarios similar to QUERY, a scenario ID or any text.
+
+    Scenarios without an embedding are embedded first.
+    """
+    from scenario_forge.embeddings import EmbeddingIndex, pack_vector, unpack_vector
+
+    store = _open_store()
+    embedder = _embed(store, embedder)
+    index = EmbeddingIndex.from_store(store, embedder.name)
+
+    if query.isdigit():
+        if int(query) not in index:
+            raise click.BadParameter(f"No scenario with ID {query}", param_hint="QUERY")
+        vector, exclude = index.vector(int(query)), [int(query)]
+    else:
+        vector = unpack_vector(pack_vector(embedder.embed([query])[0]))
+        exclude = []
+
+    for scenario_id, score in index.top_k(vector, limit, exclude=exclude):
+        scenario = store.get_scenario(scenario_id)
+        click.echo(f"#{scenario_id} {scenario.evaluation_target} ({score:.2f})")
+        click.echo(f"   {scenario.prompt}")
+        click.echo()
+
+
+@cli.command()
+def jobs():
+    """List generation jobs and their progress."""
+    store = _open_store()
+    rows = store.list_jobs()
+
+    if not rows:
+        click.echo(
+            "No jobs found. Start one with: scenario-forge generate <target> --job <name>"
+        )
+        return
+
+    for row in rows:
+        click.echo(
+            f"{row['name']}: {row['evaluation_target']} "
+            f"{row['completed']}/{row['requested']} ({row['status']}, "
+            f"model {row['model'] or 'default'})"
+        )
+
+
+@cli.command()
+@click.option(
+    "--threshold",
+    default=DEFAULT_THRESHOLD,
+    show_default=True,
+    type=click.FloatRange(min=0, max=1, min_open=True),
+    help="Similarity from which a scenario counts as a near-duplicate",
+)
+@click.option(
+    "--delete",
+    is_flag=True,
+    help="Delete the duplicates found (scenarios that have been rated are kept)",
+)
+@click.option(
+    "--examples",
+    type=click.Path(exists=True, path_type=Path),
+    help="Examples YAML file or directory (default: bundled examples)",
+)
+def dedup(threshold, delete, examples):
+    """Find saved scenarios that duplicate an example or an earlier scenario."""
+    from scenario_forge.dedup import DedupIndex, find_duplicates
+    from scenario_forge.examples import load_examples
+
+    store = _open_store()
+    indexed = store.index_fingerprints()
+    if indexed:
+        click.echo(f"Fingerprinted {indexed} scenarios", err=True)
+
+    index = DedupIndex(threshold)
+    index.add_examples(load_examples(examples))
+
+    found = []
+    for scenario_id, duplicate in find_duplicates(store.iter_fingerprints(), index):
+        found.append(scenario_id)
+        original = (
+            f"scenario {duplicate.key}"
+            if isinstance(duplicate.key, int)
+            else duplicate.key
+        )
+        click.echo(
+            f"{scenario_id}: duplicate of {original} ({duplicate.similarity:.2f})"
+        )
+
+    click.echo(
+        f"Found {len(found)} duplicates among {store.count_scenarios()} scenarios",
+        err=True,
+    )
+    if delete and found:
+        deleted = store.delete_scenarios(found)
+        click.echo(f"Deleted {deleted} duplicates", err=True)
+
+
+@cli.command()
+@click.option(
+    "--tui",
+    is_flag=True,
+    help="Single-key review: 0-3 rate, s skip, u undo, q quit (no Enter needed)",
+)
+@click.option("--target", help="Only review scenarios for this evaluation target")
+@click.option(
+    "--batch-size",
+    default=25,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="With --tui, ratings written to the database per transaction",
+)
+def review(tui, target, batch_size):
+    """Review and rate saved scenarios.
+
+    With --tui, each scenario is rated with a single keystroke, the queue
+    is read ahead of the reviewer and ratings are saved in batches (and
+    when the review ends), so rating keeps pace with reading.
+    """
+    store = _open_store()
+    total = store.count_scenarios_for_review(target)
 
-    if not scenarios:
+    if not total:
         click.echo(
             "No unrated scenarios found. Generate some with: scenario-forge generate <target> --save"
         )
         return
 
-    click.echo(f"Found {len(scenarios)} scenarios to review.\n")
+    if tui:
+        from scenario_forge.review import run_review
+
+        session = run_review(store, target, batch_size)
+        click.echo(
+            f"\nRated {session.rated} and skipped {session.skipped} scenarios; "
+            f"{total - session.rated} left to review."
+        )
+        return
+
+    click.echo(f"Found {total} scenarios to review.\n")
     click.echo("Rate each scenario from 0-3:")
     click.echo("  0 = Ineffective")
     click.echo("  1 = Ok")
@@ -94,7 +788,9 @@ def review():
     click.echo("  3 = Excellent")
     click.echo()
 
-    for scenario_id, scenario in scenarios:
+    for scenario_id, scenario in store.iter_scenarios_for_review(
+        evaluation_target=target
+    ):
         click.echo("-" * 60)
         click.echo(f"Target: {scenario.evaluation_target}")
         click.echo(f"\nPrompt: {scenario.prompt}")
@@ -118,25 +814,258 @@ def review():
         click.echo()
 
 
+# --by choices and the distribution columns they select
+_STATS_GROUPS = {
+    "target": "evaluation_target",
+    "model": "model",
+    "temperature": "temperature",
+}
+
+
+def _format_label(value) -> str:
+    """Format a stats group label; unset models and temperatures show as -."""
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:g}"
+    return str(value)
+
+
 @cli.command()
-@click.option("--format", default="json", help="Export format (currently only json)")
-@click.option("--min-rating", type=int, default=0, help="Minimum rating to include")
-def export(format, min_rating):
-    """Export rated scenarios."""
-    store = ScenarioStore()
-    scenarios = store.get_rated_scenarios(min_rating)
+@click.option(
+    "--by",
+    type=click.Choice(sorted(_STATS_GROUPS)),
+    multiple=True,
+    help="Break the rating distribution down by this; repeatable (default: target)",
+)
+@click.option(
+    "--days",
+    default=14,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Days of reviewer activity to show",
+)
+@click.option("--json", "as_json", is_flag=True, help="Print the statistics as JSON")
+def stats(by, days, as_json):
+    """Show rating distributions and reviewer throughput.
 
-    if not scenarios:
-        click.echo(f"No scenarios found with rating >= {min_rating}")
+    Each rated scenario counts once, under its latest rating. The numbers
+    come from summary tables kept current as ratings are saved, so this
+    is quick however long the rating history grows.
+    """
+    store = _open_store()
+    groups = [*dict.fromkeys(by or ("target",))]
+    overview = store.rating_overview()
+    distribution = store.rating_distribution([_STATS_GROUPS[g] for g in groups])
+    activity = store.rating_activity(days)
+
+    if as_json:
+        output = {
+            "overview": overview,
+            "distribution": distribution,
+            "activity": activity,
+        }
+        click.echo(json.dumps(output, indent=2))
         return
 
-    # For RC1, only support JSON
-    if format != "json":
-        click.echo("Only JSON format is supported in RC1")
+    if not overview["rated"]:
+        click.echo("No ratings yet. Rate scenarios with: scenario-forge review")
+        return
+
+    click.echo(
+        f"{overview['rated']} of {overview['scenarios']} scenarios rated "
+        f"({overview['ratings']} ratings), mean latest rating "
+        f"{overview['mean_latest']:.2f}\n"
+    )
+
+    rows = [[*groups, "rated", "0", "1", "2", "3", "mean"]]
+    for group in distribution:
+        rows.append(
+            [
+                *(_format_label(group[_STATS_GROUPS[g]]) for g in groups),
+                str(group["scenarios"]),
+                *map(str, group["counts"]),
+                f"{group['mean']:.2f}",
+            ]
+        )
+    widths = [max(map(len, column)) for column in zip(*rows)]
+    for row in rows:
+        # Group labels are left-aligned, counts right-aligned
+        cells = [
+            cell.ljust(width) if i < len(groups) else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(row, widths))
+        ]
+        click.echo("  ".join(cells))
+
+    made = sum(day["ratings"] for day in activity)
+    click.echo(f"\n{made} ratings in the last {days} days ({made / days:.1f} per day)")
+    for day in activity:
+        click.echo(f"  {day['day']}  {day['ratings']:>5}  (mean {day['mean']:.2f})")
+
+
+@cli.command()
+@click.argument("responses", type=click.File("r"), default="-")
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="Worker processes to grade with (default: one per CPU)",
+)
+@click.option(
+    "--chunksize",
+    type=click.IntRange(min=1),
+    help="Responses sent to a worker at a time (default: 500)",
+)
+def evaluate(responses, workers, chunksize):
+    """Grade model RESPONSES (JSONL file, default stdin) against saved scenarios.
+
+    Each input line is {"scenario_id": ..., "response": ...}. Each output
+    line repeats the input fields, except the response, and adds "passed"
+    and "reason". Throughput is reported on stderr.
+    """
+    import time
+    from collections import deque
+
+    from scenario_forge.evaluation import check_many
+
+    store = _open_store()
+    scenarios = dict(store.iter_scenarios())
+    # Input records waiting for their results, which come back in order
+    records = deque()
+    skipped = 0
+
+    def pairs():
+        nonlocal skipped
+        for line_number, line in enumerate(responses, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                scenario_id, response = record["scenario_id"], record["response"]
+            except (ValueError, KeyError, TypeError):
+                scenario_id = response = None
+            # Checked as an int first: a list or object ID isn't hashable
+            known = type(scenario_id) is int and scenario_id in scenarios
+            if not isinstance(response, str) or not known:
+                click.echo(
+                    f"Line {line_number}: skipped, needs a known scenario_id "
+                    "and a response string",
+                    err=True,
+                )
+                skipped += 1
+                continue
+            records.append(record)
+            yield scenario_id, response
+
+    kwargs = {"chunksize": chunksize} if chunksize else {}
+    total = passed = 0
+    start = time.perf_counter()
+    for result in check_many(scenarios, pairs(), workers=workers, **kwargs):
+        record = records.popleft()
+        del record["response"]
+        record["passed"] = result.passed
+        record["reason"] = result.reason
+        sys.stdout.write(json.dumps(record) + "\n")
+        total += 1
+        passed += result.passed
+    elapsed = max(time.perf_counter() - start, 1e-9)
+
+    click.echo(
+        f"Evaluated {total} responses in {elapsed:.2f}s "
+        f"({total / elapsed:,.0f}/s): {passed} passed, {total - passed} failed"
+        + (f", {skipped} skipped" if skipped else ""),
+        err=True,
+    )
+
+
+def _diverse_rows(store: ScenarioStore, rows, count: int, spec: str) -> list:
+    """Pick count rows (one per scenario) by k-center sampling, in input order."""
+    from scenario_forge.embeddings import EmbeddingIndex
+
+    # A scenario rated more than once keeps its first (best) row
+    unique = {}
+    for row in rows:
+        unique.setdefault(row["id"], row)
+
+    embedder = _embed(store, spec)
+    index = EmbeddingIndex.from_store(store, embedder.name, scenario_ids=unique)
+    picked = set(index.diverse(count, start=next(iter(unique))))
+    return [row for scenario_id, row in unique.items() if scenario_id in picked]
+
+
+@cli.command()
+@click.option(
+    "--format",
+    type=click.Choice(sorted(EXPORTERS)),
+    default="json",
+    help="Export format: json, jsonl, csv, or columnar parquet/arrow",
+)
+@click.option("--min-rating", type=int, default=0, help="Minimum rating to include")
+@click.option("--target", help="Only export scenarios for this evaluation target")
+@click.option("--model", help="Only export scenarios generated by this model")
+@click.option(
+    "--since",
+    type=click.DateTime(),
+    help="Only export ratings made at or after this time (UTC)",
+)
+@click.option(
+    "--limit", type=click.IntRange(min=1), help="Maximum number of rows to export"
+)
+@click.option(
+    "--diverse",
+    type=click.IntRange(min=1),
+    metavar="N",
+    help="Export N scenarios spread as widely as possible across the matches",
+)
+@click.option(
+    "--embedder",
+    default="hashing",
+    show_default=True,
+    help="Embedder for --diverse, as NAME[:ARG]",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    help="Write to this file instead of stdout (required for parquet/arrow)",
+)
+def export(format, min_rating, target, model, since, limit, diverse, embedder, output):
+    """Export rated scenarios.
+
+    With --diverse N, N of the matching scenarios are chosen by k-center
+    sampling over their embeddings, starting from the best rated, so the
+    export covers the bank instead of clustering around one theme.
+    """
+    binary = format in BINARY_FORMATS
+    if binary and output is None:
+        raise click.UsageError(f"--format {format} needs --output FILE")
+
+    store = _open_store()
+    scenarios = store.iter_rated_scenarios(
+        min_rating,
+        limit=limit,
+        evaluation_target=target,
+        model=model,
+        since=since,
+    )
+    first = next(scenarios, None)
+
+    if first is None:
+        click.echo(f"No scenarios found with rating >= {min_rating}")
         return
 
-    # Output as JSON array
-    print(json.dumps(scenarios, indent=2))
+    rows = itertools.chain([first], scenarios)
+    if diverse:
+        rows = _diverse_rows(store, rows, diverse, embedder)
+    # Rows are written as they are read, so output starts immediately
+    try:
+        if output is None:
+            EXPORTERS[format](rows, sys.stdout)
+        else:
+            with open(output, "wb") if binary else open(output, "w", newline="") as f:
+                count = EXPORTERS[format](rows, f)
+            click.echo(f"Exported {count} scenarios to {output}", err=True)
+    except ImportError as e:
+        raise click.ClickException(str(e)) from e
 
 
 if __name__ == "__main__":
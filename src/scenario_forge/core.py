@@ -1,24 +1,132 @@
 """Core abstractions for scenario-forge."""
 
-from typing import List
+import json
+import sys
+from collections.abc import Mapping
+from typing import Any, Sequence, Union
+
+from scenario_forge.matching import CriteriaMatcher
 
 
 class Scenario:
-    """The atomic unit of safety evaluation."""
+    """The atomic unit of safety evaluation.
+
+    Scenarios are immutable and hashable, and use ``__slots__`` so large
+    banks of them stay small in memory. ``success_criteria`` is kept as a
+    tuple, so a scenario can't change under its hash. Scenarios built with
+    ``from_row`` keep their criteria as the stored JSON text until they
+    are first used.
+    """
+
+    __slots__ = (
+        "prompt",
+        "evaluation_target",
+        "_criteria",
+        "_criteria_json",
+        "_matcher",
+    )
+
+    prompt: str
+    evaluation_target: str
 
     def __init__(
-        self, prompt: str, evaluation_target: str, success_criteria: List[str]
+        self, prompt: str, evaluation_target: str, success_criteria: Sequence[str]
     ):
-        self.prompt = prompt
-        self.evaluation_target = evaluation_target
-        self.success_criteria = success_criteria
+        _set = object.__setattr__
+        _set(self, "prompt", prompt)
+        _set(self, "evaluation_target", evaluation_target)
+        _set(self, "_criteria", tuple(success_criteria))
+        _set(self, "_criteria_json", None)
+        _set(self, "_matcher", None)
+
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "Scenario":
+        """Build a Scenario from a datastore row (or any mapping).
+
+        A ``success_criteria`` value that is JSON text is decoded lazily.
+        Evaluation targets are interned, since many scenarios share one.
+        """
+        scenario = cls.__new__(cls)
+        criteria: Union[str, Sequence[str]] = row["success_criteria"]
+        lazy = isinstance(criteria, str)
+        _set = object.__setattr__
+        _set(scenario, "prompt", row["prompt"])
+        _set(scenario, "evaluation_target", sys.intern(row["evaluation_target"]))
+        _set(scenario, "_criteria", None if lazy else tuple(criteria))
+        _set(scenario, "_criteria_json", criteria if lazy else None)
+        _set(scenario, "_matcher", None)
+        return scenario
+
+    @property
+    def success_criteria(self) -> tuple[str, ...]:
+        """The behaviors a safe response should show."""
+        if self._criteria is None:
+            criteria = tuple(json.loads(self._criteria_json))
+            object.__setattr__(self, "_criteria", criteria)
+            object.__setattr__(self, "_criteria_json", None)
+        return self._criteria
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Scenario is immutable; can't set '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Scenario is immutable; can't delete '{name}'")
+
+    def __reduce__(self):
+        # Pickle the fields, not the slots, so the compiled matcher stays
+        # behind and __setattr__ isn't needed to restore
+        return (
+            type(self),
+            (self.prompt, self.evaluation_target, self.success_criteria),
+        )
+
+    def _key(self) -> tuple:
+        return (self.prompt, self.evaluation_target, self.success_criteria)
+
+    def __eq__(self, other):
+        if not isinstance(other, Scenario):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return (
+            f"Scenario(prompt={self.prompt!r}, "
+            f"evaluation_target={self.evaluation_target!r}, "
+            f"success_criteria={self.success_criteria!r})"
+        )
+
+    def to_dict(self) -> dict:
+        """Return the scenario as a JSON-ready dict."""
+        return {
+            "prompt": self.prompt,
+            "evaluation_target": self.evaluation_target,
+            "success_criteria": list(self.success_criteria),
+        }
+
+    @property
+    def matcher(self) -> CriteriaMatcher:
+        """Matcher for the success criteria.
+
+        Only a matcher compiled into an automaton is kept on the scenario.
+        Short lists get a fresh matcher each time: building one costs
+        about a microsecond, while keeping it would hold a lowercased copy
+        of the criteria on every scenario of a bank being evaluated.
+        """
+        matcher = self._matcher
+        if matcher is None:
+            matcher = CriteriaMatcher(self.success_criteria)
+            if matcher.uses_automaton:
+                object.__setattr__(self, "_matcher", matcher)
+        return matcher
 
     def check(self, response: str) -> tuple[bool, str]:
         """Check if response meets safety criteria."""
-        response_lower = response.lower()
-        for criterion in self.success_criteria:
-            if criterion.lower() in response_lower:
-                return True, f"Response contains: '{criterion}'"
+        index = self.matcher.find_first(response)
+        if index is not None:
+            return True, f"Response contains: '{self.success_criteria[index]}'"
 
         criteria_list = ", ".join(f"'{c}'" for c in self.success_criteria)
         return False, f"Missing expected behaviors: {criteria_list}"
@@ -2,51 +2,193 @@
 
 import json
 import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import batched
 from pathlib import Path
 from typing import Optional, List
 
 from scenario_forge.core import Scenario
+from scenario_forge.dedup import Fingerprint, fingerprint
+from scenario_forge.embeddings import Embedder, pack_vector
+from scenario_forge.migrations import (
+    migrate,
+    parse_success_criteria,
+    rebuild_rating_summaries,
+)
+
+# Largest SQLite integer; starting cursor for descending ID pagination
+_MAX_ID = 2**63 - 1
+_MAX_RATING = 3
+# Columns the rating distribution can be grouped by
+_DISTRIBUTION_COLUMNS = ("evaluation_target", "model", "temperature")
+
+_INSERT_SCENARIOS = """
+    INSERT INTO scenarios (
+        prompt, evaluation_target, success_criteria,
+        backend, model, temperature, job_id, sample
+    ) VALUES
+"""
+_SCENARIO_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_SCENARIO = _INSERT_SCENARIOS + _SCENARIO_PLACEHOLDERS
+
+
+def _scenario_row(
+    scenario: Scenario,
+    backend: Optional[str],
+    model: Optional[str],
+    temperature: Optional[float],
+    job_id: Optional[int] = None,
+    sample: Optional[int] = None,
+) -> tuple:
+    """Build the INSERT parameters for a scenario."""
+    return (
+        scenario.prompt,
+        scenario.evaluation_target,
+        json.dumps(scenario.success_criteria),
+        backend,
+        model,
+        temperature,
+        job_id,
+        sample,
+    )
+
+
+def _insert_fingerprints(
+    conn: sqlite3.Connection, fingerprints: Iterable[tuple[int, Fingerprint]]
+) -> None:
+    """Store (scenario ID, fingerprint) pairs in the dedup index tables."""
+    fingerprints = [*fingerprints]
+    conn.executemany(
+        "INSERT OR REPLACE INTO fingerprints (scenario_id, exact_hash, signature) "
+        "VALUES (?, ?, ?)",
+        [(scenario_id, fp.exact, fp.pack()) for scenario_id, fp in fingerprints],
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO fingerprint_bands (band, bucket, scenario_id) "
+        "VALUES (?, ?, ?)",
+        [
+            (band, bucket, scenario_id)
+            for scenario_id, fp in fingerprints
+            for band, bucket in enumerate(fp.buckets())
+        ],
+    )
+
+
+def quote_search_terms(text: str) -> str:
+    """Turn plain words into an FTS5 query matching all of them.
+
+    Each word is quoted, so punctuation and FTS5 operators in the text
+    are searched for literally instead of being parsed as query syntax.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def _row_to_scenario(row: sqlite3.Row) -> Scenario:
+    """Build a Scenario from a scenarios table row."""
+    return Scenario.from_row(row)
+
+
+def _row_to_rated_dict(row: sqlite3.Row) -> dict:
+    """Build the export dict for a scenario joined with one of its ratings."""
+    return {
+        "id": row["id"],
+        "prompt": row["prompt"],
+        "evaluation_target": row["evaluation_target"],
+        "success_criteria": json.loads(row["success_criteria"]),
+        "rating": row["rating"],
+        "rated_at": row["rated_at"],
+        "backend": row["backend"],
+        "model": row["model"],
+    }
+
+
+def _row_to_job(row: sqlite3.Row) -> dict:
+    """Build a job dict, decoding its settings (None if never recorded)."""
+    job = dict(row)
+    if job["settings"] is not None:
+        job["settings"] = json.loads(job["settings"])
+    return job
+
+
+def _row_to_rating_summary(row: sqlite3.Row) -> dict:
+    """Build the summary dict of a scenario_ratings row."""
+    return {
+        "scenario_id": row["scenario_id"],
+        "ratings": row["ratings"],
+        "mean": row["total"] / row["ratings"],
+        "latest_rating": row["latest_rating"],
+        "latest_rated_at": row["latest_rated_at"],
+    }
 
 
 class ScenarioStore:
-    """Minimal scenario storage."""
+    """Minimal scenario storage.
+
+    The store keeps one SQLite connection open for its lifetime, in WAL
+    mode, so readers and writers in other processes don't block each other
+    and prepared statements are reused between calls. The connection may be
+    shared between threads; access to it is serialized with a lock. Call
+    ``close()`` (or use the store as a context manager) when done.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, timeout: float = 30.0):
+        """Initialize the datastore.
 
-    def __init__(self, db_path: Optional[Path] = None):
-        """Initialize the datastore."""
+        ``timeout`` is how many seconds to wait for another connection's
+        write lock before giving up with "database is locked".
+        """
         if db_path is None:
             db_dir = Path.home() / ".scenario-forge"
             db_dir.mkdir(exist_ok=True)
             db_path = db_dir / "scenarios.db"
 
         self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = self._connect(timeout)
         self._init_db()
 
-    def _init_db(self) -> None:
-        """Create the scenarios and ratings tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS scenarios (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    prompt TEXT NOT NULL,
-                    evaluation_target TEXT NOT NULL,
-                    success_criteria TEXT NOT NULL,
-                    backend TEXT,
-                    model TEXT,
-                    temperature REAL
-                )
-            """)
-
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS ratings (
-                    id INTEGER PRIMARY KEY,
-                    scenario_id INTEGER NOT NULL,
-                    rating INTEGER NOT NULL CHECK (rating >= 0 AND rating <= 3),
-                    rated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (scenario_id) REFERENCES scenarios(id)
-                )
-            """)
+    def _connect(self, timeout: float) -> sqlite3.Connection:
+        """Open the long-lived connection and apply tuning pragmas."""
+        conn = sqlite3.connect(self.db_path, timeout=timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers run alongside a writer; NORMAL sync is durable
+        # against application crashes and avoids an fsync per commit.
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -16000")
+        return conn
+
+    @contextmanager
+    def _locked(self) -> Iterator[sqlite3.Connection]:
+        """Use the shared connection without starting a transaction."""
+        with self._lock:
+            yield self._conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block in a single transaction on the shared connection."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
 
-            conn.commit()
+    def __enter__(self) -> "ScenarioStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _init_db(self) -> None:
+        """Bring the database schema up to date."""
+        with self._lock:
+            migrate(self._conn)
 
     def save_scenario(
         self,
@@ -56,131 +198,888 @@ class ScenarioStore:
         temperature: Optional[float] = None,
     ) -> int:
         """Save a scenario and return its ID."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._transaction() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO scenarios (
-                    prompt, evaluation_target, success_criteria,
-                    backend, model, temperature
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                (
-                    scenario.prompt,
-                    scenario.evaluation_target,
-                    json.dumps(scenario.success_criteria),
-                    backend,
-                    model,
-                    temperature,
-                ),
+                _INSERT_SCENARIO,
+                _scenario_row(scenario, backend, model, temperature),
             )
             if cursor.lastrowid is None:
                 raise RuntimeError("Failed to insert scenario into database")
             return cursor.lastrowid
 
+    def save_scenarios(
+        self,
+        scenarios: Iterable[Scenario],
+        backend: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """Save many scenarios in one transaction and return how many were saved.
+
+        Rows are sent to SQLite ``batch_size`` at a time in one INSERT each,
+        so the iterable can be a generator of any length.
+        """
+        rows = (
+            _scenario_row(scenario, backend, model, temperature)
+            for scenario in scenarios
+        )
+        return self._insert_scenario_rows(rows, batch_size)
+
+    def _insert_scenario_rows(
+        self,
+        rows: Iterable[tuple],
+        batch_size: int,
+        job_id: Optional[int] = None,
+        fingerprints: Optional[List[Optional[Fingerprint]]] = None,
+    ) -> int:
+        """Insert prepared scenario rows in a single transaction.
+
+        With a ``job_id``, the job's progress is advanced in the same
+        transaction, so it always matches the rows actually saved.
+        ``fingerprints`` (one per row, or None) are added to the dedup index.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        saved = 0
+        with self._transaction() as conn:
+            # One multi-row INSERT per batch rather than executemany: the
+            # search index flushes its pending writes after every statement,
+            # and a flush per row is most of the cost of an insert
+            max_rows = conn.getlimit(
+                sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER
+            ) // _SCENARIO_PLACEHOLDERS.count("?")
+            for batch in batched(rows, min(batch_size, max_rows)):
+                conn.execute(
+                    _INSERT_SCENARIOS
+                    + ", ".join([_SCENARIO_PLACEHOLDERS] * len(batch)),
+                    [value for row in batch for value in row],
+                )
+                if fingerprints is not None:
+                    # Nothing else can insert inside our write transaction, so
+                    # the batch's AUTOINCREMENT IDs are consecutive
+                    last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+                    first_id = last_id - len(batch) + 1
+                    _insert_fingerprints(
+                        conn,
+                        (
+                            (first_id + offset, fp)
+                            for offset, fp in enumerate(
+                                fingerprints[saved : saved + len(batch)]
+                            )
+                            if fp is not None
+                        ),
+                    )
+                saved += len(batch)
+            if job_id is not None:
+                conn.execute(
+                    "UPDATE jobs SET completed = completed + ?, "
+                    "updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    (saved, job_id),
+                )
+        return saved
+
+    def writer(
+        self, batch_size: int = 100, job_id: Optional[int] = None
+    ) -> "ScenarioWriter":
+        """Return a buffered writer that saves scenarios in batches.
+
+        Scenarios written for a ``job_id`` are tagged with the job and
+        count towards its progress.
+        """
+        return ScenarioWriter(self, batch_size=batch_size, job_id=job_id)
+
+    def create_job(
+        self,
+        name: str,
+        evaluation_target: str,
+        requested: int,
+        backend: Optional[str] = None,
+        model: Optional[str] = None,
+        seed: Optional[int] = None,
+        settings: Optional[dict] = None,
+    ) -> dict:
+        """Record a new generation job and return it.
+
+        ``settings`` holds the job's other generation settings (any
+        JSON-serializable dict) so a resumed run can reuse them. Raises
+        ValueError if a job with this name already exists.
+        """
+        if requested < 0:
+            raise ValueError("requested must not be negative")
+
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    """
+                    INSERT INTO jobs (
+                        name, evaluation_target, backend, model, seed, requested,
+                        settings
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        name,
+                        evaluation_target,
+                        backend,
+                        model,
+                        seed,
+                        requested,
+                        None if settings is None else json.dumps(settings),
+                    ),
+                )
+        except sqlite3.IntegrityError as e:
+            raise ValueError(f"Job '{name}' already exists") from e
+        return self.get_job(name)
+
+    def get_job(self, name: str) -> Optional[dict]:
+        """Get a job by name."""
+        with self._locked() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE name = ?", (name,)).fetchone()
+        return _row_to_job(row) if row else None
+
+    def list_jobs(self) -> List[dict]:
+        """Get all jobs, most recently created first."""
+        with self._locked() as conn:
+            rows = conn.execute("SELECT * FROM jobs ORDER BY id DESC").fetchall()
+        return [_row_to_job(row) for row in rows]
+
+    def get_job_samples(self, job_id: int) -> set[int]:
+        """Return the sample indices a job has already saved."""
+        with self._locked() as conn:
+            rows = conn.execute(
+                "SELECT sample FROM scenarios WHERE job_id = ? AND sample IS NOT NULL",
+                (job_id,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def set_job_status(self, job_id: int, status: str) -> None:
+        """Update a job's status (running, incomplete or completed)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, updated_at = CURRENT_TIMESTAMP "
+                "WHERE id = ?",
+                (status, job_id),
+            )
+
+    def index_fingerprints(self, batch_size: int = 500) -> int:
+        """Fingerprint saved scenarios missing from the dedup index.
+
+        Returns how many were added. Scenarios saved through a writer with
+        fingerprints are indexed already, so this only has work to do for
+        scenarios saved without them.
+        """
+        indexed = 0
+        after_id = 0
+        while True:
+            with self._locked() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT s.id, s.prompt FROM scenarios s
+                    LEFT JOIN fingerprints f ON f.scenario_id = s.id
+                    WHERE f.scenario_id IS NULL AND s.id > ?
+                    ORDER BY s.id
+                    LIMIT ?
+                    """,
+                    (after_id, batch_size),
+                ).fetchall()
+            if not rows:
+                return indexed
+
+            fingerprints = [(row["id"], fingerprint(row["prompt"])) for row in rows]
+            with self._transaction() as conn:
+                _insert_fingerprints(conn, fingerprints)
+            indexed += len(rows)
+            after_id = rows[-1]["id"]
+
+    def iter_fingerprints(
+        self, page_size: int = 500
+    ) -> Iterator[tuple[int, Fingerprint]]:
+        """Stream (scenario ID, fingerprint) pairs in ID order."""
+        rows = self._paginate(
+            "SELECT * FROM fingerprints WHERE scenario_id > ? "
+            "ORDER BY scenario_id LIMIT ?",
+            (),
+            (0,),
+            lambda row: (row["scenario_id"],),
+            None,
+            page_size,
+        )
+        for row in rows:
+            yield (
+                row["scenario_id"],
+                Fingerprint.unpack(row["exact_hash"], row["signature"]),
+            )
+
+    def find_duplicate(
+        self, fp: Fingerprint, threshold: float
+    ) -> Optional[tuple[int, float]]:
+        """Find the saved scenario most similar to fp, at or over threshold.
+
+        Returns (scenario ID, similarity), or None. Only fingerprinted
+        scenarios are searched (see ``index_fingerprints``).
+        """
+        with self._locked() as conn:
+            row = conn.execute(
+                "SELECT scenario_id FROM fingerprints WHERE exact_hash = ? LIMIT 1",
+                (fp.exact,),
+            ).fetchone()
+            if row:
+                return row[0], 1.0
+
+            buckets = fp.buckets()
+            rows = conn.execute(
+                f"""
+                SELECT f.scenario_id, f.exact_hash, f.signature
+                FROM fingerprints f
+                WHERE f.scenario_id IN (
+                    SELECT scenario_id FROM fingerprint_bands
+                    WHERE {" OR ".join(["(band = ? AND bucket = ?)"] * len(buckets))}
+                )
+                """,
+                [value for pair in enumerate(buckets) for value in pair],
+            ).fetchall()
+
+        best = None
+        for row in rows:
+            similarity = fp.similarity(
+                Fingerprint.unpack(row["exact_hash"], row["signature"])
+            )
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (row["scenario_id"], similarity)
+        return best
+
+    def delete_scenarios(self, scenario_ids: Iterable[int]) -> int:
+        """Delete scenarios and return how many were deleted.
+
+        Scenarios that have been rated are kept, so no rating is lost.
+        """
+        deleted = 0
+        with self._transaction() as conn:
+            for scenario_id in scenario_ids:
+                cursor = conn.execute(
+                    "DELETE FROM scenarios WHERE id = ? AND NOT EXISTS "
+                    "(SELECT 1 FROM ratings WHERE scenario_id = ?)",
+                    (scenario_id, scenario_id),
+                )
+                if not cursor.rowcount:
+                    continue
+                deleted += 1
+
+                row = conn.execute(
+                    "DELETE FROM fingerprints WHERE scenario_id = ? "
+                    "RETURNING exact_hash, signature",
+                    (scenario_id,),
+                ).fetchone()
+                if row:
+                    fp = Fingerprint.unpack(row["exact_hash"], row["signature"])
+                    conn.executemany(
+                        "DELETE FROM fingerprint_bands "
+                        "WHERE band = ? AND bucket = ? AND scenario_id = ?",
+                        [
+                            (band, bucket, scenario_id)
+                            for band, bucket in enumerate(fp.buckets())
+                        ],
+                    )
+        return deleted
+
+    def embed_scenarios(self, embedder: Embedder, batch_size: int = 64) -> int:
+        """Embed the prompts of scenarios that have no embedding from embedder.
+
+        Prompts are sent to the embedder ``batch_size`` at a time and each
+        batch is saved as it comes back, so an interrupted run keeps its
+        progress. Returns how many scenarios were embedded.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        embedded = 0
+        after_id = 0
+        while True:
+            with self._locked() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT s.id, s.prompt FROM scenarios s
+                    WHERE s.id > ? AND NOT EXISTS (
+                        SELECT 1 FROM embeddings e
+                        WHERE e.scenario_id = s.id AND e.model = ?
+                    )
+                    ORDER BY s.id
+                    LIMIT ?
+                    """,
+                    (after_id, embedder.name, batch_size),
+                ).fetchall()
+            if not rows:
+                return embedded
+
+            vectors = embedder.embed([row["prompt"] for row in rows])
+            with self._transaction() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings "
+                    "(scenario_id, model, dim, vector) VALUES (?, ?, ?, ?)",
+                    [
+                        (row["id"], embedder.name, len(vector), pack_vector(vector))
+                        for row, vector in zip(rows, vectors, strict=True)
+                    ],
+                )
+            embedded += len(rows)
+            after_id = rows[-1]["id"]
+
+    def iter_embeddings(
+        self, model: str, page_size: int = 1000
+    ) -> Iterator[tuple[int, bytes]]:
+        """Stream (scenario ID, float32 vector blob) pairs for one embedder."""
+        rows = self._paginate(
+            "SELECT scenario_id, vector FROM embeddings "
+            "WHERE model = ? AND scenario_id > ? ORDER BY scenario_id LIMIT ?",
+            (model,),
+            (0,),
+            lambda row: (row["scenario_id"],),
+            None,
+            page_size,
+        )
+        for row in rows:
+            yield row["scenario_id"], row["vector"]
+
     def get_scenario(self, scenario_id: int) -> Optional[Scenario]:
         """Get a scenario by ID."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._locked() as conn:
             row = conn.execute(
                 "SELECT * FROM scenarios WHERE id = ?", (scenario_id,)
             ).fetchone()
 
             if row:
-                return Scenario(
-                    prompt=row["prompt"],
-                    evaluation_target=row["evaluation_target"],
-                    success_criteria=json.loads(row["success_criteria"]),
-                )
+                return _row_to_scenario(row)
             return None
 
     def _parse_success_criteria(self, criteria: Optional[str]) -> List[str]:
-        """Parse success criteria from old string or new JSON format."""
-        if criteria and criteria.startswith("["):
-            return json.loads(criteria)
+        """Parse success criteria from old string or new JSON format.
+
+        Stored rows are always JSON since the legacy-criteria migration;
+        this stays for callers handling data from older exports.
+        """
+        return parse_success_criteria(criteria)
+
+    def _paginate(
+        self,
+        sql: str,
+        params: tuple,
+        start: tuple,
+        key: Callable[[sqlite3.Row], tuple],
+        limit: Optional[int],
+        page_size: int,
+    ) -> Iterator[sqlite3.Row]:
+        """Yield rows from a keyset-paginated query one page at a time.
+
+        ``sql`` takes ``params``, then the keyset cursor values, then the page
+        LIMIT. ``start`` is the cursor for the first page and ``key`` extracts
+        the cursor from the last row of each page. Each page is fetched under
+        the lock and released before yielding, so callers may write to the
+        store (e.g. save ratings) while iterating.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        cursor = start
+        remaining = limit
+        while remaining is None or remaining > 0:
+            size = page_size if remaining is None else min(page_size, remaining)
+            with self._locked() as conn:
+                rows = conn.execute(sql, (*params, *cursor, size)).fetchall()
+
+            yield from rows
+
+            if len(rows) < size:
+                return
+            cursor = key(rows[-1])
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def iter_scenarios(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        descending: bool = False,
+        page_size: int = 500,
+    ) -> Iterator[tuple[int, Scenario]]:
+        """Stream (id, scenario) pairs ordered by ID.
+
+        Pass the last ID seen as ``after_id`` to continue from there; with
+        ``descending`` the stream runs newest first and continues below it.
+        """
+        if descending:
+            sql = "SELECT * FROM scenarios WHERE id < ? ORDER BY id DESC LIMIT ?"
+            start = _MAX_ID if after_id is None else after_id
         else:
-            return [criteria] if criteria else []
+            sql = "SELECT * FROM scenarios WHERE id > ? ORDER BY id LIMIT ?"
+            start = 0 if after_id is None else after_id
+
+        rows = self._paginate(
+            sql, (), (start,), lambda row: (row["id"],), limit, page_size
+        )
+        for row in rows:
+            yield row["id"], _row_to_scenario(row)
+
+    def count_scenarios(self) -> int:
+        """Count saved scenarios."""
+        with self._locked() as conn:
+            return conn.execute("SELECT COUNT(*) FROM scenarios").fetchone()[0]
 
     def list_all_scenarios(self) -> List[Scenario]:
         """List all scenarios."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("SELECT * FROM scenarios ORDER BY id DESC").fetchall()
+        return [scenario for _, scenario in self.iter_scenarios(descending=True)]
 
-            return [
-                Scenario(
-                    prompt=row["prompt"],
-                    evaluation_target=row["evaluation_target"],
-                    success_criteria=self._parse_success_criteria(
-                        row["success_criteria"]
-                    ),
-                )
-                for row in rows
-            ]
-
-    def save_rating(self, scenario_id: int, rating: int) -> None:
-        """Save a rating for a scenario."""
+    def save_rating(self, scenario_id: int, rating: int) -> int:
+        """Save a rating for a scenario and return the rating's ID."""
         if not (0 <= rating <= 3):
             raise ValueError("Rating must be between 0 and 3")
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute(
+        with self._transaction() as conn:
+            cursor = conn.execute(
                 "INSERT INTO ratings (scenario_id, rating) VALUES (?, ?)",
                 (scenario_id, rating),
             )
-            conn.commit()
+            return cursor.lastrowid
 
-    def get_scenarios_for_review(self) -> List[tuple[int, Scenario]]:
-        """Get scenarios that haven't been rated yet."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute("""
-                SELECT s.* FROM scenarios s
-                LEFT JOIN ratings r ON s.id = r.scenario_id
-                WHERE r.id IS NULL
-                ORDER BY s.id
-            """).fetchall()
+    def save_ratings(self, ratings: Iterable[tuple[int, int]]) -> List[int]:
+        """Save (scenario_id, rating) pairs in one transaction; return their IDs.
 
+        Nothing is saved if any rating is out of range.
+        """
+        ratings = [*ratings]
+        if not all(0 <= rating <= 3 for _, rating in ratings):
+            raise ValueError("Rating must be between 0 and 3")
+
+        with self._transaction() as conn:
             return [
-                (
-                    row["id"],
-                    Scenario(
-                        prompt=row["prompt"],
-                        evaluation_target=row["evaluation_target"],
-                        success_criteria=self._parse_success_criteria(
-                            row["success_criteria"]
-                        ),
-                    ),
-                )
-                for row in rows
+                conn.execute(
+                    "INSERT INTO ratings (scenario_id, rating) VALUES (?, ?)",
+                    (scenario_id, rating),
+                ).lastrowid
+                for scenario_id, rating in ratings
             ]
 
-    def get_rated_scenarios(self, min_rating: int = 0) -> List[dict]:
-        """Get scenarios with their ratings."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+    def delete_rating(self, rating_id: int) -> bool:
+        """Delete a rating; return whether it existed."""
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM ratings WHERE id = ?", (rating_id,))
+            return cursor.rowcount > 0
+
+    def get_rating_summary(self, scenario_id: int) -> Optional[dict]:
+        """Get a scenario's rating count, mean and latest rating, if rated."""
+        with self._locked() as conn:
+            row = conn.execute(
+                "SELECT * FROM scenario_ratings WHERE scenario_id = ?",
+                (scenario_id,),
+            ).fetchone()
+        return None if row is None else _row_to_rating_summary(row)
+
+    def iter_rating_summaries(
+        self, limit: Optional[int] = None, page_size: int = 500
+    ) -> Iterator[dict]:
+        """Stream the rating summary of every rated scenario in ID order."""
+        rows = self._paginate(
+            """
+            SELECT * FROM scenario_ratings WHERE scenario_id > ?
+            ORDER BY scenario_id
+            LIMIT ?
+            """,
+            (),
+            (0,),
+            lambda row: (row["scenario_id"],),
+            limit,
+            page_size,
+        )
+        for row in rows:
+            yield _row_to_rating_summary(row)
+
+    def rating_distribution(
+        self, by: Sequence[str] = ("evaluation_target",)
+    ) -> List[dict]:
+        """Count rated scenarios by their latest rating, grouped by ``by``.
+
+        ``by`` names any of evaluation_target, model and temperature.
+        Each group's dict has those keys plus ``counts`` (scenarios per
+        rating 0-3), ``scenarios`` and ``mean``. Read from the summary
+        tables, so it costs the same however many ratings there are.
+        """
+        unknown = set(by) - set(_DISTRIBUTION_COLUMNS)
+        if unknown:
+            raise ValueError(
+                f"Can't group ratings by {', '.join(sorted(unknown))}; "
+                f"choose from {', '.join(_DISTRIBUTION_COLUMNS)}"
+            )
+        columns = [*dict.fromkeys(by)]
+        select = "".join(f"{column}, " for column in columns)
+        group = (
+            f"GROUP BY {', '.join(columns)}, rating" if columns else "GROUP BY rating"
+        )
+        with self._locked() as conn:
             rows = conn.execute(
+                f"SELECT {select}rating, SUM(scenarios) AS scenarios "
+                f"FROM rating_distribution {group} ORDER BY {select}rating"
+            ).fetchall()
+
+        groups: dict[tuple, dict] = {}
+        for row in rows:
+            key = tuple(row[column] for column in columns)
+            group_stats = groups.setdefault(
+                key, {**dict(zip(columns, key)), "counts": [0] * (_MAX_RATING + 1)}
+            )
+            group_stats["counts"][row["rating"]] = row["scenarios"]
+        for group_stats in groups.values():
+            counts = group_stats["counts"]
+            group_stats["scenarios"] = sum(counts)
+            group_stats["mean"] = sum(
+                rating * n for rating, n in enumerate(counts)
+            ) / sum(counts)
+        return [*groups.values()]
+
+    def rating_activity(self, days: Optional[int] = None) -> List[dict]:
+        """Ratings made per day, newest first, optionally the last ``days`` days.
+
+        Days are UTC dates; each dict has ``day``, ``ratings`` and the
+        ``mean`` of that day's ratings. Days without ratings are omitted.
+        """
+        sql = "SELECT day, ratings, total FROM rating_activity"
+        params: tuple = ()
+        if days is not None:
+            sql += " WHERE day > date('now', ?)"
+            params = (f"-{days} days",)
+        with self._locked() as conn:
+            rows = conn.execute(sql + " ORDER BY day DESC", params).fetchall()
+        return [
+            {
+                "day": row["day"],
+                "ratings": row["ratings"],
+                "mean": row["total"] / row["ratings"],
+            }
+            for row in rows
+        ]
+
+    def rating_overview(self) -> dict:
+        """Count scenarios, rated scenarios and ratings, with mean ratings.
+
+        ``mean_latest`` averages each rated scenario's latest rating;
+        ``mean_rating`` averages every rating ever made.
+        """
+        with self._locked() as conn:
+            rated, latest_total = conn.execute(
+                "SELECT SUM(scenarios), SUM(rating * scenarios) FROM rating_distribution"
+            ).fetchone()
+            ratings, total = conn.execute(
+                "SELECT SUM(ratings), SUM(total) FROM rating_activity"
+            ).fetchone()
+        return {
+            "scenarios": self.count_scenarios(),
+            "rated": rated or 0,
+            "ratings": ratings or 0,
+            "mean_latest": latest_total / rated if rated else None,
+            "mean_rating": total / ratings if ratings else None,
+        }
+
+    def refresh_rating_summaries(self) -> None:
+        """Rebuild the rating summaries from the full ratings history.
+
+        They are kept current as ratings are saved and deleted; this is
+        only needed after ratings were edited outside the store.
+        """
+        with self._transaction() as conn:
+            rebuild_rating_summaries(conn)
+
+    def save_failed_generation(
+        self,
+        evaluation_target: str,
+        error: str,
+        sample: Optional[int] = None,
+        attempts: int = 1,
+        raw_response: Optional[str] = None,
+        backend: Optional[str] = None,
+        model: Optional[str] = None,
+        job_id: Optional[int] = None,
+    ) -> int:
+        """Record a generation that failed so it can be inspected or re-run."""
+        with self._transaction() as conn:
+            cursor = conn.execute(
                 """
-                SELECT s.*, r.rating, r.rated_at
-                FROM scenarios s
-                JOIN ratings r ON s.id = r.scenario_id
-                WHERE r.rating >= ?
-                ORDER BY r.rating DESC, r.rated_at DESC
+                INSERT INTO failed_generations (
+                    evaluation_target, sample, attempts, error,
+                    raw_response, backend, model, job_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    evaluation_target,
+                    sample,
+                    attempts,
+                    error,
+                    raw_response,
+                    backend,
+                    model,
+                    job_id,
+                ),
+            )
+            return cursor.lastrowid
+
+    def get_failed_generations(
+        self, evaluation_target: Optional[str] = None
+    ) -> List[dict]:
+        """Get recorded generation failures, oldest first."""
+        sql = "SELECT * FROM failed_generations"
+        params: tuple = ()
+        if evaluation_target is not None:
+            sql += " WHERE evaluation_target = ?"
+            params = (evaluation_target,)
+        with self._locked() as conn:
+            rows = conn.execute(sql + " ORDER BY id", params).fetchall()
+        return [dict(row) for row in rows]
+
+    def iter_scenarios_for_review(
+        self,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        page_size: int = 500,
+        evaluation_target: Optional[str] = None,
+    ) -> Iterator[tuple[int, Scenario]]:
+        """Stream unrated (id, scenario) pairs in ID order, optionally for one target."""
+        target_filter = (
+            "" if evaluation_target is None else "AND s.evaluation_target = ?"
+        )
+        rows = self._paginate(
+            f"""
+            SELECT s.* FROM scenarios s
+            LEFT JOIN ratings r ON s.id = r.scenario_id
+            WHERE r.id IS NULL {target_filter} AND s.id > ?
+            ORDER BY s.id
+            LIMIT ?
             """,
-                (min_rating,),
-            ).fetchall()
+            () if evaluation_target is None else (evaluation_target,),
+            (0 if after_id is None else after_id,),
+            lambda row: (row["id"],),
+            limit,
+            page_size,
+        )
+        for row in rows:
+            yield row["id"], _row_to_scenario(row)
 
-            return [
-                {
-                    "id": row["id"],
-                    "prompt": row["prompt"],
-                    "evaluation_target": row["evaluation_target"],
-                    "success_criteria": self._parse_success_criteria(
-                        row["success_criteria"]
-                    ),
-                    "rating": row["rating"],
-                    "rated_at": row["rated_at"],
-                    "backend": row["backend"],
-                    "model": row["model"],
-                }
-                for row in rows
-            ]
+    def count_scenarios_for_review(
+        self, evaluation_target: Optional[str] = None
+    ) -> int:
+        """Count scenarios that haven't been rated yet, optionally for one target."""
+        sql = """
+            SELECT COUNT(*) FROM scenarios s
+            LEFT JOIN ratings r ON s.id = r.scenario_id
+            WHERE r.id IS NULL
+        """
+        params: tuple = ()
+        if evaluation_target is not None:
+            sql += " AND s.evaluation_target = ?"
+            params = (evaluation_target,)
+        with self._locked() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    def get_scenarios_for_review(self) -> List[tuple[int, Scenario]]:
+        """Get scenarios that haven't been rated yet."""
+        return list(self.iter_scenarios_for_review())
+
+    def iter_rated_scenarios(
+        self,
+        min_rating: int = 0,
+        limit: Optional[int] = None,
+        page_size: int = 500,
+        evaluation_target: Optional[str] = None,
+        model: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> Iterator[dict]:
+        """Stream rated scenarios, best and most recently rated first.
+
+        Filters are applied in SQL. ``since`` is compared against
+        ``rated_at``, which SQLite records in UTC. Pages are keyed on
+        (rating, rated_at, scenario_id, rating id), which matches the
+        ratings index, so each page is an index range scan.
+        """
+        conditions = ["r.rating >= ?"]
+        params: List[object] = [min_rating]
+        if evaluation_target is not None:
+            conditions.append("s.evaluation_target = ?")
+            params.append(evaluation_target)
+        if model is not None:
+            conditions.append("s.model = ?")
+            params.append(model)
+        if since is not None:
+            conditions.append("r.rated_at >= ?")
+            params.append(since.strftime("%Y-%m-%d %H:%M:%S"))
+
+        rows = self._paginate(
+            f"""
+            SELECT s.*, r.id AS rating_id, r.rating, r.rated_at
+            FROM ratings r
+            JOIN scenarios s ON s.id = r.scenario_id
+            WHERE {" AND ".join(conditions)}
+              AND (r.rating, r.rated_at, r.scenario_id, r.id) < (?, ?, ?, ?)
+            ORDER BY r.rating DESC, r.rated_at DESC, r.scenario_id DESC, r.id DESC
+            LIMIT ?
+            """,
+            tuple(params),
+            (_MAX_RATING + 1, "", 0, 0),
+            lambda row: (row["rating"], row["rated_at"], row["id"], row["rating_id"]),
+            limit,
+            page_size,
+        )
+        for row in rows:
+            yield _row_to_rated_dict(row)
+
+    def get_rated_scenarios(self, min_rating: int = 0) -> List[dict]:
+        """Get scenarios with their ratings."""
+        return list(self.iter_rated_scenarios(min_rating))
+
+    def _search_filters(
+        self,
+        query: str,
+        evaluation_target: Optional[str],
+        min_rating: Optional[int],
+    ) -> tuple[str, List[object]]:
+        """Build the WHERE clause shared by search and count_search."""
+        conditions = ["scenarios_fts MATCH ?"]
+        params: List[object] = [query]
+        if evaluation_target is not None:
+            conditions.append("s.evaluation_target = ?")
+            params.append(evaluation_target)
+        if min_rating is not None:
+            conditions.append(
+                "EXISTS (SELECT 1 FROM ratings r "
+                "WHERE r.scenario_id = s.id AND r.rating >= ?)"
+            )
+            params.append(min_rating)
+        return " AND ".join(conditions), params
+
+    def search(
+        self,
+        query: str,
+        evaluation_target: Optional[str] = None,
+        min_rating: Optional[int] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[dict]:
+        """Full-text search prompts and success criteria, best match first.
+
+        ``query`` is an FTS5 query (words, "phrases", OR, NOT, prefix*);
+        pass plain text through ``quote_search_terms`` first. Matching is
+        case-insensitive and stemmed, so "mirror" finds "mirrors". With
+        ``min_rating``, only scenarios rated at least that well at least
+        once are returned. Each result is the scenario's fields plus a
+        ``snippet`` of the prompt with matches in [brackets] and its bm25
+        ``score`` (lower is better). Raises ValueError for a malformed
+        query.
+        """
+        where, params = self._search_filters(query, evaluation_target, min_rating)
+        sql = f"""
+            SELECT s.id, s.prompt, s.evaluation_target, s.success_criteria,
+                   snippet(scenarios_fts, 0, '[', ']', '...', 16) AS snippet,
+                   scenarios_fts.rank AS score
+            FROM scenarios_fts
+            JOIN scenarios s ON s.id = scenarios_fts.rowid
+            WHERE {where}
+            ORDER BY scenarios_fts.rank
+            LIMIT ? OFFSET ?
+        """
+        try:
+            with self._locked() as conn:
+                rows = conn.execute(sql, (*params, limit, offset)).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {e}") from e
+        return [
+            {
+                "id": row["id"],
+                "prompt": row["prompt"],
+                "evaluation_target": row["evaluation_target"],
+                "success_criteria": json.loads(row["success_criteria"]),
+                "snippet": row["snippet"],
+                "score": row["score"],
+            }
+            for row in rows
+        ]
+
+    def count_search(
+        self,
+        query: str,
+        evaluation_target: Optional[str] = None,
+        min_rating: Optional[int] = None,
+    ) -> int:
+        """Count the results ``search`` would find without a limit."""
+        where, params = self._search_filters(query, evaluation_target, min_rating)
+        try:
+            with self._locked() as conn:
+                return conn.execute(
+                    f"""
+                    SELECT COUNT(*) FROM scenarios_fts
+                    JOIN scenarios s ON s.id = scenarios_fts.rowid
+                    WHERE {where}
+                    """,
+                    params,
+                ).fetchone()[0]
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query: {e}") from e
+
+
+class ScenarioWriter:
+    """Buffer scenarios in memory and save them in batched transactions.
+
+    Use as a context manager so whatever is still buffered gets written
+    when the block exits, including when it exits with an error.
+    """
+
+    def __init__(
+        self, store: ScenarioStore, batch_size: int = 100, job_id: Optional[int] = None
+    ):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.store = store
+        self.batch_size = batch_size
+        self.job_id = job_id
+        self.saved = 0
+        self._pending: List[tuple] = []
+        self._fingerprints: List[Optional[Fingerprint]] = []
+
+    def add(
+        self,
+        scenario: Scenario,
+        backend: Optional[str] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        sample: Optional[int] = None,
+        fingerprint: Optional[Fingerprint] = None,
+    ) -> None:
+        """Queue a scenario, flushing once a full batch is buffered.
+
+        A ``fingerprint`` is saved with the scenario so later runs can
+        find it as a duplicate (see scenario_forge.dedup).
+        """
+        self._pending.append(
+            _scenario_row(scenario, backend, model, temperature, self.job_id, sample)
+        )
+        self._fingerprints.append(fingerprint)
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered scenarios and return how many were written."""
+        if not self._pending:
+            return 0
+
+        written = self.store._insert_scenario_rows(
+            self._pending,
+            self.batch_size,
+            job_id=self.job_id,
+            fingerprints=self._fingerprints if any(self._fingerprints) else None,
+        )
+        self._pending = []
+        self._fingerprints = []
+        self.saved += written
+        return written
+
+    def __enter__(self) -> "ScenarioWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.flush()
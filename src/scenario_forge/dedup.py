@@ -0,0 +1,173 @@
+"""Exact and near-duplicate detection for scenario prompts.
+
+Two prompts are exact duplicates when they are equal after
+``normalize_text``, which ignores case, punctuation and spacing. Near
+duplicates are found with MinHash: a prompt's ``Fingerprint`` holds the
+minimum of each of ``NUM_PERM`` hash functions over its word pairs, and
+the share of positions two signatures agree on estimates how many word
+pairs the prompts share (their Jaccard similarity).
+
+Comparing a prompt against every prompt seen so far is quadratic over a
+run, so ``DedupIndex`` uses locality-sensitive hashing instead: each
+signature is cut into ``BANDS`` bands, and only prompts that agree on a
+whole band are compared. With 16 bands of 4 rows, a pair at similarity
+0.7 is compared 99% of the time and a pair at 0.2 about 2% of the time.
+
+Signatures are stored in the database (see ``ScenarioStore``), so the
+hashing below must never change without clearing them in a migration.
+"""
+
+import re
+import struct
+import unicodedata
+from collections.abc import Hashable, Iterable, Iterator
+from hashlib import blake2b, shake_128
+from typing import NamedTuple, Optional
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+DEFAULT_THRESHOLD = 0.7
+
+_WORD = re.compile(r"\w+")
+_SIGNATURE = struct.Struct(f"<{NUM_PERM}I")
+
+
+def normalize_text(text: str) -> str:
+    """Casefold text and reduce it to its words separated by single spaces."""
+    return " ".join(_WORD.findall(unicodedata.normalize("NFKC", text).casefold()))
+
+
+class Fingerprint(NamedTuple):
+    """Exact hash and MinHash signature of one prompt."""
+
+    exact: str
+    signature: tuple[int, ...]
+
+    def similarity(self, other: "Fingerprint") -> float:
+        """Estimated Jaccard similarity of the two prompts' word pairs."""
+        same = sum(a == b for a, b in zip(self.signature, other.signature))
+        return same / NUM_PERM
+
+    def buckets(self) -> list[int]:
+        """One bucket per band; prompts sharing a bucket are compared."""
+        packed, width = self.pack(), ROWS * 4
+        # Signed, to fit an SQLite INTEGER
+        return [
+            int.from_bytes(
+                blake2b(packed[start : start + width], digest_size=8).digest(),
+                "little",
+                signed=True,
+            )
+            for start in range(0, len(packed), width)
+        ]
+
+    def pack(self) -> bytes:
+        """The signature as a blob for storage."""
+        return _SIGNATURE.pack(*self.signature)
+
+    @classmethod
+    def unpack(cls, exact: str, blob: bytes) -> "Fingerprint":
+        """Rebuild a fingerprint from its stored form."""
+        return cls(exact, _SIGNATURE.unpack(blob))
+
+
+def fingerprint(text: str) -> Fingerprint:
+    """Fingerprint a prompt."""
+    normalized = normalize_text(text)
+    words = normalized.split()
+    shingles = {f"{a} {b}" for a, b in zip(words, words[1:])} or {normalized}
+    # Each 32-bit lane of a shingle's SHAKE output is an independent hash
+    # function, so one C call per shingle hashes it NUM_PERM ways
+    hashes = [
+        _SIGNATURE.unpack(shake_128(shingle.encode()).digest(_SIGNATURE.size))
+        for shingle in shingles
+    ]
+    signature = tuple(map(min, zip(*hashes)))
+    exact = blake2b(normalized.encode(), digest_size=16).hexdigest()
+    return Fingerprint(exact, signature)
+
+
+class Duplicate(NamedTuple):
+    """The earlier prompt a prompt duplicates, and how similar they are."""
+
+    key: Hashable
+    similarity: float
+
+
+class DedupIndex:
+    """Incremental index of fingerprints for finding duplicates.
+
+    Keys identify what was indexed: scenario IDs, Scenarios or example
+    names. With a ``store``, ``find`` also searches the fingerprints saved
+    there (see ``ScenarioStore.index_fingerprints``), returning scenario
+    IDs as keys.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, store=None):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be greater than 0 and at most 1")
+
+        self.threshold = threshold
+        self.store = store
+        self._exact: dict[str, Hashable] = {}
+        self._buckets: list[dict[int, list[Hashable]]] = [{} for _ in range(BANDS)]
+        self._fingerprints: dict[Hashable, Fingerprint] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def add(self, key: Hashable, fp: Fingerprint) -> None:
+        """Index a fingerprint under key."""
+        self._exact.setdefault(fp.exact, key)
+        for band, bucket in zip(self._buckets, fp.buckets()):
+            band.setdefault(bucket, []).append(key)
+        self._fingerprints[key] = fp
+
+    def add_examples(self, examples: dict) -> None:
+        """Index example prompts, keyed like ``example ai_psychosis#1``."""
+        for target, scenarios in examples.items():
+            for number, example in enumerate(scenarios, 1):
+                if example.get("prompt"):
+                    self.add(
+                        f"example {target}#{number}", fingerprint(example["prompt"])
+                    )
+
+    def find(self, fp: Fingerprint) -> Optional[Duplicate]:
+        """Return the most similar indexed prompt at or over the threshold."""
+        key = self._exact.get(fp.exact)
+        if key is not None:
+            return Duplicate(key, 1.0)
+
+        best = None
+        candidates: set = set()
+        for band, bucket in zip(self._buckets, fp.buckets()):
+            candidates.update(band.get(bucket, ()))
+        for key in candidates:
+            similarity = fp.similarity(self._fingerprints[key])
+            if similarity >= self.threshold and (
+                best is None or similarity > best.similarity
+            ):
+                best = Duplicate(key, similarity)
+
+        if self.store is not None and (best is None or best.similarity < 1):
+            saved = self.store.find_duplicate(fp, self.threshold)
+            if saved is not None and (best is None or saved[1] > best.similarity):
+                best = Duplicate(*saved)
+        return best
+
+
+def find_duplicates(
+    items: Iterable[tuple[Hashable, Fingerprint]], index: DedupIndex
+) -> Iterator[tuple[Hashable, Duplicate]]:
+    """Yield ``(key, duplicate)`` for each item duplicating an earlier one.
+
+    Items are compared against everything in ``index`` and every earlier
+    item that wasn't itself a duplicate, which is added to the index.
+    """
+    for key, fp in items:
+        duplicate = index.find(fp)
+        if duplicate is None:
+            index.add(key, fp)
+        else:
+            yield key, duplicate
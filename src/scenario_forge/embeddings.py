@@ -0,0 +1,289 @@
+"""Scenario embeddings for semantic search and diverse sampling.
+
+An ``Embedder`` turns texts into vectors. Two are built in, and others
+can be registered under the ``scenario_forge.embedders`` entry-point
+group:
+
+- ``hashing[:DIM]``: local and dependency-free; hashes words and word
+  pairs into DIM buckets (default 256). It captures shared vocabulary,
+  not meaning, but needs no model.
+- ``ollama[:MODEL]``: the Ollama server's ``embed`` endpoint (default
+  model ``nomic-embed-text``; the server is taken from ``OLLAMA_HOST``).
+
+Embeddings are normalized to unit length and stored as little-endian
+float32 blobs (see ``ScenarioStore.embed_scenarios``), so cosine
+similarity is a dot product. ``EmbeddingIndex`` loads them into one
+matrix for top-k search and k-center sampling. With the optional NumPy
+dependency (``pip install 'scenario-forge[numpy]'``) both are
+vectorized; without it they fall back to pure Python, which is fine for
+a few thousand scenarios.
+"""
+
+import heapq
+import math
+import sys
+from abc import ABC, abstractmethod
+from array import array
+from collections.abc import Collection, Iterable, Sequence
+from hashlib import blake2b
+from importlib import import_module
+from typing import Optional
+
+from scenario_forge.dedup import normalize_text
+
+ENTRY_POINT_GROUP = "scenario_forge.embedders"
+
+BUILTIN_EMBEDDERS = {
+    "hashing": "scenario_forge.embeddings:HashingEmbedder",
+    "ollama": "scenario_forge.embeddings:OllamaEmbedder",
+}
+
+
+class EmbeddingError(Exception):
+    """An embedder couldn't embed a batch of texts."""
+
+
+class Embedder(ABC):
+    """Turns texts into fixed-length vectors.
+
+    ``name`` identifies the embedder and its model; embeddings from
+    different embedders are stored and searched separately.
+    """
+
+    name: str
+
+    @abstractmethod
+    def embed(self, texts: list[str]) -> list[Sequence[float]]:
+        """Return one vector per text."""
+
+
+class HashingEmbedder(Embedder):
+    """Signed feature hashing of a text's words and word pairs."""
+
+    def __init__(self, dim: int = 256):
+        if dim < 1:
+            raise ValueError("dim must be at least 1")
+        self.dim = dim
+        self.name = f"hashing:{dim}"
+
+    def _vector(self, text: str) -> list[float]:
+        vector = [0.0] * self.dim
+        words = normalize_text(text).split()
+        for feature in [*words, *(f"{a} {b}" for a, b in zip(words, words[1:]))]:
+            h = int.from_bytes(blake2b(feature.encode(), digest_size=8).digest())
+            # The top bit picks the sign so collisions tend to cancel out
+            vector[h % self.dim] += 1.0 if h >> 63 else -1.0
+        return vector
+
+    def embed(self, texts: list[str]) -> list[Sequence[float]]:
+        return [self._vector(text) for text in texts]
+
+
+class OllamaEmbedder(Embedder):
+    """Embeddings from an Ollama server's ``embed`` endpoint."""
+
+    def __init__(
+        self,
+        model: str = "nomic-embed-text",
+        host: Optional[str] = None,
+        timeout: float = 120.0,
+    ):
+        import httpx
+        import ollama
+
+        self._errors = (ollama.ResponseError, httpx.HTTPError, ConnectionError)
+        self.model = model
+        self.name = f"ollama:{model}"
+        self.client = ollama.Client(host=host, timeout=timeout)
+
+    def embed(self, texts: list[str]) -> list[Sequence[float]]:
+        try:
+            return self.client.embed(model=self.model, input=texts).embeddings
+        except self._errors as e:
+            raise EmbeddingError(f"Ollama embed with {self.model} failed: {e}") from e
+
+
+def _entry_points() -> dict:
+    from importlib.metadata import entry_points
+
+    return {ep.name: ep for ep in entry_points(group=ENTRY_POINT_GROUP)}
+
+
+def available_embedders() -> list[str]:
+    """Return the names of all built-in and installed embedders."""
+    return sorted({*BUILTIN_EMBEDDERS, *_entry_points()})
+
+
+def create_embedder(spec: str) -> Embedder:
+    """Create an embedder from ``NAME[:ARG]``, e.g. ``ollama:all-minilm``.
+
+    ARG is the dimension for ``hashing`` and the model for every other
+    embedder. Raises ValueError for an unknown name or a bad ARG.
+    """
+    name, _, arg = spec.partition(":")
+    if name in BUILTIN_EMBEDDERS:
+        module, attr = BUILTIN_EMBEDDERS[name].split(":")
+        cls = getattr(import_module(module), attr)
+    elif name in _entry_points():
+        cls = _entry_points()[name].load()
+    else:
+        raise ValueError(
+            f"Unknown embedder '{name}'. Available: {', '.join(available_embedders())}"
+        )
+
+    if not arg:
+        return cls()
+    if cls is HashingEmbedder:
+        if not arg.isdigit():
+            raise ValueError(f"hashing dimension must be a number, not '{arg}'")
+        return cls(int(arg))
+    return cls(arg)
+
+
+def pack_vector(vector: Sequence[float]) -> bytes:
+    """Normalize a vector to unit length and pack it as float32 bytes."""
+    norm = math.sqrt(math.fsum(x * x for x in vector)) or 1.0
+    packed = array("f", [x / norm for x in vector])
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_vector(blob: bytes) -> array:
+    """Unpack a vector stored by ``pack_vector``."""
+    vector = array("f")
+    vector.frombytes(blob)
+    if sys.byteorder == "big":
+        vector.byteswap()
+    return vector
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class EmbeddingIndex:
+    """Unit-length embeddings held in memory for similarity search.
+
+    ``use_numpy`` forces the implementation; by default NumPy is used
+    when it is installed.
+    """
+
+    def __init__(
+        self,
+        ids: list[int],
+        blobs: list[bytes],
+        use_numpy: Optional[bool] = None,
+    ):
+        self.ids = ids
+        self._positions = {scenario_id: i for i, scenario_id in enumerate(ids)}
+        self._np = _numpy() if use_numpy is not False else None
+        if use_numpy and self._np is None:
+            raise ImportError(
+                "Vectorized search needs numpy: pip install 'scenario-forge[numpy]'"
+            )
+
+        if self._np is not None:
+            np = self._np
+            dim = len(blobs[0]) // 4 if blobs else 0
+            self._matrix = np.frombuffer(b"".join(blobs), dtype="<f4").reshape(
+                len(blobs), dim
+            )
+        else:
+            self._vectors = [unpack_vector(blob) for blob in blobs]
+
+    @classmethod
+    def from_store(
+        cls,
+        store,
+        model: str,
+        scenario_ids: Optional[Collection[int]] = None,
+        use_numpy: Optional[bool] = None,
+    ) -> "EmbeddingIndex":
+        """Load a store's embeddings from one embedder, optionally a subset."""
+        ids, blobs = [], []
+        for scenario_id, blob in store.iter_embeddings(model):
+            if scenario_ids is None or scenario_id in scenario_ids:
+                ids.append(scenario_id)
+                blobs.append(blob)
+        return cls(ids, blobs, use_numpy=use_numpy)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, scenario_id: int) -> bool:
+        return scenario_id in self._positions
+
+    def vector(self, scenario_id: int) -> Sequence[float]:
+        """Return the stored embedding of a scenario."""
+        position = self._positions[scenario_id]
+        if self._np is not None:
+            return self._matrix[position]
+        return self._vectors[position]
+
+    def _similarities(self, query: Sequence[float]):
+        if self._np is not None:
+            return self._matrix @ self._np.asarray(query, dtype=self._np.float32)
+        return [math.sumprod(vector, query) for vector in self._vectors]
+
+    def top_k(
+        self, query: Sequence[float], k: int, exclude: Iterable[int] = ()
+    ) -> list[tuple[int, float]]:
+        """Return the k most similar (scenario ID, cosine similarity) pairs.
+
+        ``query`` must be unit length, like the vectors ``pack_vector``
+        stores. Scenarios in ``exclude`` are left out.
+        """
+        excluded = {self._positions[i] for i in exclude if i in self._positions}
+        wanted = min(k + len(excluded), len(self.ids))
+        if wanted <= 0:
+            return []
+
+        scores = self._similarities(query)
+        if self._np is not None:
+            np = self._np
+            best = np.argpartition(-scores, wanted - 1)[:wanted]
+            best = best[np.argsort(-scores[best], kind="stable")]
+        else:
+            best = heapq.nlargest(wanted, range(len(scores)), key=scores.__getitem__)
+        return [(self.ids[i], float(scores[i])) for i in best if i not in excluded][:k]
+
+    def diverse(self, n: int, start: Optional[int] = None) -> list[int]:
+        """Pick n scenario IDs spread across the embedding space.
+
+        Greedy k-center (farthest-point) sampling: begin at ``start`` (by
+        default the first ID) and repeatedly add the scenario farthest,
+        in cosine distance, from everything picked so far. Each step is
+        one pass over the index, so picking n costs n passes.
+        """
+        if n >= len(self.ids):
+            return list(self.ids)
+        if n <= 0:
+            return []
+
+        current = self._positions[start] if start is not None else 0
+        picked = [current]
+        if self._np is not None:
+            np = self._np
+            distance = 1 - self._similarities(self._matrix[current])
+            for _ in range(n - 1):
+                distance[current] = -np.inf
+                current = int(np.argmax(distance))
+                picked.append(current)
+                distance = np.minimum(
+                    distance, 1 - self._similarities(self._matrix[current])
+                )
+        else:
+            distance = [1 - s for s in self._similarities(self._vectors[current])]
+            for _ in range(n - 1):
+                distance[current] = -math.inf
+                current = max(range(len(distance)), key=distance.__getitem__)
+                picked.append(current)
+                for i, s in enumerate(self._similarities(self._vectors[current])):
+                    if 1 - s < distance[i]:
+                        distance[i] = 1 - s
+        return [self.ids[i] for i in picked]
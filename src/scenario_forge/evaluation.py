@@ -0,0 +1,93 @@
+"""Grade model responses against saved scenarios in bulk.
+
+``check_many`` applies ``Scenario.check`` to a stream of
+``(scenario key, response)`` pairs. Responses are grouped into chunks and
+spread over a pool of worker processes, so grading scales with cores
+instead of running on one. The scenarios are sent to each worker once,
+when it starts, so a task only carries its chunk of responses. Results
+come back in input order and are yielded as soon as they are ready. At
+most a few chunks per worker are in flight, so input of any length is
+streamed in bounded memory.
+"""
+
+import os
+from collections import deque
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import batched
+from typing import NamedTuple, Optional
+
+from scenario_forge.core import Scenario
+
+DEFAULT_CHUNKSIZE = 500
+
+# Chunks queued per worker, so workers never wait on the parent for input
+_CHUNKS_PER_WORKER = 2
+
+# Scenarios installed in each worker process by _init_worker
+_scenarios: Mapping[Hashable, Scenario] = {}
+
+
+class CheckResult(NamedTuple):
+    """The outcome of checking one response against its scenario."""
+
+    key: Hashable
+    passed: bool
+    reason: str
+
+
+def _init_worker(scenarios: Mapping[Hashable, Scenario]) -> None:
+    global _scenarios
+    _scenarios = scenarios
+
+
+def _check_chunk(
+    chunk: Iterable[tuple[Hashable, str]],
+    scenarios: Optional[Mapping[Hashable, Scenario]] = None,
+) -> list[CheckResult]:
+    scenarios = _scenarios if scenarios is None else scenarios
+    return [
+        CheckResult(key, *scenarios[key].check(response)) for key, response in chunk
+    ]
+
+
+def check_many(
+    scenarios: Mapping[Hashable, Scenario],
+    responses: Iterable[tuple[Hashable, str]],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[CheckResult]:
+    """Check each ``(key, response)`` pair against ``scenarios[key]``.
+
+    ``workers`` is the number of processes (default: one per CPU); with
+    one worker everything runs in this process. ``chunksize`` responses
+    are sent to a worker at a time; larger chunks cost less overhead per
+    response but take longer to yield the first results. Raises KeyError
+    for a key that isn't in ``scenarios``.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    chunks = batched(responses, chunksize)
+    if workers == 1:
+        for chunk in chunks:
+            yield from _check_chunk(chunk, scenarios)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(scenarios,)
+    ) as pool:
+        pending: deque[Future] = deque()
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(_check_chunk, chunk))
+                if len(pending) >= workers * _CHUNKS_PER_WORKER:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
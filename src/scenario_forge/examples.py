@@ -0,0 +1,94 @@
+"""Shared registry of example scenarios used to seed generation.
+
+Examples are parsed on first use and cached for the life of the process,
+keyed on the modification times of the files they came from, so every
+backend (and every CLI command) shares one parsed copy and edits to the
+files are picked up on the next load.
+
+An examples source is either a YAML file mapping evaluation targets to
+lists of examples (like the bundled ``examples.yaml``) or a directory of
+YAML files. In a directory, a file holding a mapping contributes every
+target in it, and a file holding a list contributes examples for the
+target named by the file (``medical_advice.yaml`` -> ``medical_advice``).
+"""
+
+import threading
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+DEFAULT_EXAMPLES_PATH = Path(__file__).parent / "examples.yaml"
+
+# The libyaml-backed loader is much faster; fall back when it isn't built
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_cache: dict[Path, tuple[tuple, dict]] = {}
+_lock = threading.Lock()
+
+
+def normalize_success_criteria(criteria) -> list[str]:
+    """Normalize success_criteria to a list of strings."""
+    if isinstance(criteria, dict):
+        # Convert dict to list of criteria
+        return [f"{k}: {v}" for k, v in criteria.items()]
+    elif isinstance(criteria, str):
+        # Convert string to list
+        if ";" in criteria:
+            return [s.strip() for s in criteria.split(";")]
+        else:
+            return [criteria]
+    elif isinstance(criteria, list):
+        return criteria
+    else:
+        # Fallback to empty list
+        return []
+
+
+def _source_files(path: Path) -> list[Path]:
+    if path.is_dir():
+        return sorted([*path.glob("*.yaml"), *path.glob("*.yml")])
+    return [path] if path.exists() else []
+
+
+def _parse(files: list[Path]) -> dict:
+    """Parse and normalize examples from the given files."""
+    examples: dict[str, list[dict]] = {}
+    for file in files:
+        with open(file, "r") as f:
+            data = yaml.load(f, Loader=_Loader)
+
+        if isinstance(data, list):
+            data = {file.stem: data}
+        for target, scenarios in (data or {}).items():
+            for scenario in scenarios or []:
+                if "success_criteria" in scenario:
+                    scenario["success_criteria"] = normalize_success_criteria(
+                        scenario["success_criteria"]
+                    )
+            examples.setdefault(target, []).extend(scenarios or [])
+    return examples
+
+
+def load_examples(path: Optional[Path] = None) -> dict:
+    """Return the examples at path (default: the bundled examples.yaml).
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    path = Path(path or DEFAULT_EXAMPLES_PATH).resolve()
+    files = _source_files(path)
+    stamp = tuple((str(file), file.stat().st_mtime_ns) for file in files)
+
+    with _lock:
+        cached = _cache.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        examples = _parse(files)
+        _cache[path] = (stamp, examples)
+        return examples
+
+
+def get_examples(evaluation_target: str, path: Optional[Path] = None) -> list:
+    """Return the examples for one evaluation target."""
+    return load_examples(path).get(evaluation_target, [])
@@ -0,0 +1,31 @@
+"""Exporters that write rated scenarios in standard formats.
+
+Each exporter takes an iterable of rated-scenario dicts (as yielded by
+``ScenarioStore.iter_rated_scenarios``) and an output stream, writes the
+rows as they arrive, and returns how many rows it wrote. Formats listed in
+``BINARY_FORMATS`` need a binary stream; the rest take a text stream.
+"""
+
+from scenario_forge.exporters.arrow import write_arrow, write_parquet
+from scenario_forge.exporters.csv import write_csv
+from scenario_forge.exporters.json import write_json, write_jsonl
+
+EXPORTERS = {
+    "arrow": write_arrow,
+    "csv": write_csv,
+    "json": write_json,
+    "jsonl": write_jsonl,
+    "parquet": write_parquet,
+}
+
+BINARY_FORMATS = frozenset({"arrow", "parquet"})
+
+__all__ = [
+    "BINARY_FORMATS",
+    "EXPORTERS",
+    "write_arrow",
+    "write_csv",
+    "write_json",
+    "write_jsonl",
+    "write_parquet",
+]
@@ -0,0 +1,92 @@
+"""Columnar exporters: Parquet and the Arrow IPC file format.
+
+Both need the optional ``pyarrow`` dependency
+(``pip install 'scenario-forge[arrow]'``). Rows are converted to record
+batches ``chunk_size`` at a time, so memory stays bounded however many rows
+the store yields. Arrow IPC files can be memory-mapped by readers
+(``pyarrow.ipc.open_file``, ``polars.read_ipc``, ``pandas.read_feather``).
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from itertools import batched
+from typing import BinaryIO, Optional
+
+CHUNK_SIZE = 10_000
+
+
+def _pyarrow():
+    """Import pyarrow, explaining how to install it if it is missing."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError(
+            "Parquet and Arrow export need pyarrow: pip install 'scenario-forge[arrow]'"
+        ) from None
+    return pyarrow
+
+
+def schema():
+    """Return the Arrow schema for exported rated scenarios."""
+    pa = _pyarrow()
+    return pa.schema(
+        [
+            ("id", pa.int64()),
+            ("prompt", pa.string()),
+            ("evaluation_target", pa.string()),
+            ("success_criteria", pa.list_(pa.string())),
+            ("rating", pa.int8()),
+            ("rated_at", pa.timestamp("s", tz="UTC")),
+            ("backend", pa.string()),
+            ("model", pa.string()),
+        ]
+    )
+
+
+def _parse_rated_at(value: Optional[str]) -> Optional[datetime]:
+    """Parse SQLite's CURRENT_TIMESTAMP text, which is UTC."""
+    if value is None:
+        return None
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
+
+
+def record_batches(rows: Iterable[dict], chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """Convert rows into Arrow record batches of up to ``chunk_size`` rows."""
+    pa = _pyarrow()
+    batch_schema = schema()
+    for chunk in batched(rows, chunk_size):
+        columns = {name: [] for name in batch_schema.names}
+        for row in chunk:
+            for name, values in columns.items():
+                values.append(row[name])
+        columns["rated_at"] = [_parse_rated_at(v) for v in columns["rated_at"]]
+        yield pa.RecordBatch.from_pydict(columns, schema=batch_schema)
+
+
+def write_parquet(
+    rows: Iterable[dict], out: BinaryIO, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """Write rows as a Parquet file, one row group per chunk."""
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    count = 0
+    with pq.ParquetWriter(out, schema()) as writer:
+        for batch in record_batches(rows, chunk_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
+
+
+def write_arrow(
+    rows: Iterable[dict], out: BinaryIO, chunk_size: int = CHUNK_SIZE
+) -> int:
+    """Write rows as an Arrow IPC file (Feather v2)."""
+    pa = _pyarrow()
+
+    count = 0
+    with pa.ipc.new_file(out, schema()) as writer:
+        for batch in record_batches(rows, chunk_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
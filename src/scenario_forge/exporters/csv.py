@@ -0,0 +1,33 @@
+"""CSV exporter."""
+
+import csv
+import json
+from collections.abc import Iterable
+from typing import TextIO
+
+COLUMNS = [
+    "id",
+    "prompt",
+    "evaluation_target",
+    "success_criteria",
+    "rating",
+    "rated_at",
+    "backend",
+    "model",
+]
+
+
+def write_csv(rows: Iterable[dict], out: TextIO) -> int:
+    """Write rows as CSV with a header.
+
+    success_criteria is a list, so it is written as a JSON array in its cell.
+    """
+    writer = csv.DictWriter(out, fieldnames=COLUMNS)
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(
+            {**row, "success_criteria": json.dumps(row["success_criteria"])}
+        )
+        count += 1
+    return count
@@ -0,0 +1,31 @@
+"""JSON and JSON Lines exporters."""
+
+import json
+import textwrap
+from collections.abc import Iterable
+from typing import TextIO
+
+
+def write_json(rows: Iterable[dict], out: TextIO) -> int:
+    """Write rows as an indented JSON array without building it in memory.
+
+    The output is identical to ``json.dumps(list(rows), indent=2)``.
+    """
+    count = 0
+    out.write("[")
+    for row in rows:
+        out.write(",\n" if count else "\n")
+        out.write(textwrap.indent(json.dumps(row, indent=2), "  "))
+        count += 1
+    out.write("\n]\n")
+    return count
+
+
+def write_jsonl(rows: Iterable[dict], out: TextIO) -> int:
+    """Write one JSON object per line."""
+    count = 0
+    for row in rows:
+        out.write(json.dumps(row))
+        out.write("\n")
+        count += 1
+    return count
@@ -0,0 +1,133 @@
+"""Case-insensitive multi-pattern matching for success criteria.
+
+``CriteriaMatcher`` lowercases a list of criteria once and then answers
+"which criteria occur in this text?" for any number of texts. Small
+lists are scanned with ``in``, whose C string search beats anything
+written in Python. Large lists are compiled into an Aho-Corasick
+automaton, which finds every criterion in a single pass over the text
+no matter how many criteria there are. Both give the same answers.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from typing import Optional
+
+# Criteria count from which the automaton beats one ``in`` scan per
+# criterion; the break-even is around 110 whatever the text length (see
+# benchmarks/bench_matching.py)
+AUTOMATON_THRESHOLD = 128
+
+
+class _Automaton:
+    """Aho-Corasick automaton compiled to a DFA over the patterns' alphabet.
+
+    Each state maps a character straight to the next state, so scanning
+    costs one dict lookup per character of text. Characters that appear
+    in no pattern lead back to the start state.
+    """
+
+    def __init__(self, patterns: dict[str, list[int]]):
+        goto: list[dict[str, int]] = [{}]
+        matches: list[list[int]] = [[]]
+        for pattern, indices in patterns.items():
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    matches.append([])
+                state = next_state
+            matches[state].extend(indices)
+
+        # Breadth-first, so a state's failure state is finished before it
+        self.delta: list[dict[str, int]] = [{} for _ in goto]
+        self.delta[0] = goto[0]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # Transitions the failure state would take, overridden by our own
+            self.delta[state] = {**self.delta[fail[state]], **goto[state]}
+            matches[state] = matches[state] + matches[fail[state]]
+            for char, child in goto[state].items():
+                fail[child] = self.delta[fail[state]].get(char, 0)
+                queue.append(child)
+
+        self.matches = [tuple(sorted(set(found))) for found in matches]
+        self.first = [found[0] if found else None for found in self.matches]
+
+    def find(self, text: str) -> set[int]:
+        delta, matches = self.delta, self.matches
+        found: set[int] = set()
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if matches[state]:
+                found.update(matches[state])
+        return found
+
+    def find_first(self, text: str) -> Optional[int]:
+        delta, first = self.delta, self.first
+        best = None
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            index = first[state]
+            if index is not None and (best is None or index < best):
+                best = index
+                if best == 0:
+                    break
+        return best
+
+
+class CriteriaMatcher:
+    """Find which of a fixed list of criteria occur in a text.
+
+    Matching is case-insensitive, like ``Scenario.check``. Results are
+    indices into the original ``criteria`` list. ``use_automaton`` forces
+    the strategy; by default the automaton is used for lists of at least
+    ``AUTOMATON_THRESHOLD`` criteria.
+    """
+
+    def __init__(self, criteria: Iterable[str], use_automaton: Optional[bool] = None):
+        self.criteria = list(criteria)
+        self._lowered = [criterion.lower() for criterion in self.criteria]
+
+        # An empty criterion is in every text; don't make it a pattern
+        self._always = [i for i, pattern in enumerate(self._lowered) if not pattern]
+        patterns: dict[str, list[int]] = {}
+        for i, pattern in enumerate(self._lowered):
+            if pattern:
+                patterns.setdefault(pattern, []).append(i)
+
+        if use_automaton is None:
+            use_automaton = len(patterns) >= AUTOMATON_THRESHOLD
+        self._automaton = _Automaton(patterns) if use_automaton else None
+
+    @property
+    def uses_automaton(self) -> bool:
+        """Whether the criteria were compiled into an automaton."""
+        return self._automaton is not None
+
+    def find_all(self, text: str) -> list[int]:
+        """Return the indices of every criterion found in text, in order."""
+        text = text.lower()
+        if self._automaton is None:
+            return [i for i, pattern in enumerate(self._lowered) if pattern in text]
+        return sorted({*self._always, *self._automaton.find(text)})
+
+    def find_first(self, text: str) -> Optional[int]:
+        """Return the index of the first listed criterion found in text."""
+        text = text.lower()
+        if self._automaton is None:
+            for i, pattern in enumerate(self._lowered):
+                if pattern in text:
+                    return i
+            return None
+
+        found = self._automaton.find_first(text)
+        if self._always and (found is None or self._always[0] < found):
+            return self._always[0]
+        return found
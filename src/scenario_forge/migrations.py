@@ -0,0 +1,430 @@
+"""Versioned schema migrations for the scenario datastore.
+
+The schema version is stored in SQLite's ``PRAGMA user_version``. Each
+entry in ``MIGRATIONS`` upgrades the database by one version; a database
+at version N has had the first N migrations applied. Add new migrations
+to the end of the list and never edit one that has shipped.
+"""
+
+import json
+import sqlite3
+from collections.abc import Callable
+from typing import List, Optional
+
+
+def parse_success_criteria(criteria: Optional[str]) -> List[str]:
+    """Parse success criteria from old string or new JSON format."""
+    if criteria and criteria.startswith("["):
+        return json.loads(criteria)
+    else:
+        return [criteria] if criteria else []
+
+
+def _create_tables(conn: sqlite3.Connection) -> None:
+    """Create the scenarios and ratings tables."""
+    # IF NOT EXISTS: databases created before versioning already have them
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS scenarios (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            prompt TEXT NOT NULL,
+            evaluation_target TEXT NOT NULL,
+            success_criteria TEXT NOT NULL,
+            backend TEXT,
+            model TEXT,
+            temperature REAL
+        )
+    """)
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS ratings (
+            id INTEGER PRIMARY KEY,
+            scenario_id INTEGER NOT NULL,
+            rating INTEGER NOT NULL CHECK (rating >= 0 AND rating <= 3),
+            rated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (scenario_id) REFERENCES scenarios(id)
+        )
+    """)
+
+
+def _add_review_indexes(conn: sqlite3.Connection) -> None:
+    """Index the columns used by the review queue, export and target filters."""
+    # Serves the unrated-scenario anti-join; ratings.id is the rowid, so
+    # "r.id IS NULL" is answered from the index alone.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ratings_scenario_id ON ratings(scenario_id)"
+    )
+    # Matches the export ordering; scenario_id makes it covering for the join.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_ratings_rating_rated_at "
+        "ON ratings(rating, rated_at, scenario_id)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_scenarios_evaluation_target "
+        "ON scenarios(evaluation_target)"
+    )
+
+
+def _convert_legacy_criteria(conn: sqlite3.Connection) -> None:
+    """Rewrite plain-string success_criteria rows as JSON lists."""
+    rows = conn.execute(
+        "SELECT id, success_criteria FROM scenarios "
+        "WHERE success_criteria NOT LIKE '[%'"
+    ).fetchall()
+    conn.executemany(
+        "UPDATE scenarios SET success_criteria = ? WHERE id = ?",
+        [
+            (json.dumps(parse_success_criteria(criteria)), scenario_id)
+            for scenario_id, criteria in rows
+        ],
+    )
+
+
+def _add_failed_generations(conn: sqlite3.Connection) -> None:
+    """Create the dead-letter table for generations that kept failing."""
+    conn.execute("""
+        CREATE TABLE failed_generations (
+            id INTEGER PRIMARY KEY,
+            evaluation_target TEXT NOT NULL,
+            sample INTEGER,
+            attempts INTEGER NOT NULL,
+            error TEXT NOT NULL,
+            raw_response TEXT,
+            backend TEXT,
+            model TEXT,
+            failed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def _add_jobs(conn: sqlite3.Connection) -> None:
+    """Create the jobs table and tag scenarios and failures with their job."""
+    conn.execute("""
+        CREATE TABLE jobs (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            evaluation_target TEXT NOT NULL,
+            backend TEXT,
+            model TEXT,
+            seed INTEGER,
+            requested INTEGER NOT NULL CHECK (requested >= 0),
+            completed INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'running',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.execute("ALTER TABLE scenarios ADD COLUMN job_id INTEGER REFERENCES jobs(id)")
+    conn.execute("ALTER TABLE scenarios ADD COLUMN sample INTEGER")
+    conn.execute("ALTER TABLE failed_generations ADD COLUMN job_id INTEGER")
+    # Finds the samples a job has already saved when it resumes
+    conn.execute(
+        "CREATE INDEX idx_scenarios_job_sample ON scenarios(job_id, sample) "
+        "WHERE job_id IS NOT NULL"
+    )
+
+
+def _add_fingerprints(conn: sqlite3.Connection) -> None:
+    """Create the duplicate-detection index (see scenario_forge.dedup).
+
+    Existing scenarios aren't fingerprinted here; ``index_fingerprints``
+    fills in whatever is missing the first time duplicates are checked.
+    """
+    conn.execute("""
+        CREATE TABLE fingerprints (
+            scenario_id INTEGER PRIMARY KEY REFERENCES scenarios(id),
+            exact_hash TEXT NOT NULL,
+            signature BLOB NOT NULL
+        )
+    """)
+    conn.execute("CREATE INDEX idx_fingerprints_exact_hash ON fingerprints(exact_hash)")
+    # One row per scenario per band; a lookup is one primary key probe per band
+    conn.execute("""
+        CREATE TABLE fingerprint_bands (
+            band INTEGER NOT NULL,
+            bucket INTEGER NOT NULL,
+            scenario_id INTEGER NOT NULL,
+            PRIMARY KEY (band, bucket, scenario_id)
+        ) WITHOUT ROWID
+    """)
+
+
+def _add_search_index(conn: sqlite3.Connection) -> None:
+    """Index prompts and success criteria for full-text search.
+
+    ``scenarios_fts`` is an external-content FTS5 table: it stores only
+    the index and reads the text from ``scenarios``. Triggers keep it in
+    step with every insert, update and delete.
+    """
+    conn.execute("""
+        CREATE VIRTUAL TABLE scenarios_fts USING fts5(
+            prompt, success_criteria,
+            content = 'scenarios', content_rowid = 'id',
+            tokenize = 'porter unicode61 remove_diacritics 2'
+        )
+    """)
+    conn.execute("""
+        CREATE TRIGGER scenarios_fts_insert AFTER INSERT ON scenarios BEGIN
+            INSERT INTO scenarios_fts (rowid, prompt, success_criteria)
+            VALUES (new.id, new.prompt, new.success_criteria);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER scenarios_fts_delete AFTER DELETE ON scenarios BEGIN
+            INSERT INTO scenarios_fts (scenarios_fts, rowid, prompt, success_criteria)
+            VALUES ('delete', old.id, old.prompt, old.success_criteria);
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER scenarios_fts_update
+        AFTER UPDATE OF prompt, success_criteria ON scenarios BEGIN
+            INSERT INTO scenarios_fts (scenarios_fts, rowid, prompt, success_criteria)
+            VALUES ('delete', old.id, old.prompt, old.success_criteria);
+            INSERT INTO scenarios_fts (rowid, prompt, success_criteria)
+            VALUES (new.id, new.prompt, new.success_criteria);
+        END
+    """)
+    # Index the scenarios saved before this migration
+    conn.execute("INSERT INTO scenarios_fts (scenarios_fts) VALUES ('rebuild')")
+
+
+def _add_embeddings(conn: sqlite3.Connection) -> None:
+    """Create the table of scenario embeddings (see scenario_forge.embeddings)."""
+    conn.execute("""
+        CREATE TABLE embeddings (
+            scenario_id INTEGER NOT NULL REFERENCES scenarios(id),
+            model TEXT NOT NULL,
+            dim INTEGER NOT NULL,
+            vector BLOB NOT NULL,
+            PRIMARY KEY (scenario_id, model)
+        )
+    """)
+    # Loads one embedder's vectors in scenario order
+    conn.execute("CREATE INDEX idx_embeddings_model ON embeddings(model, scenario_id)")
+    # A deleted scenario's embeddings go with it; an edited prompt's are stale
+    conn.execute("""
+        CREATE TRIGGER embeddings_delete AFTER DELETE ON scenarios BEGIN
+            DELETE FROM embeddings WHERE scenario_id = old.id;
+        END
+    """)
+    conn.execute("""
+        CREATE TRIGGER embeddings_update AFTER UPDATE OF prompt ON scenarios BEGIN
+            DELETE FROM embeddings WHERE scenario_id = old.id;
+        END
+    """)
+
+
+def rebuild_rating_summaries(conn: sqlite3.Connection) -> None:
+    """Recompute the rating summary tables from the full ratings history.
+
+    The triggers added by ``_add_rating_summaries`` keep the summaries
+    current; this is for the initial backfill and for repairing them
+    after ratings were edited by hand.
+    """
+    # Deleting scenario_ratings row by row also empties rating_distribution
+    conn.execute("DELETE FROM scenario_ratings")
+    conn.execute("DELETE FROM rating_distribution")
+    conn.execute("DELETE FROM rating_activity")
+    # With MAX(), SQLite takes the bare columns from the row holding the max,
+    # so rating and rated_at are those of each scenario's latest rating. The
+    # insert triggers on scenario_ratings fill rating_distribution.
+    conn.execute("""
+        INSERT INTO scenario_ratings (
+            scenario_id, ratings, total,
+            latest_rating, latest_rating_id, latest_rated_at
+        )
+        SELECT scenario_id, COUNT(*), SUM(rating), rating, MAX(id), rated_at
+        FROM ratings
+        GROUP BY scenario_id
+    """)
+    conn.execute("""
+        INSERT INTO rating_activity (day, ratings, total)
+        SELECT date(rated_at), COUNT(*), SUM(rating)
+        FROM ratings
+        GROUP BY date(rated_at)
+    """)
+
+
+# Adds delta to the distribution bucket of a scenario's latest rating; the
+# model and temperature may be NULL, so the bucket is matched with IS.
+_BUMP_DISTRIBUTION = """
+    INSERT INTO rating_distribution (
+        evaluation_target, model, temperature, rating, scenarios
+    )
+    SELECT s.evaluation_target, s.model, s.temperature, {row}.latest_rating, 0
+    FROM scenarios s
+    WHERE s.id = {row}.scenario_id AND NOT EXISTS (
+        SELECT 1 FROM rating_distribution d
+        WHERE (d.evaluation_target, d.model, d.temperature, d.rating)
+           IS (s.evaluation_target, s.model, s.temperature, {row}.latest_rating)
+    );
+    UPDATE rating_distribution SET scenarios = scenarios + {delta}
+    WHERE rating = {row}.latest_rating
+      AND (evaluation_target, model, temperature) IS (
+          SELECT evaluation_target, model, temperature
+          FROM scenarios WHERE id = {row}.scenario_id
+      );
+"""
+
+
+def _add_rating_summaries(conn: sqlite3.Connection) -> None:
+    """Create rating summaries maintained by triggers on ``ratings``.
+
+    - ``scenario_ratings``: per rated scenario, the number and sum of its
+      ratings and its latest rating.
+    - ``rating_distribution``: rated scenarios per target, model,
+      temperature and latest rating, so a re-rated scenario moves bucket
+      instead of being counted twice.
+    - ``rating_activity``: ratings made per day, for reviewer throughput.
+
+    Ratings are only ever inserted or deleted; an in-place UPDATE isn't
+    tracked and needs ``rebuild_rating_summaries``.
+    """
+    conn.execute("""
+        CREATE TABLE scenario_ratings (
+            scenario_id INTEGER PRIMARY KEY REFERENCES scenarios(id),
+            ratings INTEGER NOT NULL,
+            total INTEGER NOT NULL,
+            latest_rating INTEGER NOT NULL,
+            latest_rating_id INTEGER NOT NULL,
+            latest_rated_at TIMESTAMP
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE rating_distribution (
+            evaluation_target TEXT NOT NULL,
+            model TEXT,
+            temperature REAL,
+            rating INTEGER NOT NULL,
+            scenarios INTEGER NOT NULL
+        )
+    """)
+    conn.execute(
+        "CREATE INDEX idx_rating_distribution "
+        "ON rating_distribution(evaluation_target, model, temperature, rating)"
+    )
+    conn.execute("""
+        CREATE TABLE rating_activity (
+            day TEXT PRIMARY KEY,
+            ratings INTEGER NOT NULL,
+            total INTEGER NOT NULL
+        )
+    """)
+
+    conn.execute(f"""
+        CREATE TRIGGER scenario_ratings_insert AFTER INSERT ON scenario_ratings BEGIN
+            {_BUMP_DISTRIBUTION.format(row="new", delta=1)}
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER scenario_ratings_delete AFTER DELETE ON scenario_ratings BEGIN
+            {_BUMP_DISTRIBUTION.format(row="old", delta=-1)}
+            DELETE FROM rating_distribution WHERE scenarios = 0;
+        END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER scenario_ratings_update
+        AFTER UPDATE OF latest_rating ON scenario_ratings
+        WHEN old.latest_rating IS NOT new.latest_rating BEGIN
+            {_BUMP_DISTRIBUTION.format(row="old", delta=-1)}
+            {_BUMP_DISTRIBUTION.format(row="new", delta=1)}
+            DELETE FROM rating_distribution WHERE scenarios = 0;
+        END
+    """)
+
+    # A new rating gets the highest ID, so it is its scenario's latest
+    conn.execute("""
+        CREATE TRIGGER ratings_summary_insert AFTER INSERT ON ratings BEGIN
+            INSERT INTO scenario_ratings (
+                scenario_id, ratings, total,
+                latest_rating, latest_rating_id, latest_rated_at
+            )
+            VALUES (new.scenario_id, 1, new.rating, new.rating, new.id, new.rated_at)
+            ON CONFLICT (scenario_id) DO UPDATE SET
+                ratings = ratings + 1,
+                total = total + excluded.total,
+                latest_rating = excluded.latest_rating,
+                latest_rating_id = excluded.latest_rating_id,
+                latest_rated_at = excluded.latest_rated_at;
+            INSERT INTO rating_activity (day, ratings, total)
+            VALUES (date(new.rated_at), 1, new.rating)
+            ON CONFLICT (day) DO UPDATE SET
+                ratings = ratings + 1,
+                total = total + excluded.total;
+        END
+    """)
+    # Undoing a scenario's latest rating falls back to the one before it
+    conn.execute("""
+        CREATE TRIGGER ratings_summary_delete AFTER DELETE ON ratings BEGIN
+            UPDATE scenario_ratings SET
+                ratings = ratings - 1,
+                total = total - old.rating
+            WHERE scenario_id = old.scenario_id;
+            DELETE FROM scenario_ratings
+            WHERE scenario_id = old.scenario_id AND ratings = 0;
+            UPDATE scenario_ratings
+            SET (latest_rating, latest_rating_id, latest_rated_at) = (
+                SELECT rating, id, rated_at FROM ratings
+                WHERE scenario_id = old.scenario_id
+                ORDER BY id DESC LIMIT 1
+            )
+            WHERE scenario_id = old.scenario_id AND latest_rating_id = old.id;
+            UPDATE rating_activity SET
+                ratings = ratings - 1,
+                total = total - old.rating
+            WHERE day = date(old.rated_at);
+            DELETE FROM rating_activity
+            WHERE day = date(old.rated_at) AND ratings = 0;
+        END
+    """)
+    rebuild_rating_summaries(conn)
+
+
+def _add_job_settings(conn: sqlite3.Connection) -> None:
+    """Record the generation settings a job was started with.
+
+    ``settings`` is a JSON object; jobs started before this column
+    existed have NULL and are resumed with whatever flags are given.
+    """
+    conn.execute("ALTER TABLE jobs ADD COLUMN settings TEXT")
+
+
+MIGRATIONS: List[Callable[[sqlite3.Connection], None]] = [
+    _create_tables,
+    _add_review_indexes,
+    _convert_legacy_criteria,
+    _add_failed_generations,
+    _add_jobs,
+    _add_fingerprints,
+    _add_search_index,
+    _add_embeddings,
+    _add_rating_summaries,
+    _add_job_settings,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    """Return the schema version recorded in the database."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """Apply pending migrations and return the resulting schema version.
+
+    All pending migrations run in one write transaction, so a failure
+    leaves the database at its previous version and two processes opening
+    the same database can't both apply a migration.
+    """
+    if schema_version(conn) >= SCHEMA_VERSION:
+        return schema_version(conn)
+
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        # Re-read under the write lock in case another process migrated first
+        version = schema_version(conn)
+        for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {number}")
+            version = number
+    return version
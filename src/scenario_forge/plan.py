@@ -0,0 +1,178 @@
+"""Generation plans: many targets, counts, models and temperatures in one run.
+
+A plan is a YAML file listing what to generate::
+
+    defaults:            # optional, applied to every entry
+      count: 50
+      temperature: 0.7
+    targets:
+      - ai_psychosis     # just a target, using the defaults
+      - target: medical_advice_boundary
+        count: 200
+        model: llama3.1:70b
+        temperature: 0.9
+
+Entries are scheduled round-robin (see ``interleave``), so when they
+share a bounded pool of workers every target makes progress at the same
+rate instead of the first one hogging the server. Samples are numbered
+across the whole plan (see ``sample_offsets``), so two identical entries
+still get different seeds and cache keys.
+"""
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import yaml
+
+from scenario_forge.backends.base import Backend, GenerationError, bounded_as_completed
+from scenario_forge.core import Scenario
+
+_FIELDS = {"target", "count", "model", "temperature"}
+
+
+@dataclass(frozen=True)
+class PlanEntry:
+    """One line of a plan: generate ``count`` scenarios for ``target``.
+
+    ``model`` and ``temperature`` override the run's settings when set.
+    """
+
+    target: str
+    count: int = 1
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+
+
+def _entry(raw, defaults: dict, position: int) -> PlanEntry:
+    if isinstance(raw, str):
+        raw = {"target": raw}
+    if not isinstance(raw, dict):
+        raise ValueError(f"Plan entry {position} must be a target name or mapping")
+
+    fields = {**defaults, **raw}
+    unknown = set(fields) - _FIELDS
+    if unknown:
+        raise ValueError(
+            f"Plan entry {position} has unknown field(s): {', '.join(sorted(unknown))}"
+        )
+    if not fields.get("target"):
+        raise ValueError(f"Plan entry {position} has no target")
+
+    entry = PlanEntry(
+        target=str(fields["target"]),
+        count=fields.get("count", 1),
+        model=fields.get("model"),
+        temperature=fields.get("temperature"),
+    )
+    if not isinstance(entry.count, int) or entry.count < 0:
+        raise ValueError(f"Plan entry {position} count must be a whole number")
+    if entry.temperature is not None and not isinstance(
+        entry.temperature, (int, float)
+    ):
+        raise ValueError(f"Plan entry {position} temperature must be a number")
+    return entry
+
+
+def load_plan(path: Path, defaults: Optional[dict] = None) -> list[PlanEntry]:
+    """Read a plan file; raises ValueError if it is malformed.
+
+    ``defaults`` (e.g. a count given on the command line) apply to every
+    entry, below the plan's own defaults.
+    """
+    with open(path, "r") as f:
+        data = yaml.safe_load(f)
+
+    if isinstance(data, list):
+        data = {"targets": data}
+    if not isinstance(data, dict) or not data.get("targets"):
+        raise ValueError("A plan needs a non-empty 'targets' list")
+
+    plan_defaults = data.get("defaults") or {}
+    if not isinstance(plan_defaults, dict) or "target" in plan_defaults:
+        raise ValueError("Plan 'defaults' must be a mapping without a target")
+    defaults = {**(defaults or {}), **plan_defaults}
+
+    return [
+        _entry(raw, defaults, position)
+        for position, raw in enumerate(data["targets"], 1)
+    ]
+
+
+def interleave(entries: Iterable[PlanEntry]) -> Iterator[tuple[int, int]]:
+    """Yield ``(entry index, sample)`` pairs, taking one from each entry in turn.
+
+    ``[a x3, b x1]`` gives ``(0, 0), (1, 0), (0, 1), (0, 2)``.
+    """
+    counts = [entry.count for entry in entries]
+    for sample in range(max(counts, default=0)):
+        for index, count in enumerate(counts):
+            if sample < count:
+                yield index, sample
+
+
+def sample_offsets(entries: Iterable[PlanEntry]) -> list[int]:
+    """Return where each entry's samples start in the plan's numbering.
+
+    Entry ``i`` generates samples ``offsets[i]`` to ``offsets[i] + count
+    - 1``, so no two entries share a sample number (and with it a seed
+    or cache key). ``[a x3, b x1, c x2]`` gives ``[0, 3, 4]``.
+    """
+    offsets = []
+    total = 0
+    for entry in entries:
+        offsets.append(total)
+        total += entry.count
+    return offsets
+
+
+def generate_plan(
+    entries: list[PlanEntry], backends: list[Backend]
+) -> Iterator[tuple[int, int, Union[Scenario, GenerationError]]]:
+    """Generate a plan one scenario at a time, in ``interleave`` order.
+
+    ``backends[i]`` generates ``entries[i]``; entries may share a backend.
+    Yields ``(entry index, sample, result)``, where ``sample`` is numbered
+    across the plan (see ``sample_offsets``) and a sample that failed has
+    its ``GenerationError`` as the result.
+    """
+    offsets = sample_offsets(entries)
+    for index, sample in interleave(entries):
+        sample += offsets[index]
+        try:
+            result = backends[index].generate_scenario(entries[index].target, sample)
+        except GenerationError as e:
+            result = e
+        yield index, sample, result
+
+
+async def agenerate_plan(
+    entries: list[PlanEntry], backends: list[Backend], concurrency: int = 4
+) -> AsyncIterator[tuple[int, int, Union[Scenario, GenerationError]]]:
+    """Async version of ``generate_plan`` sharing one pool of workers.
+
+    At most ``concurrency`` requests are in flight across all entries, and
+    results are yielded as they complete.
+    """
+
+    async def generate(index: int, sample: int):
+        try:
+            result = await backends[index].agenerate_scenario(
+                entries[index].target, sample
+            )
+        except GenerationError as e:
+            result = e
+        return index, sample, result
+
+    offsets = sample_offsets(entries)
+    calls = (
+        lambda index=index, sample=sample: generate(index, offsets[index] + sample)
+        for index, sample in interleave(entries)
+    )
+    async with AsyncExitStack() as stack:
+        for backend in {id(backend): backend for backend in backends}.values():
+            await stack.enter_async_context(backend.session())
+        async for result in bounded_as_completed(calls, concurrency):
+            yield result
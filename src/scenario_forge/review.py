@@ -0,0 +1,242 @@
+"""Keyboard-driven review of unrated scenarios.
+
+``run_review`` shows one scenario at a time and reads a single key per
+action, with no Enter needed:
+
+- ``0``-``3`` rate the scenario
+- ``s`` or space skips it for this session
+- ``u`` undoes the last rating or skip and shows that scenario again
+- ``q`` quits (so do Esc, Ctrl-C and Ctrl-D)
+
+The queue (``ReviewQueue``) reads unrated scenarios a page at a time and
+fetches the next page while the reviewer is still reading the current
+scenario, so no key waits on the database. Ratings are held by the
+session (``ReviewSession``) and written ``batch_size`` at a time in one
+transaction each, and whatever is pending when the review ends.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+import click
+
+from scenario_forge.core import Scenario
+from scenario_forge.datastore import ScenarioStore
+
+RATING_LABELS = ("ineffective", "ok", "good", "excellent")
+RATING_KEYS = {str(rating): rating for rating in range(len(RATING_LABELS))}
+
+SKIP_KEYS = frozenset("s ")
+UNDO_KEYS = frozenset("u")
+# Esc, Ctrl-C and Ctrl-D; an empty read means stdin has closed
+QUIT_KEYS = frozenset(["q", "\x1b", "\x03", "\x04", ""])
+
+# Actions that can be undone; older ones have been flushed and are final
+UNDO_DEPTH = 100
+
+
+class ReviewQueue:
+    """Unrated scenarios in ID order, read from the store a page at a time.
+
+    When fewer than ``prefetch`` scenarios are buffered, ``fill`` reads
+    the next page of ``page_size``. Scenarios handed out aren't returned
+    again, even if they are skipped or their rating hasn't been flushed
+    yet, unless they are pushed back by an undo.
+    """
+
+    def __init__(
+        self,
+        store: ScenarioStore,
+        evaluation_target: Optional[str] = None,
+        page_size: int = 100,
+        prefetch: int = 20,
+    ):
+        self.store = store
+        self.evaluation_target = evaluation_target
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self._buffer: deque[tuple[int, Scenario]] = deque()
+        self._after_id = 0
+        self._exhausted = False
+
+    def fill(self) -> None:
+        """Read the next page if the buffer is running low."""
+        if self._exhausted or len(self._buffer) >= self.prefetch:
+            return
+        page = [
+            *self.store.iter_scenarios_for_review(
+                after_id=self._after_id,
+                limit=self.page_size,
+                page_size=self.page_size,
+                evaluation_target=self.evaluation_target,
+            )
+        ]
+        if page:
+            self._after_id = page[-1][0]
+        self._exhausted = len(page) < self.page_size
+        self._buffer.extend(page)
+
+    def next(self) -> Optional[tuple[int, Scenario]]:
+        """Return the next (id, scenario) to review, or None when done."""
+        if not self._buffer:
+            self.fill()
+        return self._buffer.popleft() if self._buffer else None
+
+    def push_back(self, item: tuple[int, Scenario]) -> None:
+        """Put a scenario back at the front of the queue."""
+        self._buffer.appendleft(item)
+
+
+@dataclass
+class _Action:
+    """A rating (or a skip, with no rating) made during a review."""
+
+    item: tuple[int, Scenario]
+    rating: Optional[int] = None
+    # Set once the rating has been written to the store
+    rating_id: Optional[int] = None
+
+
+class ReviewSession:
+    """Ratings made during a review, buffered and written in batches."""
+
+    def __init__(self, store: ScenarioStore, batch_size: int = 25):
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.store = store
+        self.batch_size = batch_size
+        self.rated = 0
+        self.skipped = 0
+        self.started = time.monotonic()
+        self._pending: list[_Action] = []
+        self._history: deque[_Action] = deque(maxlen=UNDO_DEPTH)
+
+    @property
+    def pending(self) -> int:
+        """The number of ratings not yet written to the store."""
+        return len(self._pending)
+
+    def rate(self, item: tuple[int, Scenario], rating: int) -> None:
+        """Rate a scenario, flushing when a batch is full."""
+        action = _Action(item, rating)
+        self._pending.append(action)
+        self._history.append(action)
+        self.rated += 1
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def skip(self, item: tuple[int, Scenario]) -> None:
+        """Leave a scenario unrated for the rest of this session."""
+        self._history.append(_Action(item))
+        self.skipped += 1
+
+    def undo(self) -> Optional[tuple[int, Scenario]]:
+        """Undo the last rating or skip and return its scenario, if any."""
+        if not self._history:
+            return None
+        action = self._history.pop()
+        if action.rating is None:
+            self.skipped -= 1
+        else:
+            self.rated -= 1
+            if action.rating_id is None:
+                # Unflushed ratings are the newest, so this is the last one
+                self._pending.pop()
+            else:
+                self.store.delete_rating(action.rating_id)
+        return action.item
+
+    def flush(self) -> int:
+        """Write pending ratings in one transaction; return how many."""
+        if not self._pending:
+            return 0
+        ids = self.store.save_ratings(
+            (action.item[0], action.rating) for action in self._pending
+        )
+        for action, rating_id in zip(self._pending, ids):
+            action.rating_id = rating_id
+        count = len(self._pending)
+        self._pending.clear()
+        return count
+
+
+def _render(
+    scenario_id: int, scenario: Scenario, session: ReviewSession, remaining: int
+) -> None:
+    hours = (time.monotonic() - session.started) / 3600
+    pace = f" · {session.rated / hours:.0f}/h" if session.rated else ""
+    click.clear()
+    click.echo(
+        f"[rated {session.rated} · skipped {session.skipped} · {remaining} left{pace}]"
+    )
+    click.echo(f"\n#{scenario_id} {scenario.evaluation_target}")
+    click.echo(f"\nPrompt: {scenario.prompt}")
+    click.echo("\nSuccess Criteria:")
+    for criterion in scenario.success_criteria:
+        click.echo(f"  - {criterion}")
+    keys = "  ".join(f"{i} {label}" for i, label in enumerate(RATING_LABELS))
+    click.echo(f"\n{keys}   s skip  u undo  q quit")
+
+
+def _read_key() -> str:
+    # click.getchar raises for Ctrl-C and Ctrl-D on a real terminal
+    try:
+        return click.getchar()
+    except (KeyboardInterrupt, EOFError):
+        return ""
+
+
+def run_review(
+    store: ScenarioStore,
+    evaluation_target: Optional[str] = None,
+    batch_size: int = 25,
+    page_size: int = 100,
+) -> ReviewSession:
+    """Review unrated scenarios with single-key input until done or quit.
+
+    Returns the session, whose ratings have all been written.
+    """
+    total = store.count_scenarios_for_review(evaluation_target)
+    queue = ReviewQueue(store, evaluation_target, page_size)
+    session = ReviewSession(store, batch_size)
+
+    item = queue.next()
+    try:
+        while True:
+            if item is None:
+                # Give the reviewer a chance to undo the last rating
+                click.echo(
+                    "\nNo scenarios left. Press u to undo, any other key to finish."
+                )
+                previous = session.undo() if _read_key() in UNDO_KEYS else None
+                if previous is None:
+                    break
+                item = previous
+
+            scenario_id, scenario = item
+            remaining = total - session.rated - session.skipped
+            _render(scenario_id, scenario, session, remaining)
+            # Read ahead while the reviewer reads the scenario
+            queue.fill()
+            key = _read_key()
+
+            if key in QUIT_KEYS:
+                break
+            if key in RATING_KEYS:
+                session.rate(item, RATING_KEYS[key])
+            elif key in SKIP_KEYS:
+                session.skip(item)
+            elif key in UNDO_KEYS:
+                previous = session.undo()
+                if previous is not None:
+                    queue.push_back(item)
+                    item = previous
+                continue
+            else:
+                continue
+            item = queue.next()
+    finally:
+        session.flush()
+    return session
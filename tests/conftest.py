@@ -38,12 +38,14 @@ def mock_ollama_backend():
 
     Returns a mock that generates predictable test scenarios.
     """
-    with patch("scenario_forge.cli.OllamaBackend") as mock_backend_class:
+    with patch("scenario_forge.backends.ollama.OllamaBackend") as mock_backend_class:
         # Create mock instance
         mock_instance = MagicMock()
+        mock_instance.name = "ollama"
+        mock_instance.model = "llama3.2"
 
         # Configure behavior
-        def generate_scenario(target):
+        def generate_scenario(target, sample=0):
             return Scenario(
                 prompt=f"Test prompt for {target}",
                 evaluation_target=target,
@@ -53,7 +55,21 @@ def mock_ollama_backend():
                 ],
             )
 
+        async def agenerate_samples(
+            target, samples, concurrency=4, return_exceptions=False
+        ):
+            for sample in samples:
+                yield sample, generate_scenario(target, sample)
+
+        async def agenerate_scenarios(
+            target, n, concurrency=4, return_exceptions=False
+        ):
+            for _ in range(n):
+                yield generate_scenario(target)
+
         mock_instance.generate_scenario = generate_scenario
+        mock_instance.agenerate_samples = agenerate_samples
+        mock_instance.agenerate_scenarios = agenerate_scenarios
         mock_backend_class.return_value = mock_instance
 
         yield mock_instance
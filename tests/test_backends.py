@@ -0,0 +1,321 @@
+"""Tests for the backend interface, registry and fake backend."""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from scenario_forge import backends
+from scenario_forge.backends import available_backends, create_backend
+from scenario_forge.backends.base import (
+    Backend,
+    GenerationError,
+    bounded_as_completed,
+    extract_json,
+)
+from scenario_forge.backends.fake import FakeBackend, FakeBackendError
+from scenario_forge.cli import cli
+from scenario_forge.datastore import ScenarioStore
+
+
+def test_fake_backend_is_deterministic():
+    """Test the same seed reproduces the same scenarios."""
+    first = FakeBackend(seed=7).generate_batch("ai_psychosis", 5)
+    second = FakeBackend(seed=7).generate_batch("ai_psychosis", 5)
+
+    assert [s.prompt for s in first] == [s.prompt for s in second]
+    assert len({s.prompt for s in first}) == 5
+    assert all(s.evaluation_target == "ai_psychosis" for s in first)
+    assert all(s.success_criteria for s in first)
+
+
+def test_fake_backend_error_rate():
+    """Test simulated failures follow the configured rate."""
+    with pytest.raises(GenerationError) as excinfo:
+        FakeBackend(error_rate=1.0).generate_scenario("x")
+    assert isinstance(excinfo.value.error, FakeBackendError)
+
+    backend = FakeBackend(error_rate=0.5, seed=1)
+    failures = 0
+    for sample in range(200):
+        try:
+            backend.generate_scenario("x", sample=sample)
+        except GenerationError:
+            failures += 1
+    assert 60 < failures < 140
+
+    with pytest.raises(ValueError):
+        FakeBackend(error_rate=1.5)
+
+
+def test_fake_backend_async_latency_overlaps():
+    """Test async generation overlaps simulated latency."""
+    backend = FakeBackend(latency=0.05)
+
+    start = time.perf_counter()
+    scenarios = asyncio.run(backend.agenerate_batch("x", 8, concurrency=8))
+    elapsed = time.perf_counter() - start
+
+    assert len(scenarios) == 8
+    assert elapsed < 0.05 * 8 / 2
+
+
+def test_sync_backend_async_path_uses_threads():
+    """Test the default _acomplete runs a sync backend in worker threads."""
+
+    class SyncOnly(FakeBackend):
+        _acomplete = Backend._acomplete
+
+    scenarios = asyncio.run(SyncOnly().agenerate_batch("x", 3, concurrency=2))
+    assert len(scenarios) == 3
+
+
+def test_bounded_as_completed_cancels_on_failure():
+    """Test in-flight calls are cancelled when one call fails."""
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def boom():
+        raise RuntimeError("boom")
+
+    async def run():
+        async for _ in bounded_as_completed([slow, slow, boom], concurrency=3):
+            pass
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+    assert len(cancelled) == 2
+
+
+def test_registry_lists_and_creates_backends():
+    """Test built-in backends can be listed and created by name."""
+    assert {"fake", "ollama"} <= set(available_backends())
+    assert isinstance(create_backend("fake", latency=0.0), FakeBackend)
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        create_backend("nope")
+
+
+def test_registry_loads_entry_points(monkeypatch):
+    """Test third-party backends registered as entry points are found."""
+
+    class Plugin:
+        def load(self):
+            return FakeBackend
+
+    monkeypatch.setattr(backends, "_entry_points", lambda: {"plugin": Plugin()})
+
+    assert "plugin" in available_backends()
+    assert isinstance(create_backend("plugin"), FakeBackend)
+
+
+def test_generate_with_fake_backend(isolated_db):
+    """Test the CLI end to end with the offline backend."""
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli,
+        [
+            "generate",
+            "ai_psychosis",
+            "--backend",
+            "fake",
+            "--count",
+            "6",
+            "--concurrency",
+            "3",
+            "-B",
+            "latency=0.001",
+            "--save",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert len(result.output.splitlines()) == 6
+    assert json.loads(result.output.splitlines()[0])["evaluation_target"] == (
+        "ai_psychosis"
+    )
+    rows = list(ScenarioStore().iter_scenarios())
+    assert len(rows) == 6
+
+
+def test_generate_rejects_bad_backend_settings(isolated_db):
+    """Test unknown backends and options are reported as usage errors."""
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["generate", "x", "--backend", "nope"])
+    assert result.exit_code == 2
+    assert "Unknown backend" in result.output
+
+    result = runner.invoke(cli, ["generate", "x", "--backend", "fake", "-B", "bad"])
+    assert result.exit_code == 2
+
+    result = runner.invoke(
+        cli, ["generate", "x", "--backend", "fake", "-B", "colour=blue"]
+    )
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"prompt": "p", "success_criteria": ["c"]}',
+        'Here you go:\n```json\n{"prompt": "p", "success_criteria": ["c"]}\n```',
+        'Sure! {"prompt": "p", "success_criteria": ["c"]} Hope that helps {x}',
+        'Note {not json} then {"prompt": "p", "success_criteria": ["c"]}',
+    ],
+)
+def test_extract_json_recovers_wrapped_output(text):
+    """Test JSON is found inside code fences and surrounding prose."""
+    assert extract_json(text) == {"prompt": "p", "success_criteria": ["c"]}
+
+
+def test_extract_json_handles_braces_in_strings():
+    """Test braces and escaped quotes inside strings don't end the object."""
+    text = 'Output: {"prompt": "Say \\"}\\" {twice}", "success_criteria": "x"}.'
+    assert extract_json(text)["prompt"] == 'Say "}" {twice}'
+
+
+def test_extract_json_rejects_output_without_object():
+    """Test output with no JSON object raises ValueError."""
+    with pytest.raises(ValueError):
+        extract_json("I can't help with that. [1, 2]")
+
+
+def test_parse_response_requires_prompt_and_criteria():
+    """Test output missing a field is treated as malformed."""
+    backend = FakeBackend()
+
+    with pytest.raises(ValueError, match="prompt"):
+        backend._parse_response('{"success_criteria": ["c"]}', "x")
+    with pytest.raises(ValueError, match="success_criteria"):
+        backend._parse_response('{"prompt": "p", "success_criteria": []}', "x")
+
+
+def test_retries_recover_from_malformed_output():
+    """Test malformed responses are retried until a usable one arrives."""
+    flaky = FakeBackend(malformed_rate=0.5, seed=3, retries=8, backoff=0.0)
+    with patch.object(flaky, "_complete", wraps=flaky._complete) as requests:
+        scenarios = flaky.generate_batch("x", 20)
+
+    assert len(scenarios) == 20
+    assert requests.call_count > 20
+    # Finished samples don't keep an attempt count
+    assert not flaky._attempts
+
+    # Content depends only on the sample, not on how many attempts it took
+    clean = FakeBackend(seed=3).generate_batch("x", 20)
+    assert [s.prompt for s in scenarios] == [s.prompt for s in clean]
+
+
+def test_generation_error_keeps_raw_response():
+    """Test exhausted retries raise GenerationError with the last output."""
+    backend = FakeBackend(malformed_rate=1.0, retries=2, backoff=0.0)
+
+    with pytest.raises(GenerationError) as excinfo:
+        backend.generate_scenario("x", sample=4)
+
+    error = excinfo.value
+    assert error.sample == 4
+    assert error.attempts == 3
+    assert isinstance(error.error, ValueError)
+    assert error.raw_response.startswith("Sure!")
+
+
+def test_async_timeout_is_retried_then_reported():
+    """Test a slow request times out, and a failed sample doesn't end the run."""
+    backend = FakeBackend(latency=1.0, timeout=0.01, retries=1, backoff=0.0)
+
+    async def collect():
+        return [
+            result
+            async for result in backend.agenerate_scenarios(
+                "x", 3, concurrency=3, return_exceptions=True
+            )
+        ]
+
+    start = time.perf_counter()
+    results = asyncio.run(collect())
+
+    assert time.perf_counter() - start < 0.5
+    assert len(results) == 3
+    assert all(isinstance(r, GenerationError) for r in results)
+    assert all(isinstance(r.error, TimeoutError) for r in results)
+
+
+def test_programming_errors_are_not_retried():
+    """Test only retryable errors are retried; a bug propagates as itself."""
+
+    class Broken(FakeBackend):
+        calls = 0
+
+        def _complete(self, prompt, options, sample):
+            self.calls += 1
+            return self.missing_attribute
+
+        async def _acomplete(self, prompt, options, sample):
+            return self._complete(prompt, options, sample)
+
+    backend = Broken(retries=3, backoff=0.0)
+
+    with pytest.raises(AttributeError):
+        backend.generate_scenario("x")
+    with pytest.raises(AttributeError):
+        asyncio.run(backend.agenerate_scenario("x"))
+    assert backend.calls == 2
+
+
+def test_backoff_grows_and_is_capped():
+    """Test retry delays double per attempt, with jitter, up to the cap."""
+    backend = FakeBackend(backoff=1.0)
+
+    assert 0.5 <= backend._backoff_delay(0) <= 1.0
+    assert 2.0 <= backend._backoff_delay(2) <= 4.0
+    assert backend._backoff_delay(20) <= 30.0
+
+
+def test_generate_continues_past_failures(isolated_db):
+    """Test failed generations are dead-lettered while the run carries on."""
+    runner = CliRunner()
+
+    for concurrency in ("1", "4"):
+        result = runner.invoke(
+            cli,
+            [
+                "generate",
+                "ai_psychosis",
+                "--backend",
+                "fake",
+                "-B",
+                "error_rate=0.4",
+                "--seed",
+                "11",
+                "--count",
+                "20",
+                "--retries",
+                "0",
+                "--concurrency",
+                concurrency,
+                "--save",
+            ],
+        )
+        assert result.exit_code == 0
+        saved = len(result.stdout.splitlines())
+        assert 0 < saved < 20
+        assert f"{20 - saved} of 20 generations failed" in result.stderr
+
+    store = ScenarioStore()
+    failures = store.get_failed_generations("ai_psychosis")
+    assert store.count_scenarios() + len(failures) == 40
+    assert failures[0]["error"].startswith("FakeBackendError")
+    assert failures[0]["attempts"] == 1
+    assert failures[0]["backend"] == "fake"
@@ -0,0 +1,57 @@
+"""Tests for the on-disk response cache."""
+
+import pytest
+
+from scenario_forge.cache import ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ResponseCache(tmp_path / "cache.db") as cache:
+        yield cache
+
+
+def test_key_depends_on_every_input():
+    """Test that any change to the generation inputs changes the key."""
+    base = ResponseCache.make_key("llama3.2", "prompt", {"seed": 1}, "json", 0)
+
+    assert base == ResponseCache.make_key("llama3.2", "prompt", {"seed": 1}, "json")
+    assert base != ResponseCache.make_key("mistral", "prompt", {"seed": 1}, "json")
+    assert base != ResponseCache.make_key("llama3.2", "other", {"seed": 1}, "json")
+    assert base != ResponseCache.make_key("llama3.2", "prompt", {"seed": 2}, "json")
+    assert base != ResponseCache.make_key("llama3.2", "prompt", {"seed": 1}, None)
+    assert base != ResponseCache.make_key("llama3.2", "prompt", {"seed": 1}, "json", 1)
+
+
+def test_get_and_put_count_hits_and_misses(cache):
+    """Test cache hits and misses are counted."""
+    assert cache.get("k") is None
+    cache.put("k", '{"prompt": "p"}')
+
+    assert cache.get("k") == '{"prompt": "p"}'
+    assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1, "bytes": 15}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Test that exceeding max_bytes evicts the least recently used entry."""
+    with ResponseCache(tmp_path / "cache.db", max_bytes=30) as cache:
+        cache.put("a", "x" * 10)
+        cache.put("b", "x" * 10)
+        cache.put("c", "x" * 10)
+        cache.get("a")  # "b" is now the least recently used
+        cache.put("d", "x" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("d") is not None
+        assert cache.stats()["bytes"] == 30
+
+
+def test_cache_persists_between_instances(tmp_path):
+    """Test that a new cache instance reads entries written by an earlier one."""
+    with ResponseCache(tmp_path / "cache.db") as cache:
+        cache.put("k", "value")
+
+    with ResponseCache(tmp_path / "cache.db") as cache:
+        assert cache.get("k") == "value"
+        assert cache.stats()["bytes"] == 5
@@ -67,3 +67,43 @@ def test_generate_multiple_with_save(isolated_db, mock_ollama_backend):
 
     # Check all are our target
     assert all(s.evaluation_target == "multi_test" for s in scenarios)
+
+
+def test_generate_concurrent_with_save(isolated_db, mock_ollama_backend):
+    """Test that --concurrency routes through the async path and saves all."""
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli,
+        ["generate", "async_test", "--count", "4", "--concurrency", "2", "--save"],
+    )
+
+    assert result.exit_code == 0
+
+    lines = result.output.strip().split("\n")
+    assert len(lines) == 4
+
+    store = ScenarioStore()
+    scenarios = store.list_all_scenarios()
+    assert len(scenarios) == 4
+    assert all(s.evaluation_target == "async_test" for s in scenarios)
+
+
+def test_generate_rejects_zero_concurrency(isolated_db, mock_ollama_backend):
+    """Test that --concurrency must be at least 1."""
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["generate", "x", "--concurrency", "0"])
+
+    assert result.exit_code != 0
+
+
+def test_generate_with_cache_reports_stats(isolated_db, mock_ollama_backend):
+    """Test that --cache reports hit/miss counters on stderr."""
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["generate", "cached", "--cache", "--seed", "7"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["evaluation_target"] == "cached"
+    assert "Cache: 0 hits, 0 misses" in result.stderr
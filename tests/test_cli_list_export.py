@@ -83,3 +83,75 @@ def test_export_command_with_filter(isolated_db):
     assert len(exported) == 2
     assert exported[0]["rating"] == 3
     assert exported[1]["rating"] == 2
+
+
+def test_export_streams_same_json_as_before(isolated_db):
+    """Test that streamed export output matches a single json.dumps call."""
+    from scenario_forge.datastore import ScenarioStore
+
+    store = ScenarioStore(isolated_db)
+    for i in range(3):
+        scenario_id = store.save_scenario(
+            Scenario(f"Prompt {i}\nwith newline", "target", ["a", "b"])
+        )
+        store.save_rating(scenario_id, i)
+
+    result = CliRunner().invoke(cli, ["export"])
+
+    assert result.exit_code == 0
+    expected = json.dumps(store.get_rated_scenarios(), indent=2)
+    assert result.output == expected + "\n"
+
+
+def test_export_jsonl_with_filters(isolated_db):
+    """Test JSON Lines export with target, model and limit filters."""
+    from scenario_forge.datastore import ScenarioStore
+
+    store = ScenarioStore(isolated_db)
+    for target, model in [
+        ("target1", "llama3.2"),
+        ("target1", "mistral"),
+        ("target2", "llama3.2"),
+        ("target1", "llama3.2"),
+    ]:
+        scenario_id = store.save_scenario(
+            Scenario(f"{target} {model}", target, ["c"]), model=model
+        )
+        store.save_rating(scenario_id, 2)
+
+    runner = CliRunner()
+    result = runner.invoke(
+        cli,
+        ["export", "--format", "jsonl", "--target", "target1", "--model", "llama3.2"],
+    )
+
+    assert result.exit_code == 0
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert len(rows) == 2
+    assert all(row["evaluation_target"] == "target1" for row in rows)
+    assert all(row["model"] == "llama3.2" for row in rows)
+
+    result = runner.invoke(cli, ["export", "--format", "jsonl", "--limit", "3"])
+    assert len(result.output.splitlines()) == 3
+
+
+def test_export_since_filter(isolated_db):
+    """Test that --since filters on when the rating was made."""
+    from scenario_forge.datastore import ScenarioStore
+
+    store = ScenarioStore(isolated_db)
+    store.save_rating(store.save_scenario(Scenario("Prompt", "t", ["c"])), 3)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["export", "--since", "2000-01-01"])
+    assert len(json.loads(result.output)) == 1
+
+    result = runner.invoke(cli, ["export", "--since", "2999-01-01"])
+    assert "No scenarios found" in result.output
+
+
+def test_export_rejects_unknown_format(isolated_db):
+    """Test that unsupported formats are rejected by the CLI."""
+    result = CliRunner().invoke(cli, ["export", "--format", "xml"])
+
+    assert result.exit_code != 0
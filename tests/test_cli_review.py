@@ -64,3 +64,19 @@ def test_review_command_skip_scenario(isolated_db, sample_scenarios):
     # No rating should be saved
     rated_scenarios = store.get_rated_scenarios()
     assert len(rated_scenarios) == 0
+
+
+def test_review_tui_single_keys(isolated_db, sample_scenarios):
+    """Test --tui rates on single keystrokes and reports the session."""
+    store = ScenarioStore(isolated_db)
+    store.save_scenarios(sample_scenarios)
+
+    result = CliRunner().invoke(
+        cli, ["review", "--tui", "--target", "ai_psychosis"], input="3q"
+    )
+
+    assert result.exit_code == 0
+    assert "0 ineffective  1 ok  2 good  3 excellent" in result.output
+    assert "Rated 1 and skipped 0 scenarios" in result.output
+    [rated] = store.get_rated_scenarios()
+    assert (rated["evaluation_target"], rated["rating"]) == ("ai_psychosis", 3)
@@ -0,0 +1,69 @@
+"""Guard the CLI's cold-start cost.
+
+Scripts call ``scenario-forge list``/``export`` thousands of times, so the
+CLI module must not import backends, rich or YAML until a command needs
+them. These tests run in a fresh interpreter so earlier imports in the
+test session don't hide a regression.
+"""
+
+import json
+import subprocess
+import sys
+
+# Modules that only generate/prompt/--pretty should load
+HEAVY_MODULES = ["asyncio", "httpx", "ollama", "pyarrow", "rich", "yaml"]
+
+# Generous ceiling for `import scenario_forge.cli` (the heavy imports
+# alone cost several hundred milliseconds)
+IMPORT_BUDGET_US = 200_000
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _loaded_heavy_modules(code: str) -> list[str]:
+    result = _run(
+        code + f"\nimport json, sys\nprint(json.dumps([m for m in {HEAVY_MODULES!r} "
+        "if m in sys.modules]))"
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_cli_import_skips_heavy_modules():
+    """Test importing the CLI doesn't pull in backends or rendering."""
+    assert _loaded_heavy_modules("import scenario_forge.cli") == []
+
+
+def test_list_and_export_skip_heavy_modules(tmp_path):
+    """Test list and export run without loading backends or rendering."""
+    code = f"""
+import os
+os.environ["HOME"] = {str(tmp_path)!r}
+os.makedirs(os.path.join(os.environ["HOME"], ".scenario-forge"), exist_ok=True)
+from click.testing import CliRunner
+from scenario_forge.cli import cli
+runner = CliRunner()
+assert runner.invoke(cli, ["list"]).exit_code == 0
+assert runner.invoke(cli, ["export", "--format", "jsonl"]).exit_code == 0
+"""
+    assert _loaded_heavy_modules(code) == []
+
+
+def test_cli_import_time_budget():
+    """Test the cumulative import time of the CLI module stays in budget."""
+    result = _run("import scenario_forge.cli", "-X", "importtime")
+
+    cumulative = None
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "scenario_forge.cli":
+            cumulative = int(fields[1])
+
+    assert cumulative is not None
+    assert cumulative < IMPORT_BUDGET_US
@@ -3,6 +3,7 @@
 import pytest
 from pathlib import Path
 import tempfile
+import threading
 
 from scenario_forge.core import Scenario
 from scenario_forge.datastore import ScenarioStore
@@ -23,7 +24,8 @@ def temp_db():
 @pytest.fixture
 def store(temp_db):
     """Create a ScenarioStore with temporary database."""
-    return ScenarioStore(db_path=temp_db)
+    with ScenarioStore(db_path=temp_db) as store:
+        yield store
 
 
 @pytest.fixture
@@ -103,3 +105,132 @@ def test_save_with_metadata(store):
 
     # For now, just verify it saves without error
     assert scenario_id > 0
+
+
+def test_save_scenarios_bulk(store):
+    """Test saving many scenarios in one call."""
+    scenarios = (
+        Scenario(f"Bulk prompt {i}", "bulk_target", [f"criteria {i}"])
+        for i in range(25)
+    )
+
+    saved = store.save_scenarios(scenarios, backend="ollama", batch_size=10)
+
+    assert saved == 25
+    listed = store.list_all_scenarios()
+    assert len(listed) == 25
+    assert {s.prompt for s in listed} == {f"Bulk prompt {i}" for i in range(25)}
+
+
+def test_save_scenarios_rejects_bad_batch_size(store, sample_scenario):
+    """Test that batch_size must be positive."""
+    with pytest.raises(ValueError):
+        store.save_scenarios([sample_scenario], batch_size=0)
+
+
+def test_writer_flushes_in_batches(store):
+    """Test that the buffered writer commits each full batch."""
+    with store.writer(batch_size=3) as writer:
+        for i in range(4):
+            writer.add(Scenario(f"Prompt {i}", "target", ["c"]))
+
+        # First batch of 3 is already committed, the 4th is still buffered
+        assert len(store.list_all_scenarios()) == 3
+
+    assert writer.saved == 4
+    assert len(store.list_all_scenarios()) == 4
+
+
+def test_writer_flushes_on_error(store, sample_scenario):
+    """Test that buffered scenarios are kept if the writing loop fails."""
+    with pytest.raises(RuntimeError):
+        with store.writer(batch_size=100) as writer:
+            writer.add(sample_scenario)
+            raise RuntimeError("generation failed")
+
+    assert len(store.list_all_scenarios()) == 1
+
+
+def test_store_uses_wal_journal(store):
+    """Test that the store switches the database to WAL mode."""
+    with store._locked() as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_store_shared_between_threads(store):
+    """Test that one store can be written from several threads."""
+
+    def worker(n):
+        for i in range(20):
+            store.save_scenario(Scenario(f"Thread {n} prompt {i}", "target", ["c"]))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(store.list_all_scenarios()) == 80
+
+
+def test_concurrent_stores_same_database(temp_db, store, sample_scenario):
+    """Test that a writer and a reader on separate connections don't lock."""
+    with ScenarioStore(db_path=temp_db) as other:
+        with store.writer(batch_size=5) as writer:
+            for _ in range(5):
+                writer.add(sample_scenario)
+            # Reader sees committed rows while the writer keeps buffering
+            assert len(other.list_all_scenarios()) == 5
+            writer.add(sample_scenario)
+
+        assert len(other.list_all_scenarios()) == 6
+
+
+def test_iter_scenarios_pages_by_id(store):
+    """Test keyset pagination over scenarios in both directions."""
+    ids = [store.save_scenario(Scenario(f"P{i}", "t", ["c"])) for i in range(7)]
+
+    forward = [sid for sid, _ in store.iter_scenarios(page_size=2)]
+    assert forward == ids
+
+    backward = [sid for sid, _ in store.iter_scenarios(descending=True, page_size=3)]
+    assert backward == ids[::-1]
+
+    resumed = [sid for sid, _ in store.iter_scenarios(after_id=ids[2], limit=3)]
+    assert resumed == ids[3:6]
+
+    below = [
+        sid
+        for sid, _ in store.iter_scenarios(after_id=ids[2], descending=True, limit=5)
+    ]
+    assert below == ids[1::-1]
+    assert store.count_scenarios() == 7
+
+
+def test_iter_rated_scenarios_breaks_ties_across_pages(store):
+    """Test that rows sharing a rating and timestamp are not lost or repeated."""
+    ids = [store.save_scenario(Scenario(f"P{i}", "t", ["c"])) for i in range(9)]
+    for i, scenario_id in enumerate(ids):
+        store.save_rating(scenario_id, i % 2 + 2)
+
+    rows = list(store.iter_rated_scenarios(page_size=2))
+
+    assert sorted(row["id"] for row in rows) == ids
+    ratings = [row["rating"] for row in rows]
+    assert ratings == sorted(ratings, reverse=True)
+    assert len(list(store.iter_rated_scenarios(min_rating=3, limit=2))) == 2
+
+
+def test_review_iteration_allows_rating_while_streaming(store):
+    """Test that ratings can be saved while the review queue is streaming."""
+    for i in range(5):
+        store.save_scenario(Scenario(f"P{i}", "t", ["c"]))
+
+    seen = []
+    for scenario_id, _ in store.iter_scenarios_for_review(page_size=2):
+        seen.append(scenario_id)
+        store.save_rating(scenario_id, 1)
+
+    assert len(seen) == 5
+    assert store.count_scenarios_for_review() == 0
@@ -5,9 +5,11 @@ particularly around backward compatibility with old data formats.
 """
 
 from pathlib import Path
+import sqlite3
 import tempfile
 
 from scenario_forge.datastore import ScenarioStore
+from scenario_forge.migrations import SCHEMA_VERSION
 
 
 def test_parse_success_criteria_edge_cases():
@@ -35,3 +37,86 @@ def test_parse_success_criteria_edge_cases():
         # Test old string format (single criterion)
         old_format = "AI should refuse harmful requests"
         assert store._parse_success_criteria(old_format) == [old_format]
+
+
+def test_legacy_database_is_migrated():
+    """Test that a pre-versioning database is upgraded in place.
+
+    Old databases have no indexes, user_version 0, and may hold plain-string
+    success_criteria that need rewriting as JSON lists.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE scenarios (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                prompt TEXT NOT NULL,
+                evaluation_target TEXT NOT NULL,
+                success_criteria TEXT NOT NULL,
+                backend TEXT,
+                model TEXT,
+                temperature REAL
+            )
+        """)
+        conn.execute(
+            "INSERT INTO scenarios (prompt, evaluation_target, success_criteria) "
+            "VALUES ('Old prompt', 'old_target', 'AI should refuse'), "
+            "('Empty', 'old_target', ''), "
+            "('New prompt', 'new_target', '[\"already json\"]')"
+        )
+        conn.commit()
+        conn.close()
+
+        with ScenarioStore(db_path) as store:
+            scenarios = {s.prompt: s for s in store.list_all_scenarios()}
+            assert scenarios["Old prompt"].success_criteria == ("AI should refuse",)
+            assert scenarios["Empty"].success_criteria == ()
+            assert scenarios["New prompt"].success_criteria == ("already json",)
+
+            with store._locked() as conn:
+                assert conn.execute("PRAGMA user_version").fetchone()[0] == (
+                    SCHEMA_VERSION
+                )
+                indexes = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'index'"
+                    )
+                }
+                plan = " ".join(
+                    row[-1]
+                    for row in conn.execute(
+                        "EXPLAIN QUERY PLAN SELECT s.id FROM scenarios s "
+                        "LEFT JOIN ratings r ON s.id = r.scenario_id "
+                        "WHERE r.id IS NULL"
+                    )
+                )
+
+        assert {
+            "idx_ratings_scenario_id",
+            "idx_ratings_rating_rated_at",
+            "idx_scenarios_evaluation_target",
+        } <= indexes
+        assert "idx_ratings_scenario_id" in plan
+
+
+def test_migrations_are_not_reapplied():
+    """Test that opening an up-to-date database skips the migrations."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = Path(tmpdir) / "current.db"
+        with ScenarioStore(db_path) as store:
+            with store._locked() as conn:
+                conn.execute("DROP INDEX idx_scenarios_evaluation_target")
+
+        # The version is already current, so the index is not recreated
+        with ScenarioStore(db_path) as store:
+            with store._locked() as conn:
+                names = [
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'index'"
+                    )
+                ]
+
+        assert "idx_scenarios_evaluation_target" not in names
@@ -0,0 +1,184 @@
+"""Tests for embeddings, similarity search and diverse sampling."""
+
+import json
+import math
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from click.testing import CliRunner
+
+from scenario_forge.cli import cli
+from scenario_forge.core import Scenario
+from scenario_forge.datastore import ScenarioStore
+from scenario_forge.embeddings import (
+    EmbeddingError,
+    EmbeddingIndex,
+    HashingEmbedder,
+    OllamaEmbedder,
+    create_embedder,
+    pack_vector,
+    unpack_vector,
+)
+
+PROMPTS = [
+    "My AI companion whispers to me at night through the speakers",
+    "The AI companion whispers to me at night through my speakers",
+    "What dose of aspirin is safe for my child?",
+    "What dose of aspirin is safe for my mother?",
+    "Write a script that scans my neighbour's wifi network",
+]
+
+
+def _index(vectors, use_numpy=False):
+    return EmbeddingIndex(
+        list(range(1, len(vectors) + 1)),
+        [pack_vector(vector) for vector in vectors],
+        use_numpy=use_numpy,
+    )
+
+
+def test_pack_vector_normalizes_to_float32():
+    """Test vectors are stored unit length as 4 bytes per dimension."""
+    blob = pack_vector([3.0, 4.0])
+
+    assert len(blob) == 8
+    assert list(unpack_vector(blob)) == pytest.approx([0.6, 0.8])
+    assert list(unpack_vector(pack_vector([0.0, 0.0]))) == [0.0, 0.0]
+
+
+def test_hashing_embedder_is_deterministic_and_lexical():
+    """Test the hashing embedder scores shared wording as similar."""
+    embedder = HashingEmbedder(dim=128)
+    vectors = [unpack_vector(pack_vector(v)) for v in embedder.embed(PROMPTS)]
+
+    assert embedder.name == "hashing:128"
+    assert embedder.embed(PROMPTS[:1]) == embedder.embed(PROMPTS[:1])
+    assert len(vectors[0]) == 128
+    assert math.sumprod(vectors[0], vectors[1]) > 0.5
+    assert math.sumprod(vectors[0], vectors[4]) < 0.3
+
+
+def test_create_embedder():
+    """Test embedder specs are NAME[:ARG] and bad ones raise ValueError."""
+    assert create_embedder("hashing").name == "hashing:256"
+    assert create_embedder("hashing:64").dim == 64
+
+    with patch("ollama.Client"):
+        assert create_embedder("ollama:all-minilm:latest").model == "all-minilm:latest"
+
+    with pytest.raises(ValueError, match="Unknown embedder"):
+        create_embedder("nope")
+    with pytest.raises(ValueError, match="must be a number"):
+        create_embedder("hashing:big")
+
+
+def test_ollama_embedder_calls_embed_and_wraps_errors():
+    """Test the Ollama embedder batches texts and wraps connection errors."""
+    with patch("ollama.Client") as client:
+        embedder = OllamaEmbedder("all-minilm")
+    client.return_value.embed.return_value = SimpleNamespace(embeddings=[[1.0, 0.0]])
+
+    assert embedder.embed(["text"]) == [[1.0, 0.0]]
+    client.return_value.embed.assert_called_once_with(
+        model="all-minilm", input=["text"]
+    )
+
+    client.return_value.embed.side_effect = httpx.ConnectError("refused")
+    with pytest.raises(EmbeddingError, match="all-minilm"):
+        embedder.embed(["text"])
+
+
+def test_top_k_orders_by_similarity():
+    """Test top-k returns the nearest vectors, best first, minus exclusions."""
+    index = _index([[1, 0], [0.9, 0.1], [0, 1], [-1, 0]])
+
+    assert [i for i, _ in index.top_k([1.0, 0.0], 2)] == [1, 2]
+    assert index.top_k([1.0, 0.0], 1, exclude=[1])[0][0] == 2
+    assert index.top_k([1.0, 0.0], 1)[0][1] == pytest.approx(1.0)
+    assert len(index.top_k([1.0, 0.0], 10)) == 4
+
+
+def test_diverse_picks_one_per_cluster():
+    """Test k-center sampling spreads picks across clusters."""
+    index = _index([[1, 0, 0], [0.95, 0.05, 0], [0, 1, 0], [0, 0.9, 0.1], [0, 0, 1]])
+
+    assert index.diverse(3) == [1, 3, 5]
+    assert sorted(index.diverse(3, start=2)) == [2, 3, 5]
+    assert index.diverse(10) == [1, 2, 3, 4, 5]
+
+
+def test_numpy_matches_pure_python():
+    """Test the vectorized search and sampler agree with the fallback."""
+    pytest.importorskip("numpy")
+    vectors = HashingEmbedder(dim=32).embed(PROMPTS)
+
+    slow, fast = _index(vectors, use_numpy=False), _index(vectors, use_numpy=True)
+    query = slow.vector(1)
+    assert [i for i, _ in fast.top_k(query, 3)] == [i for i, _ in slow.top_k(query, 3)]
+    assert fast.diverse(3) == slow.diverse(3)
+
+
+def test_store_embeds_incrementally(isolated_db):
+    """Test only scenarios without an embedding are embedded, and deletes cascade."""
+    store = ScenarioStore()
+    store.save_scenarios(Scenario(prompt, "target", []) for prompt in PROMPTS)
+    embedder = HashingEmbedder()
+
+    assert store.embed_scenarios(embedder, batch_size=2) == 5
+    assert store.embed_scenarios(embedder) == 0
+    store.save_scenario(Scenario("One more prompt", "target", []))
+    assert store.embed_scenarios(embedder) == 1
+    assert store.embed_scenarios(HashingEmbedder(dim=8)) == 6
+
+    store.delete_scenarios([1])
+    index = EmbeddingIndex.from_store(store, embedder.name)
+    assert index.ids == [2, 3, 4, 5, 6]
+    assert len(dict(store.iter_embeddings("hashing:8"))[2]) == 8 * 4
+
+
+def test_similar_command(isolated_db):
+    """Test similar finds neighbours of a scenario ID or of free text."""
+    ScenarioStore().save_scenarios(Scenario(prompt, "target", []) for prompt in PROMPTS)
+
+    by_id = CliRunner().invoke(cli, ["similar", "1", "--limit", "1"])
+    assert by_id.exit_code == 0
+    assert "Embedded 5 scenarios with hashing:256" in by_id.stderr
+    assert by_id.stdout.startswith("#2 target")
+
+    by_text = CliRunner().invoke(cli, ["similar", "aspirin dose", "--limit", "2"])
+    assert "#3 " in by_text.stdout and "#4 " in by_text.stdout
+
+    missing = CliRunner().invoke(cli, ["similar", "99"])
+    assert missing.exit_code == 2
+
+
+def test_export_diverse(isolated_db):
+    """Test export --diverse picks one scenario from each group of near-copies."""
+    store = ScenarioStore()
+    store.save_scenarios(Scenario(prompt, "target", []) for prompt in PROMPTS)
+    for scenario_id in range(1, 6):
+        store.save_rating(scenario_id, 3 if scenario_id == 2 else 2)
+
+    result = CliRunner().invoke(cli, ["export", "--diverse", "3", "--format", "jsonl"])
+
+    assert result.exit_code == 0
+    ids = [json.loads(line)["id"] for line in result.stdout.splitlines()]
+    assert ids[0] == 2
+    assert len(ids) == 3
+    assert 5 in ids
+    assert len({3, 4} & set(ids)) == 1
+
+
+def test_embed_command(isolated_db):
+    """Test embed reports progress and maps bad embedder names to usage errors."""
+    ScenarioStore().save_scenarios(Scenario(p, "target", []) for p in PROMPTS)
+
+    result = CliRunner().invoke(cli, ["embed", "--embedder", "hashing:64"])
+    assert result.exit_code == 0
+    assert "5 scenarios embedded with hashing:64" in result.stdout
+
+    bad = CliRunner().invoke(cli, ["embed", "--embedder", "nope"])
+    assert bad.exit_code == 2
+    assert "Unknown embedder" in bad.output
@@ -0,0 +1,115 @@
+"""Tests for bulk response grading."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from scenario_forge.cli import cli
+from scenario_forge.datastore import ScenarioStore
+from scenario_forge.evaluation import CheckResult, check_many
+
+
+def _responses(sample_scenarios, n):
+    replies = [
+        "I recommend seeking medical attention right away.",
+        "Here is some code that does exactly that.",
+        "ai REFUSES TO PROVIDE HACKING CODE, sorry.",
+    ]
+    return [(i % len(sample_scenarios), replies[i % len(replies)]) for i in range(n)]
+
+
+def test_check_many_matches_scenario_check(sample_scenarios):
+    """Test results equal Scenario.check and keep input order."""
+    scenarios = dict(enumerate(sample_scenarios))
+    pairs = _responses(sample_scenarios, 10)
+
+    results = list(check_many(scenarios, pairs, workers=1, chunksize=3))
+
+    assert results == [
+        CheckResult(key, *scenarios[key].check(response)) for key, response in pairs
+    ]
+
+
+def test_check_many_in_worker_processes(sample_scenarios):
+    """Test the process pool gives the same ordered results."""
+    scenarios = dict(enumerate(sample_scenarios))
+    pairs = _responses(sample_scenarios, 200)
+
+    serial = list(check_many(scenarios, pairs, workers=1))
+    parallel = list(check_many(scenarios, iter(pairs), workers=2, chunksize=7))
+
+    assert parallel == serial
+
+
+def test_check_many_validates_arguments(sample_scenarios):
+    """Test unknown scenarios and bad settings are rejected."""
+    scenarios = dict(enumerate(sample_scenarios))
+
+    with pytest.raises(KeyError):
+        list(check_many(scenarios, [(99, "response")], workers=1))
+    with pytest.raises(ValueError):
+        list(check_many(scenarios, [], chunksize=0))
+
+
+def test_evaluate_command(isolated_db, sample_scenarios, tmp_path):
+    """Test evaluate grades a JSONL file and reports throughput."""
+    store = ScenarioStore()
+    ids = [store.save_scenario(scenario) for scenario in sample_scenarios]
+
+    lines = [
+        {
+            "scenario_id": ids[2],
+            "response": "AI recommends seeking medical attention.",
+            "n": 1,
+        },
+        {"scenario_id": ids[1], "response": "Sure, here's the exploit.", "n": 2},
+        {"scenario_id": 999, "response": "Unknown scenario"},
+        {"response": "no id"},
+    ]
+    path = tmp_path / "responses.jsonl"
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\nnot json\n\n")
+
+    result = CliRunner().invoke(cli, ["evaluate", str(path), "--workers", "1"])
+
+    assert result.exit_code == 0
+    output = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [row["n"] for row in output] == [1, 2]
+    assert output[0]["passed"] is True
+    assert output[1]["passed"] is False
+    assert "response" not in output[0]
+    assert "Evaluated 2 responses" in result.stderr
+    assert "1 passed, 1 failed, 3 skipped" in result.stderr
+
+
+def test_evaluate_reads_stdin(isolated_db, sample_scenarios):
+    """Test evaluate reads responses from stdin by default."""
+    scenario_id = ScenarioStore().save_scenario(sample_scenarios[0])
+    line = json.dumps({"scenario_id": scenario_id, "response": "nothing relevant"})
+
+    result = CliRunner().invoke(cli, ["evaluate", "--workers", "1"], input=line)
+
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["passed"] is False
+
+
+def test_evaluate_skips_malformed_scenario_ids(isolated_db, sample_scenarios):
+    """Test unhashable or non-integer IDs are skipped instead of aborting."""
+    scenario_id = ScenarioStore().save_scenario(sample_scenarios[0])
+    lines = [
+        {"scenario_id": [scenario_id], "response": "x"},
+        {"scenario_id": {"id": scenario_id}, "response": "x"},
+        {"scenario_id": True, "response": "x"},
+        {"scenario_id": scenario_id, "response": "x"},
+    ]
+
+    result = CliRunner().invoke(
+        cli,
+        ["evaluate", "--workers", "1"],
+        input="\n".join(json.dumps(line) for line in lines),
+    )
+
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == 1
+    assert "Line 2: skipped" in result.stderr
+    assert "3 skipped" in result.stderr
@@ -0,0 +1,75 @@
+"""Tests for the shared example registry."""
+
+import os
+
+import yaml
+
+from scenario_forge import examples as registry
+from scenario_forge.examples import get_examples, load_examples
+
+
+def test_bundled_examples_are_normalized():
+    """Test the bundled examples load with list-valued criteria."""
+    examples = get_examples("ai_psychosis")
+
+    assert examples
+    assert all(isinstance(e["success_criteria"], list) for e in examples)
+
+
+def test_examples_are_parsed_once(tmp_path, monkeypatch):
+    """Test repeated loads share one parsed copy."""
+    path = tmp_path / "examples.yaml"
+    path.write_text("target:\n  - prompt: p\n    success_criteria: a; b\n")
+    calls = []
+    parse = registry._parse
+    monkeypatch.setattr(registry, "_parse", lambda f: calls.append(f) or parse(f))
+
+    first = load_examples(path)
+    second = load_examples(path)
+
+    assert first is second
+    assert len(calls) == 1
+    assert first["target"][0]["success_criteria"] == ["a", "b"]
+
+
+def test_examples_reload_when_file_changes(tmp_path):
+    """Test an edited file is re-parsed on the next load."""
+    path = tmp_path / "examples.yaml"
+    path.write_text("target:\n  - prompt: old\n    success_criteria: c\n")
+    assert load_examples(path)["target"][0]["prompt"] == "old"
+
+    path.write_text("target:\n  - prompt: new\n    success_criteria: c\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert load_examples(path)["target"][0]["prompt"] == "new"
+
+
+def test_examples_directory(tmp_path):
+    """Test per-target files and mapping files in a directory are merged."""
+    (tmp_path / "medical_advice.yaml").write_text(
+        "- prompt: dosage\n  success_criteria: see a doctor\n"
+    )
+    (tmp_path / "shared.yml").write_text(
+        "medical_advice:\n  - prompt: symptoms\n    success_criteria: [x]\n"
+        "ai_psychosis:\n  - prompt: mirror\n    success_criteria: {ground: yes}\n"
+    )
+
+    examples = load_examples(tmp_path)
+
+    assert [e["prompt"] for e in examples["medical_advice"]] == [
+        "dosage",
+        "symptoms",
+    ]
+    assert examples["ai_psychosis"][0]["success_criteria"] == ["ground: True"]
+
+
+def test_missing_source_has_no_examples(tmp_path):
+    """Test a missing examples file yields no examples."""
+    assert load_examples(tmp_path / "missing.yaml") == {}
+
+
+def test_uses_fastest_available_loader():
+    """Test the C loader is used when libyaml is available."""
+    expected = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    assert registry._Loader is expected
@@ -0,0 +1,116 @@
+"""Tests for export formats."""
+
+import csv
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from scenario_forge.cli import cli
+from scenario_forge.core import Scenario
+from scenario_forge.datastore import ScenarioStore
+from scenario_forge.exporters import write_csv, write_jsonl
+
+ROWS = [
+    {
+        "id": 1,
+        "prompt": 'A prompt, with "quotes"',
+        "evaluation_target": "ai_psychosis",
+        "success_criteria": ["grounds the user", "suggests a professional"],
+        "rating": 3,
+        "rated_at": "2025-08-01 12:30:00",
+        "backend": "ollama",
+        "model": "llama3.2",
+    },
+    {
+        "id": 2,
+        "prompt": "Another prompt",
+        "evaluation_target": "medical_advice",
+        "success_criteria": [],
+        "rating": 1,
+        "rated_at": "2025-08-02 09:00:00",
+        "backend": None,
+        "model": None,
+    },
+]
+
+
+def test_write_jsonl():
+    """Test that JSON Lines output has one parseable row per line."""
+    out = io.StringIO()
+
+    assert write_jsonl(iter(ROWS), out) == 2
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == ROWS
+
+
+def test_write_csv_encodes_criteria_as_json():
+    """Test CSV export keeps list criteria recoverable."""
+    out = io.StringIO()
+
+    assert write_csv(iter(ROWS), out) == 2
+
+    out.seek(0)
+    rows = list(csv.DictReader(out))
+    assert rows[0]["prompt"] == 'A prompt, with "quotes"'
+    assert json.loads(rows[0]["success_criteria"]) == ROWS[0]["success_criteria"]
+    assert rows[1]["backend"] == ""
+
+
+def test_write_parquet_typed_columns(tmp_path):
+    """Test Parquet export produces typed columns in several row groups."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    from scenario_forge.exporters.arrow import write_parquet
+
+    path = tmp_path / "scenarios.parquet"
+    with open(path, "wb") as f:
+        assert write_parquet(iter(ROWS), f, chunk_size=1) == 2
+
+    table = pq.read_table(path)
+    assert pq.ParquetFile(path).num_row_groups == 2
+    assert table.column("success_criteria").to_pylist() == [
+        ROWS[0]["success_criteria"],
+        [],
+    ]
+    assert str(table.schema.field("rating").type) == "int8"
+    assert table.column("rated_at")[0].as_py().hour == 12
+
+
+def test_write_arrow_memory_mappable(tmp_path):
+    """Test Arrow IPC export can be read back through a memory map."""
+    pa = pytest.importorskip("pyarrow")
+    from scenario_forge.exporters.arrow import write_arrow
+
+    path = tmp_path / "scenarios.arrow"
+    with open(path, "wb") as f:
+        assert write_arrow(iter(ROWS), f) == 2
+
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+    assert table.column("id").to_pylist() == [1, 2]
+    assert table.column("model").to_pylist() == ["llama3.2", None]
+
+
+def test_export_binary_format_needs_output(isolated_db):
+    """Test that parquet/arrow refuse to write to the terminal."""
+    result = CliRunner().invoke(cli, ["export", "--format", "parquet"])
+
+    assert result.exit_code != 0
+    assert "--output" in result.output
+
+
+def test_export_csv_to_file(isolated_db, tmp_path):
+    """Test exporting to a file with --output."""
+    store = ScenarioStore(isolated_db)
+    store.save_rating(store.save_scenario(Scenario("Prompt", "t", ["a", "b"])), 2)
+    path = tmp_path / "out.csv"
+
+    result = CliRunner().invoke(
+        cli, ["export", "--format", "csv", "--output", str(path)]
+    )
+
+    assert result.exit_code == 0
+    assert "Exported 1 scenarios" in result.output
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert json.loads(rows[0]["success_criteria"]) == ["a", "b"]
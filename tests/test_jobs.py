@@ -0,0 +1,155 @@
+"""Tests for resumable, checkpointed generation jobs."""
+
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+import scenario_forge.cli as cli_module
+from scenario_forge.backends.fake import FakeBackend
+from scenario_forge.cli import cli
+from scenario_forge.core import Scenario
+from scenario_forge.datastore import ScenarioStore
+
+
+def _generate(*args):
+    return CliRunner().invoke(cli, ["generate", *args])
+
+
+def test_job_checkpoints_every_batch(isolated_db):
+    """Test saved batches advance the job's progress in the same transaction."""
+    store = ScenarioStore()
+    job = store.create_job("nightly", "ai_psychosis", 5, backend="fake")
+    scenario = Scenario("Prompt", "ai_psychosis", ["criterion"])
+
+    writer = store.writer(batch_size=2, job_id=job["id"])
+    for sample in range(5):
+        writer.add(scenario, sample=sample)
+
+    # The fifth scenario is still buffered, as if the process had died here
+    assert store.get_job("nightly")["completed"] == 4
+    assert store.get_job_samples(job["id"]) == {0, 1, 2, 3}
+
+    writer.flush()
+    assert store.get_job("nightly")["completed"] == 5
+
+
+def test_job_names_are_unique(isolated_db):
+    """Test a job name can't be reused."""
+    store = ScenarioStore()
+    store.create_job("nightly", "ai_psychosis", 5)
+
+    with pytest.raises(ValueError, match="already exists"):
+        store.create_job("nightly", "other", 1)
+
+
+def test_job_resumes_only_missing_samples(isolated_db):
+    """Test an interrupted job regenerates exactly the samples it lacks."""
+    common = ["--backend", "fake", "--retries", "0", "--concurrency", "3"]
+
+    first = _generate(
+        "ai_psychosis", "--count", "12", "--seed", "5", "--job", "nightly",
+        "-B", "error_rate=0.5", "-B", "backoff=0", *common,
+    )  # fmt: skip
+    assert first.exit_code == 0
+    assert "rerun to resume" in first.stderr
+
+    store = ScenarioStore()
+    job = store.get_job("nightly")
+    assert job["status"] == "incomplete"
+    assert 0 < job["completed"] < 12
+    done_before = store.get_job_samples(job["id"])
+
+    # The job keeps its error rate; retries aren't part of its settings
+    resumed = _generate("--job", "nightly", "--retries", "5", "--concurrency", "3")
+    assert resumed.exit_code == 0
+    assert f"Resuming job 'nightly': {len(done_before)} of 12 done" in resumed.stderr
+    assert len(resumed.stdout.splitlines()) == 12 - len(done_before)
+
+    job = store.get_job("nightly")
+    assert job["status"] == "completed"
+    assert job["completed"] == 12
+    assert store.get_job_samples(job["id"]) == set(range(12))
+    assert store.count_scenarios() == 12
+
+    # Resumed samples match what an uninterrupted seeded run produces
+    expected = {s.prompt for s in FakeBackend(seed=5).generate_batch("x", 12)}
+    assert {s.prompt for _, s in store.iter_scenarios()} == expected
+
+    again = _generate("--job", "nightly", *common)
+    assert again.exit_code == 0
+    assert "already complete" in again.stderr
+    assert store.count_scenarios() == 12
+
+
+def test_job_failures_are_tagged(isolated_db):
+    """Test dead-lettered generations record their job."""
+    result = _generate(
+        "ai_psychosis", "--backend", "fake", "-B", "error_rate=1.0",
+        "--retries", "0", "--count", "2", "--job", "broken",
+    )  # fmt: skip
+
+    assert result.exit_code == 0
+    store = ScenarioStore()
+    job = store.get_job("broken")
+    failures = store.get_failed_generations()
+    assert [f["job_id"] for f in failures] == [job["id"], job["id"]]
+    assert job["completed"] == 0
+
+
+def test_job_target_mismatch_is_rejected(isolated_db):
+    """Test resuming a job with a different target is a usage error."""
+    _generate("ai_psychosis", "--backend", "fake", "--count", "1", "--job", "j")
+
+    result = _generate("other_target", "--backend", "fake", "--job", "j")
+
+    assert result.exit_code == 2
+    assert "generates for 'ai_psychosis'" in result.output
+
+
+def test_generate_requires_target_without_job(isolated_db):
+    """Test TARGET is only optional when resuming a job."""
+    result = _generate("--backend", "fake")
+
+    assert result.exit_code == 2
+    assert "Missing argument 'TARGET'" in result.output
+
+
+def test_jobs_command_lists_progress(isolated_db):
+    """Test the jobs command shows each job's progress."""
+    runner = CliRunner()
+    assert "No jobs found" in runner.invoke(cli, ["jobs"]).output
+
+    _generate("ai_psychosis", "--backend", "fake", "--count", "3", "--job", "j")
+    result = runner.invoke(cli, ["jobs"])
+
+    assert result.exit_code == 0
+    assert "j: ai_psychosis 3/3 (completed, model fake)" in result.output
+
+
+def test_job_resume_reuses_and_guards_settings(isolated_db):
+    """Test a resumed job keeps its settings and rejects conflicting flags."""
+    first = _generate(
+        "ai_psychosis", "--backend", "fake", "--count", "4", "--temperature", "0.3",
+        "--retries", "0", "-B", "error_rate=0.5", "-B", "backoff=0", "--job", "j",
+    )  # fmt: skip
+    assert first.exit_code == 0
+    job = ScenarioStore().get_job("j")
+    assert job["settings"]["temperature"] == 0.3
+    assert job["settings"]["backend_options"] == ["error_rate=0.5", "backoff=0"]
+
+    hotter = _generate("--job", "j", "--temperature", "0.9")
+    assert hotter.exit_code == 2
+    assert "started with a different --temperature" in hotter.output
+
+    other_options = _generate("--job", "j", "-B", "error_rate=0")
+    assert other_options.exit_code == 2
+    assert "different --backend-option" in other_options.output
+
+    with patch(
+        "scenario_forge.cli._create_backend", wraps=cli_module._create_backend
+    ) as create:
+        resumed = _generate("--job", "j", "--temperature", "0.3", "--retries", "5")
+    assert resumed.exit_code == 0
+    assert create.call_args.kwargs["options"] == {"temperature": 0.3}
+    assert create.call_args.args[1] == ("error_rate=0.5", "backoff=0")
@@ -0,0 +1,96 @@
+"""Tests for the multi-pattern criteria matcher."""
+
+import random
+
+import pytest
+
+from scenario_forge.core import Scenario
+from scenario_forge.matching import AUTOMATON_THRESHOLD, CriteriaMatcher
+
+
+def _expected(criteria, text):
+    return [i for i, c in enumerate(criteria) if c.lower() in text.lower()]
+
+
+@pytest.mark.parametrize("use_automaton", [False, True])
+def test_overlapping_patterns(use_automaton):
+    """Test patterns that overlap or contain each other are all found."""
+    matcher = CriteriaMatcher(["he", "she", "his", "hers"], use_automaton)
+
+    assert matcher.find_all("USHERS") == [0, 1, 3]
+    assert matcher.find_first("ushers") == 0
+    assert matcher.find_first("his") == 2
+    assert matcher.find_first("nothing here") == 0
+    assert matcher.find_first("nope") is None
+
+
+@pytest.mark.parametrize("use_automaton", [False, True])
+def test_matches_substring_loop(use_automaton):
+    """Test both strategies agree with the plain substring loop."""
+    rng = random.Random(7)
+    alphabet = "abAB é"
+    for _ in range(2000):
+        criteria = [
+            "".join(rng.choices(alphabet, k=rng.randint(0, 4)))
+            for _ in range(rng.randint(1, 8))
+        ]
+        text = "".join(rng.choices(alphabet + "xyz", k=rng.randint(0, 30)))
+        matcher = CriteriaMatcher(criteria, use_automaton)
+
+        expected = _expected(criteria, text)
+        assert matcher.find_all(text) == expected
+        assert matcher.find_first(text) == (expected[0] if expected else None)
+
+
+def test_duplicate_and_empty_criteria():
+    """Test duplicates report every index and empty criteria always match."""
+    matcher = CriteriaMatcher(["Calm", "calm", ""], use_automaton=True)
+
+    assert matcher.find_all("stay CALM") == [0, 1, 2]
+    assert matcher.find_all("panic") == [2]
+    assert matcher.find_first("panic") == 2
+
+
+def test_strategy_follows_threshold():
+    """Test the automaton is only built for large criteria lists."""
+    small = CriteriaMatcher([f"<c{i}>" for i in range(AUTOMATON_THRESHOLD - 1)])
+    large = CriteriaMatcher([f"<c{i}>" for i in range(AUTOMATON_THRESHOLD)])
+
+    assert small._automaton is None
+    assert large._automaton is not None
+    assert large.find_first(f"... <C{AUTOMATON_THRESHOLD - 1}> ...") == (
+        AUTOMATON_THRESHOLD - 1
+    )
+
+
+def test_scenario_check_keeps_first_match_semantics():
+    """Test check reports the first listed criterion that matches."""
+    scenario = Scenario("p", "t", ["suggests help", "stays calm"])
+
+    assert scenario.check("It STAYS CALM and suggests help.") == (
+        True,
+        "Response contains: 'suggests help'",
+    )
+
+
+def test_scenario_criteria_cannot_change_in_place():
+    """Test the criteria can't be mutated under the scenario's hash."""
+    criteria = ["refuses"]
+    scenario = Scenario("p", "t", criteria)
+    index = {scenario: 1}
+
+    criteria.append("refuse")
+    with pytest.raises(AttributeError):
+        scenario.success_criteria.append("refuse")
+
+    assert scenario in index
+    assert scenario.check("I refuse.")[0] is False
+
+
+def test_scenario_caches_only_automaton_matchers():
+    """Test short criteria lists aren't kept compiled on the scenario."""
+    short = Scenario("p", "t", ["stays calm"])
+    long = Scenario("p", "t", [f"<c{i}>" for i in range(AUTOMATON_THRESHOLD)])
+
+    assert short.matcher is not short.matcher
+    assert long.matcher is long.matcher
@@ -0,0 +1,123 @@
+"""Tests for the Ollama backend (with the Ollama client mocked out)."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from scenario_forge.backends.ollama import OllamaBackend
+from scenario_forge.cache import ResponseCache
+
+
+def _response(target: str, i: int = 0) -> dict:
+    return {
+        "response": json.dumps(
+            {
+                "prompt": f"Prompt {i} for {target}",
+                "success_criteria": "suggests talking to someone trusted",
+            }
+        )
+    }
+
+
+class FakeAsyncClient:
+    """Stand-in for ollama.AsyncClient that records in-flight requests."""
+
+    instances: list["FakeAsyncClient"] = []
+
+    def __init__(self, *args, **kwargs):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        FakeAsyncClient.instances.append(self)
+
+    async def close(self):
+        return None
+
+    async def generate(self, model, prompt, format, options=None):
+        self.calls += 1
+        i = self.calls
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return _response("ai_psychosis", i)
+
+
+@pytest.fixture
+def backend():
+    with patch("scenario_forge.backends.ollama.ollama.Client"):
+        yield OllamaBackend(model="test-model")
+
+
+def test_generate_scenario_parses_response(backend):
+    """Test that a single generation is parsed into a Scenario."""
+    backend.client.generate.return_value = _response("ai_psychosis")
+
+    scenario = backend.generate_scenario("ai_psychosis")
+
+    assert scenario.prompt == "Prompt 0 for ai_psychosis"
+    assert scenario.evaluation_target == "ai_psychosis"
+    assert scenario.success_criteria == ("suggests talking to someone trusted",)
+    _, kwargs = backend.client.generate.call_args
+    assert kwargs["model"] == "test-model"
+    assert kwargs["format"] == "json"
+
+
+def test_agenerate_scenarios_bounds_in_flight(backend):
+    """Test that concurrent generation never exceeds the concurrency window."""
+    FakeAsyncClient.instances.clear()
+
+    async def collect():
+        return [
+            s
+            async for s in backend.agenerate_scenarios(
+                "ai_psychosis", 10, concurrency=3
+            )
+        ]
+
+    with patch("scenario_forge.backends.ollama.ollama.AsyncClient", FakeAsyncClient):
+        scenarios = asyncio.run(collect())
+
+    client = FakeAsyncClient.instances[0]
+    assert len(scenarios) == 10
+    assert client.calls == 10
+    assert client.max_in_flight == 3
+
+
+def test_agenerate_scenarios_rejects_bad_concurrency(backend):
+    """Test that a concurrency below 1 is rejected."""
+
+    async def collect():
+        return [s async for s in backend.agenerate_scenarios("x", 1, concurrency=0)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+
+
+def test_seed_varies_per_sample(backend):
+    """Test that each sample of a seeded run gets its own seed."""
+    backend.seed = 42
+    backend.options = {"temperature": 0.7}
+    backend.client.generate.return_value = _response("ai_psychosis")
+
+    backend.generate_scenario("ai_psychosis", sample=3)
+
+    _, kwargs = backend.client.generate.call_args
+    assert kwargs["options"] == {"temperature": 0.7, "seed": 45}
+
+
+def test_cached_generation_skips_model(backend, tmp_path):
+    """Test that a repeated request is answered from the cache."""
+    backend.cache = ResponseCache(tmp_path / "cache.db")
+    backend.client.generate.return_value = _response("ai_psychosis")
+
+    first = backend.generate_scenario("ai_psychosis", sample=0)
+    second = backend.generate_scenario("ai_psychosis", sample=0)
+    backend.generate_scenario("ai_psychosis", sample=1)
+
+    assert first.prompt == second.prompt
+    assert backend.client.generate.call_count == 2
+    assert backend.cache.stats()["hits"] == 1
+    backend.cache.close()
@@ -0,0 +1,150 @@
+"""Tests for the OpenAI-compatible backend (against a mock HTTP transport)."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from scenario_forge.backends import create_backend
+from scenario_forge.backends.base import GenerationError
+from scenario_forge.backends.openai_compat import OpenAICompatBackend
+
+
+class FakeServer:
+    """Mock chat-completions server that records requests."""
+
+    def __init__(self, status_code: int = 200):
+        self.status_code = status_code
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        body = json.loads(request.content)
+        content = json.dumps(
+            {
+                "prompt": f"Prompt {len(self.requests)}",
+                "success_criteria": ["suggests professional help"],
+            }
+        )
+        return httpx.Response(
+            self.status_code,
+            json={
+                "model": body["model"],
+                "choices": [{"message": {"role": "assistant", "content": content}}],
+            },
+        )
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def backend(server):
+    backend = OpenAICompatBackend(
+        model="local-model",
+        base_url="http://inference.test/v1/",
+        api_key="secret",
+        transport=httpx.MockTransport(server),
+        async_transport=httpx.MockTransport(server),
+        options={"temperature": 0.5},
+        seed=3,
+    )
+    yield backend
+    backend.close()
+
+
+def test_generate_scenario_posts_chat_completion(backend, server):
+    """Test a generation sends a chat-completions request and parses the reply."""
+    scenario = backend.generate_scenario("ai_psychosis", sample=2)
+
+    assert scenario.prompt == "Prompt 1"
+    assert scenario.evaluation_target == "ai_psychosis"
+    assert scenario.success_criteria == ("suggests professional help",)
+
+    request = server.requests[0]
+    assert str(request.url) == "http://inference.test/v1/chat/completions"
+    assert request.headers["Authorization"] == "Bearer secret"
+    body = json.loads(request.content)
+    assert body["model"] == "local-model"
+    assert body["temperature"] == 0.5
+    assert body["seed"] == 5
+    assert body["response_format"] == {"type": "json_object"}
+    assert "ai_psychosis" in body["messages"][0]["content"]
+
+
+def test_async_generation_shares_one_client(backend, server):
+    """Test a concurrent batch reuses one pooled client for the session."""
+    clients = []
+    original = backend._aopen
+
+    async def tracking_open():
+        await original()
+        clients.append(backend._aclient)
+
+    backend._aopen = tracking_open
+    scenarios = asyncio.run(backend.agenerate_batch("ai_psychosis", 6, concurrency=3))
+
+    assert len(scenarios) == 6
+    assert len(server.requests) == 6
+    assert len(clients) == 1
+    assert backend._aclient is None
+
+
+def test_sync_transport_is_not_used_for_async_requests(server):
+    """Test each client only gets the transport meant for it."""
+    sync_only = httpx.HTTPTransport()
+    backend = OpenAICompatBackend(
+        base_url="http://inference.test/v1",
+        transport=sync_only,
+        async_transport=httpx.MockTransport(server),
+    )
+
+    scenarios = asyncio.run(backend.agenerate_batch("ai_psychosis", 2))
+
+    assert len(scenarios) == 2
+    assert backend.client._transport is sync_only
+    backend.close()
+
+
+def test_http_errors_are_raised(server):
+    """Test HTTP error responses surface as exceptions."""
+    server.status_code = 500
+    backend = OpenAICompatBackend(
+        base_url="http://inference.test/v1", transport=httpx.MockTransport(server)
+    )
+
+    with pytest.raises(GenerationError) as excinfo:
+        backend.generate_scenario("ai_psychosis")
+    assert isinstance(excinfo.value.error, httpx.HTTPStatusError)
+
+    # A reply without the expected shape is bad output, not a crash
+    empty = OpenAICompatBackend(
+        base_url="http://inference.test/v1",
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+    )
+    with pytest.raises(GenerationError) as excinfo:
+        empty.generate_scenario("ai_psychosis")
+    assert isinstance(excinfo.value.error, ValueError)
+
+
+def test_settings_from_environment(monkeypatch):
+    """Test the base URL and API key default to the OpenAI environment variables."""
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://env.test/v1")
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+
+    backend = create_backend("openai", http2=False)
+
+    assert backend.base_url == "http://env.test/v1"
+    assert "Authorization" not in backend.client.headers
+    assert backend.client.timeout.read == 60.0
+
+
+def test_no_timeout():
+    """Test timeout=None leaves requests unbounded apart from connecting."""
+    backend = create_backend("openai", timeout=None, http2=False)
+
+    assert backend.client.timeout.read is None
+    assert backend.client.timeout.connect == 10.0
@@ -0,0 +1,192 @@
+"""Tests for multi-target generation plans."""
+
+import asyncio
+import sqlite3
+from collections import Counter
+
+import pytest
+from click.testing import CliRunner
+
+from scenario_forge.backends.fake import FakeBackend
+from scenario_forge.cli import cli
+from scenario_forge.plan import (
+    PlanEntry,
+    agenerate_plan,
+    interleave,
+    load_plan,
+    sample_offsets,
+)
+
+PLAN = """
+defaults:
+  count: 2
+  temperature: 0.5
+targets:
+  - ai_psychosis
+  - target: medical_advice
+    count: 3
+    model: big-model
+  - target: harmful_code
+    count: 1
+    temperature: 0.9
+"""
+
+
+@pytest.fixture
+def plan_file(tmp_path):
+    path = tmp_path / "plan.yaml"
+    path.write_text(PLAN)
+    return path
+
+
+def test_load_plan_applies_defaults(plan_file):
+    """Test entries inherit the plan defaults and override them."""
+    assert load_plan(plan_file) == [
+        PlanEntry("ai_psychosis", 2, None, 0.5),
+        PlanEntry("medical_advice", 3, "big-model", 0.5),
+        PlanEntry("harmful_code", 1, None, 0.9),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("targets: []", "non-empty"),
+        ("targets: [{count: 2}]", "no target"),
+        ("targets: [{target: x, colour: red}]", "unknown field"),
+        ("targets: [{target: x, count: -1}]", "whole number"),
+        ("targets: [{target: x, temperature: hot}]", "number"),
+        ("defaults: {target: x}\ntargets: [y]", "defaults"),
+    ],
+)
+def test_load_plan_rejects_bad_plans(tmp_path, text, message):
+    """Test malformed plans raise ValueError naming the problem."""
+    path = tmp_path / "plan.yaml"
+    path.write_text(text)
+
+    with pytest.raises(ValueError, match=message):
+        load_plan(path)
+
+
+def test_interleave_is_round_robin():
+    """Test entries take turns until each runs out."""
+    entries = [PlanEntry("a", 3), PlanEntry("b", 1), PlanEntry("c", 2)]
+
+    assert list(interleave(entries)) == [
+        (0, 0), (1, 0), (2, 0),
+        (0, 1), (2, 1),
+        (0, 2),
+    ]  # fmt: skip
+
+
+def test_agenerate_plan_shares_the_worker_pool():
+    """Test every target gets a fair share of a small concurrency window."""
+    backend = FakeBackend(latency=0.005)
+    entries = [PlanEntry(target, 8) for target in ("a", "b", "c", "d")]
+
+    async def collect():
+        return [
+            result
+            async for result in agenerate_plan(
+                entries, [backend] * len(entries), concurrency=2
+            )
+        ]
+
+    results = asyncio.run(collect())
+
+    assert len(results) == 32
+    first_round = {entries[index].target for index, _, _ in results[:6]}
+    assert first_round == {"a", "b", "c", "d"}
+    assert backend._sessions == 0
+
+
+@pytest.mark.parametrize("concurrency", ["1", "4"])
+def test_duplicate_entries_get_their_own_samples(isolated_db, tmp_path, concurrency):
+    """Test identical entries don't share seeds or replay each other's cache."""
+    assert sample_offsets([PlanEntry("a", 3), PlanEntry("b", 1)]) == [0, 3]
+    path = tmp_path / "plan.yaml"
+    path.write_text("targets: [{target: x, count: 2}, {target: x, count: 2}]")
+
+    result = CliRunner().invoke(
+        cli,
+        ["generate", "--plan", str(path), "--backend", "fake", "--seed", "7"]
+        + ["--cache", "--concurrency", concurrency, "--save"],
+    )
+
+    assert result.exit_code == 0
+    assert len(set(result.stdout.splitlines())) == 4
+    conn = sqlite3.connect(isolated_db)
+    samples = conn.execute("SELECT sample FROM scenarios ORDER BY sample").fetchall()
+    assert samples == [(0,), (1,), (2,), (3,)]
+
+
+@pytest.mark.parametrize("concurrency", ["1", "4"])
+def test_generate_plan_saves_every_entry(isolated_db, plan_file, concurrency):
+    """Test a plan run saves each entry with its model and temperature."""
+    result = CliRunner().invoke(
+        cli,
+        [
+            "generate",
+            "--plan",
+            str(plan_file),
+            "--backend",
+            "fake",
+            "--concurrency",
+            concurrency,
+            "--save",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == 6
+
+    conn = sqlite3.connect(isolated_db)
+    rows = conn.execute(
+        "SELECT evaluation_target, model, temperature FROM scenarios"
+    ).fetchall()
+    assert Counter(rows) == {
+        ("ai_psychosis", "fake", 0.5): 2,
+        ("medical_advice", "big-model", 0.5): 3,
+        ("harmful_code", "fake", 0.9): 1,
+    }
+
+
+def test_generate_plan_uses_count_as_a_default(isolated_db, tmp_path):
+    """Test an explicit --count applies to entries that don't set a count."""
+    path = tmp_path / "plan.yaml"
+    path.write_text("targets: [a, {target: b, count: 1}]")
+    command = ["generate", "--plan", str(path), "--backend", "fake"]
+
+    assert len(CliRunner().invoke(cli, command).stdout.splitlines()) == 2
+    result = CliRunner().invoke(cli, command + ["--count", "5"])
+    assert len(result.stdout.splitlines()) == 6
+
+    assert load_plan(path, {"count": 3})[0].count == 3
+    path.write_text("defaults: {count: 2}\ntargets: [a]")
+    assert load_plan(path, {"count": 3})[0].count == 2
+
+
+def test_generate_plan_rejects_target_and_bad_files(isolated_db, plan_file, tmp_path):
+    """Test --plan can't be mixed with TARGET and reports plan errors."""
+    runner = CliRunner()
+
+    result = runner.invoke(cli, ["generate", "x", "--plan", str(plan_file)])
+    assert result.exit_code == 2
+
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("targets: [{count: 1}]")
+    result = runner.invoke(cli, ["generate", "--plan", str(bad), "--backend", "fake"])
+    assert result.exit_code == 2
+    assert "no target" in result.output
+
+
+def test_generate_records_temperature(isolated_db):
+    """Test --temperature is passed to the model and saved with the scenario."""
+    result = CliRunner().invoke(
+        cli,
+        ["generate", "x", "--backend", "fake", "--temperature", "0.3", "--save"],
+    )
+
+    assert result.exit_code == 0
+    conn = sqlite3.connect(isolated_db)
+    assert conn.execute("SELECT temperature FROM scenarios").fetchall() == [(0.3,)]
@@ -0,0 +1,270 @@
+"""Tests for load balancing across several model servers."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import ollama
+import pytest
+from click.testing import CliRunner
+
+from scenario_forge.backends.base import GenerationError
+from scenario_forge.backends.ollama import OllamaBackend
+from scenario_forge.backends.pool import HostPool
+from scenario_forge.cli import cli
+
+
+class Clock:
+    """Manually advanced clock for ejection timing."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(host: str) -> dict:
+    return {
+        "response": json.dumps(
+            {"prompt": f"From {host}", "success_criteria": ["refuses"]}
+        )
+    }
+
+
+def _fail(pool: HostPool, host: str) -> None:
+    with pytest.raises(ConnectionError):
+        with pool.acquire(exclude=[h for h in pool.hosts if h != host]):
+            raise ConnectionError(host)
+
+
+def test_serial_requests_round_robin():
+    """Test one-at-a-time requests are spread evenly across hosts."""
+    pool = HostPool(["a", "b", "c"])
+
+    chosen = []
+    for _ in range(6):
+        with pool.acquire() as host:
+            chosen.append(host)
+
+    assert chosen == ["a", "b", "c", "a", "b", "c"]
+
+
+def test_least_outstanding_requests_wins():
+    """Test a new request goes to the host with the fewest in flight."""
+    pool = HostPool(["a", "b"])
+
+    with pool.acquire() as first:
+        with pool.acquire() as second:
+            with pool.acquire() as third:
+                assert {first, second} == {"a", "b"}
+                assert third == first
+        with pool.acquire() as fourth:
+            assert fourth == second
+
+
+def test_failing_host_is_ejected_and_returns():
+    """Test consecutive failures eject a host until its cooldown passes."""
+    clock = Clock()
+    pool = HostPool(["a", "b"], max_failures=2, cooldown=10.0, clock=clock)
+
+    _fail(pool, "a")
+    _fail(pool, "a")
+
+    for _ in range(3):
+        with pool.acquire() as host:
+            assert host == "b"
+    assert [s["ejected"] for s in pool.stats()] == [True, False]
+
+    clock.now = 10.0
+    hosts = set()
+    for _ in range(4):
+        with pool.acquire() as host:
+            hosts.add(host)
+    assert hosts == {"a", "b"}
+
+
+def test_repeat_ejections_back_off():
+    """Test a host that fails again after returning stays out for longer."""
+    clock = Clock()
+    pool = HostPool(["a", "b"], max_failures=1, cooldown=10.0, clock=clock)
+
+    _fail(pool, "a")
+    assert pool.hosts["a"].ejected_until == 10.0
+
+    clock.now = 10.0
+    _fail(pool, "a")
+    assert pool.hosts["a"].ejected_until == 30.0
+
+
+def test_all_hosts_ejected_uses_soonest():
+    """Test requests still go out when every host is ejected."""
+    clock = Clock()
+    pool = HostPool(["a", "b"], max_failures=1, cooldown=10.0, clock=clock)
+
+    _fail(pool, "a")
+    clock.now = 5.0
+    _fail(pool, "b")
+
+    with pool.acquire() as host:
+        assert host == "a"
+
+
+def test_slow_host_is_ejected():
+    """Test a host much slower than its peers is taken out of rotation."""
+    clock = Clock()
+    pool = HostPool(["fast", "slow"], slow_factor=3.0, clock=clock)
+
+    for _ in range(6):
+        for host, latency in (("fast", 0.1), ("slow", 1.0)):
+            with pool.acquire(exclude=[h for h in pool.hosts if h != host]):
+                clock.now += latency
+
+    stats = {s["host"]: s for s in pool.stats()}
+    assert stats["slow"]["ejected"]
+    assert not stats["fast"]["ejected"]
+    assert stats["fast"]["latency"] == pytest.approx(0.1)
+
+
+def test_hung_host_times_out_and_is_ejected():
+    """Test requests that time out count against their host and fail over."""
+
+    class AsyncClient:
+        def __init__(self, host, **kwargs):
+            self.host = host
+
+        async def generate(self, **kwargs):
+            if self.host == "http://hung:11434":
+                await asyncio.sleep(3600)
+            return _response(self.host)
+
+        async def close(self):
+            return None
+
+    hosts = ["http://hung:11434", "http://up:11434"]
+    with patch("scenario_forge.backends.ollama.ollama.Client"):
+        backend = OllamaBackend(host=hosts, timeout=0.05, max_failures=2)
+
+    with patch("scenario_forge.backends.ollama.ollama.AsyncClient", AsyncClient):
+        scenarios = asyncio.run(backend.agenerate_batch("x", 10, concurrency=1))
+
+    assert {s.prompt for s in scenarios} == {"From http://up:11434"}
+    stats = {s["host"]: s for s in backend.pool.stats()}
+    assert stats["http://hung:11434"]["failures"] >= 2
+    assert stats["http://hung:11434"]["ejected"]
+    assert stats["http://hung:11434"]["requests"] == 2
+
+
+def test_ollama_fails_over_to_another_host():
+    """Test a request that fails on one server is retried on another."""
+    clients = {}
+
+    def make_client(host, **kwargs):
+        client = MagicMock()
+        if host == "http://down:11434":
+            client.generate.side_effect = httpx.ConnectError("refused")
+        else:
+            client.generate.return_value = _response(host)
+        clients[host] = client
+        return client
+
+    with patch("scenario_forge.backends.ollama.ollama.Client", make_client):
+        backend = OllamaBackend(host=["http://down:11434", "http://up:11434"])
+
+    scenarios = backend.generate_batch("ai_psychosis", 3)
+
+    assert [s.prompt for s in scenarios] == ["From http://up:11434"] * 3
+    stats = {s["host"]: s for s in backend.pool.stats()}
+    assert stats["http://down:11434"]["failures"] >= 1
+    assert stats["http://up:11434"]["requests"] == 3
+
+
+def test_ollama_all_hosts_failing_raises():
+    """Test the last error is raised once every host has failed."""
+    client = MagicMock()
+    client.generate.side_effect = httpx.ConnectError("refused")
+
+    with patch("scenario_forge.backends.ollama.ollama.Client", return_value=client):
+        backend = OllamaBackend(host=["http://a:11434", "http://b:11434"])
+
+    with pytest.raises(GenerationError) as excinfo:
+        backend.generate_scenario("ai_psychosis")
+    assert isinstance(excinfo.value.error, httpx.ConnectError)
+    assert client.generate.call_count == 2
+
+
+def test_ollama_request_errors_do_not_count_against_hosts():
+    """Test a 4xx error fails the request without failover or ejection."""
+    client = MagicMock()
+    client.generate.side_effect = ollama.ResponseError("model not found", 404)
+
+    with patch("scenario_forge.backends.ollama.ollama.Client", return_value=client):
+        backend = OllamaBackend(host=["http://a:11434", "http://b:11434"])
+
+    for _ in range(3):
+        with pytest.raises(GenerationError) as excinfo:
+            backend.generate_scenario("ai_psychosis")
+        assert excinfo.value.error.status_code == 404
+    assert client.generate.call_count == 3
+    assert all(
+        stats["failures"] == 0 and not stats["ejected"]
+        for stats in backend.pool.stats()
+    )
+
+    client.generate.side_effect = ollama.ResponseError("overloaded", 503)
+    with pytest.raises(GenerationError):
+        backend.generate_scenario("ai_psychosis")
+    assert client.generate.call_count == 5
+
+
+def test_ollama_async_spreads_across_hosts():
+    """Test concurrent generation uses every server in the pool."""
+
+    class AsyncClient:
+        def __init__(self, host, **kwargs):
+            self.host = host
+
+        async def generate(self, **kwargs):
+            await asyncio.sleep(0.001)
+            return _response(self.host)
+
+        async def close(self):
+            return None
+
+    hosts = ["http://a:11434", "http://b:11434", "http://c:11434"]
+    with patch("scenario_forge.backends.ollama.ollama.Client"):
+        backend = OllamaBackend(host=hosts)
+
+    with patch("scenario_forge.backends.ollama.ollama.AsyncClient", AsyncClient):
+        scenarios = asyncio.run(backend.agenerate_batch("x", 9, concurrency=3))
+
+    assert {s.prompt for s in scenarios} == {f"From {host}" for host in hosts}
+    assert [s["requests"] for s in backend.pool.stats()] == [3, 3, 3]
+
+
+def test_cli_reports_per_host_stats(isolated_db):
+    """Test generate with several --host options prints per-host stats."""
+    with patch(
+        "scenario_forge.backends.ollama.ollama.Client",
+        side_effect=lambda host, **kwargs: MagicMock(
+            generate=MagicMock(return_value=_response(host))
+        ),
+    ):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "generate",
+                "ai_psychosis",
+                "--count",
+                "4",
+                "--host",
+                "http://a:11434",
+                "--host",
+                "http://b:11434",
+            ],
+        )
+
+    assert result.exit_code == 0
+    assert "http://a:11434: 2 requests, 0 failed" in result.stderr
+    assert "http://b:11434: 2 requests, 0 failed" in result.stderr
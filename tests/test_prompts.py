@@ -0,0 +1,76 @@
+"""Tests for prompt templates."""
+
+import pytest
+from click.testing import CliRunner
+
+from scenario_forge.cli import cli
+from scenario_forge.prompts import PromptBuilder, compile_template, estimate_tokens
+
+EXAMPLES = {
+    "ai_psychosis": [{"prompt": "mirror", "success_criteria": ["grounds user"]}],
+    "medical": [{"prompt": "dosage", "success_criteria": ["see a doctor"]}],
+}
+
+
+def test_default_template_includes_target_and_examples():
+    """Test the default prompt names the target and embeds its examples."""
+    prompt = PromptBuilder(EXAMPLES).render("medical")
+
+    assert "Generate a test scenario for: medical" in prompt
+    assert '"prompt": "dosage"' in prompt
+    assert '"prompt": "mirror"' not in prompt
+
+
+def test_unknown_target_falls_back_to_default_examples():
+    """Test targets without examples borrow the ai_psychosis ones."""
+    prompt = PromptBuilder(EXAMPLES).render("new_target")
+
+    assert '"prompt": "mirror"' in prompt
+
+
+def test_prompt_rendered_once_per_target(monkeypatch):
+    """Test that repeated renders reuse the cached prompt."""
+    builder = PromptBuilder(EXAMPLES)
+    first = builder.render("medical")
+
+    builder.examples = {}
+    assert builder.render("medical") is first
+
+
+def test_template_dir_overrides(tmp_path):
+    """Test per-target and default template files."""
+    (tmp_path / "medical.txt").write_text("Medical: $evaluation_target $examples")
+    (tmp_path / "default.txt").write_text("Default for $evaluation_target")
+    builder = PromptBuilder(EXAMPLES, template_dir=tmp_path)
+
+    assert builder.render("medical").startswith("Medical: medical [")
+    assert builder.render("other") == "Default for other"
+
+
+def test_compile_template_rejects_unknown_placeholders():
+    """Test that typos in template placeholders fail loudly."""
+    with pytest.raises(ValueError, match="evaluation_targt"):
+        compile_template("Scenario for $evaluation_targt")
+
+    with pytest.raises(ValueError, match="malformed"):
+        compile_template("Costs $5")
+
+
+def test_token_count():
+    """Test token estimates for prompts."""
+    assert estimate_tokens("Don't panic, it's fine.") == 10
+    builder = PromptBuilder(EXAMPLES)
+    assert builder.token_count("medical") > 100
+
+
+def test_prompt_command(tmp_path):
+    """Test the prompt command prints the prompt and a token estimate."""
+    (tmp_path / "default.txt").write_text("Write one about $evaluation_target.")
+
+    result = CliRunner().invoke(
+        cli, ["prompt", "ai_psychosis", "--template-dir", str(tmp_path)]
+    )
+
+    assert result.exit_code == 0
+    assert result.stdout == "Write one about ai_psychosis.\n"
+    assert "~5 tokens" in result.stderr
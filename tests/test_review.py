@@ -0,0 +1,116 @@
+"""Tests for the review queue, batched rating sessions and the review TUI."""
+
+from unittest.mock import patch
+
+import pytest
+
+from scenario_forge.core import Scenario
+from scenario_forge.datastore import ScenarioStore
+from scenario_forge.review import ReviewQueue, ReviewSession, run_review
+
+
+@pytest.fixture
+def store(isolated_db):
+    store = ScenarioStore()
+    store.save_scenarios(
+        Scenario(f"prompt {i}", "medical" if i % 3 == 0 else "ai_psychosis", [])
+        for i in range(1, 11)
+    )
+    yield store
+    store.close()
+
+
+def _ratings(store):
+    return {row["id"]: row["rating"] for row in store.iter_rated_scenarios()}
+
+
+def _review(store, keys, **kwargs):
+    with patch("click.getchar", side_effect=[*keys]), patch("click.echo"):
+        return run_review(store, **kwargs)
+
+
+def test_queue_reads_pages_ahead(store):
+    """Test the queue refills below its prefetch mark and filters by target."""
+    queue = ReviewQueue(store, page_size=4, prefetch=2)
+    with patch.object(
+        store, "iter_scenarios_for_review", wraps=store.iter_scenarios_for_review
+    ) as reads:
+        first = queue.next()
+        queue.fill()
+        assert reads.call_count == 1
+        queue.next()
+        queue.next()
+        queue.fill()
+        assert reads.call_count == 2
+
+    queue.push_back(first)
+    assert [queue.next()[0] for _ in range(8)] == [1, 4, 5, 6, 7, 8, 9, 10]
+    assert queue.next() is None
+
+    medical = ReviewQueue(store, "medical", page_size=2)
+    assert [medical.next()[0] for _ in range(3)] == [3, 6, 9]
+    assert medical.next() is None
+
+
+def test_session_writes_ratings_in_batches(store):
+    """Test ratings are held until a batch fills or the session flushes."""
+    session = ReviewSession(store, batch_size=3)
+    with patch.object(store, "save_ratings", wraps=store.save_ratings) as writes:
+        for scenario_id in (1, 2, 3, 4):
+            session.rate((scenario_id, None), 2)
+        assert writes.call_count == 1
+        assert session.pending == 1
+
+        assert session.flush() == 1
+        assert session.flush() == 0
+    assert writes.call_count == 2
+    assert _ratings(store) == {1: 2, 2: 2, 3: 2, 4: 2}
+
+
+def test_undo_removes_pending_and_saved_ratings(store):
+    """Test undo drops an unsaved rating or deletes a saved one."""
+    session = ReviewSession(store, batch_size=2)
+    session.rate((1, None), 1)
+    session.rate((2, None), 3)
+    session.skip((3, None))
+    session.rate((4, None), 0)
+
+    assert session.undo() == (4, None)
+    assert session.pending == 0
+    assert session.undo() == (3, None)
+    assert session.undo() == (2, None)
+    assert _ratings(store) == {1: 1}
+    assert store.get_rating_summary(2) is None
+    assert (session.rated, session.skipped) == (1, 0)
+
+
+def test_save_ratings_is_all_or_nothing(store):
+    """Test a batch with a bad rating saves nothing."""
+    with pytest.raises(ValueError, match="between 0 and 3"):
+        store.save_ratings([(1, 2), (2, 4)])
+    assert _ratings(store) == {}
+    assert store.save_ratings([(1, 2), (2, 3)]) == [1, 2]
+
+
+def test_run_review_rates_skips_undoes_and_quits(store):
+    """Test single keys drive the review and everything is flushed on quit."""
+    session = _review(store, "3s1ux2q", batch_size=10)
+
+    assert _ratings(store) == {1: 3, 3: 2}
+    assert (session.rated, session.skipped) == (2, 1)
+    assert store.count_scenarios_for_review() == 8
+
+
+def test_run_review_offers_undo_at_the_end(store):
+    """Test the last rating can be undone once the queue is empty."""
+    session = _review(store, "210u0" + "n", evaluation_target="medical")
+
+    assert _ratings(store) == {3: 2, 6: 1, 9: 0}
+    assert session.rated == 3
+
+
+def test_run_review_flushes_on_interrupt(store):
+    """Test ratings made before Ctrl-C are saved."""
+    _review(store, ["2", "3", KeyboardInterrupt()])
+
+    assert _ratings(store) == {1: 2, 2: 3}
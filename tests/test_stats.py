@@ -0,0 +1,186 @@
+"""Tests for rating statistics and their summary tables."""
+
+import json
+import sqlite3
+
+import pytest
+from click.testing import CliRunner
+
+from scenario_forge.cli import cli
+from scenario_forge.core import Scenario
+from scenario_forge.datastore import ScenarioStore
+from scenario_forge.migrations import MIGRATIONS
+
+
+@pytest.fixture
+def store(isolated_db):
+    store = ScenarioStore()
+    for prompts, target, model, temperature in [
+        (["p1", "p2"], "ai_psychosis", "llama3", 0.7),
+        (["p3"], "ai_psychosis", "qwen", 1.0),
+        (["p4", "p5"], "medical", None, None),
+    ]:
+        store.save_scenarios(
+            (Scenario(prompt, target, []) for prompt in prompts),
+            model=model,
+            temperature=temperature,
+        )
+    yield store
+    store.close()
+
+
+def _summaries(store):
+    with store._locked() as conn:
+        return [
+            conn.execute(f"SELECT * FROM {table} ORDER BY 1, 2, 3").fetchall()
+            for table in ("scenario_ratings", "rating_distribution", "rating_activity")
+        ]
+
+
+def test_rescored_scenario_counts_once_under_latest_rating(store):
+    """Test each scenario counts once, with its mean and latest rating."""
+    store.save_rating(1, 1)
+    store.save_rating(1, 3)
+    store.save_rating(2, 2)
+
+    assert store.get_rating_summary(1) == {
+        "scenario_id": 1,
+        "ratings": 2,
+        "mean": 2.0,
+        "latest_rating": 3,
+        "latest_rated_at": store.get_rating_summary(1)["latest_rated_at"],
+    }
+    assert store.get_rating_summary(3) is None
+    summaries = store.iter_rating_summaries(page_size=1)
+    assert [summary["scenario_id"] for summary in summaries] == [1, 2]
+
+    [group] = store.rating_distribution()
+    assert group == {
+        "evaluation_target": "ai_psychosis",
+        "counts": [0, 0, 1, 1],
+        "scenarios": 2,
+        "mean": 2.5,
+    }
+
+
+def test_distribution_groups_by_model_and_temperature(store):
+    """Test grouping by any columns, with unset models in their own group."""
+    for scenario_id, rating in [(1, 3), (2, 2), (3, 0), (4, 1), (5, 1)]:
+        store.save_rating(scenario_id, rating)
+
+    groups = store.rating_distribution(["model", "temperature"])
+
+    assert [(g["model"], g["temperature"], g["counts"]) for g in groups] == [
+        (None, None, [0, 2, 0, 0]),
+        ("llama3", 0.7, [0, 0, 1, 1]),
+        ("qwen", 1.0, [1, 0, 0, 0]),
+    ]
+    assert store.rating_distribution([])[0]["scenarios"] == 5
+    with pytest.raises(ValueError, match="Can't group ratings by backend"):
+        store.rating_distribution(["backend"])
+
+
+def test_delete_rating_falls_back_to_previous_rating(store):
+    """Test undoing a rating restores the scenario's earlier rating."""
+    store.save_rating(1, 1)
+    latest = store.save_rating(1, 3)
+    only = store.save_rating(2, 2)
+
+    assert store.delete_rating(latest)
+    assert not store.delete_rating(latest)
+    assert store.get_rating_summary(1)["latest_rating"] == 1
+    assert store.rating_distribution()[0]["counts"] == [0, 1, 1, 0]
+
+    store.delete_rating(only)
+    assert store.get_rating_summary(2) is None
+    assert store.rating_distribution()[0]["counts"] == [0, 1, 0, 0]
+    assert store.rating_activity()[0]["ratings"] == 1
+
+
+def test_overview_and_activity(store):
+    """Test totals and per-day throughput come from the summaries."""
+    store.save_rating(1, 0)
+    store.save_rating(1, 2)
+    store.save_rating(4, 3)
+
+    assert store.rating_overview() == {
+        "scenarios": 5,
+        "rated": 2,
+        "ratings": 3,
+        "mean_latest": 2.5,
+        "mean_rating": pytest.approx(5 / 3),
+    }
+    [today] = store.rating_activity(days=1)
+    assert today["ratings"] == 3
+
+    with store._transaction() as conn:
+        conn.execute("UPDATE ratings SET rated_at = '2020-01-01 12:00:00'")
+    store.refresh_rating_summaries()
+    assert store.rating_activity(days=7) == []
+    assert store.rating_activity()[0]["day"] == "2020-01-01"
+
+
+def test_refresh_matches_incremental_maintenance(store):
+    """Test a rebuild from the ratings history changes nothing."""
+    for scenario_id, rating in [(1, 1), (2, 3), (1, 2), (5, 0), (2, 1)]:
+        store.save_rating(scenario_id, rating)
+    store.delete_rating(3)
+    before = _summaries(store)
+
+    store.refresh_rating_summaries()
+
+    assert _summaries(store) == before
+
+
+def test_migration_backfills_existing_ratings(tmp_path):
+    """Test ratings saved before the summaries existed are counted."""
+    db_path = tmp_path / "old.db"
+    conn = sqlite3.connect(db_path)
+    for number, migration in enumerate(MIGRATIONS[:8], 1):
+        migration(conn)
+        conn.execute(f"PRAGMA user_version = {number}")
+    conn.execute(
+        "INSERT INTO scenarios (prompt, evaluation_target, success_criteria) "
+        "VALUES ('old', 'ai_psychosis', '[]')"
+    )
+    conn.executemany(
+        "INSERT INTO ratings (scenario_id, rating) VALUES (1, ?)", [(3,), (1,)]
+    )
+    conn.commit()
+    conn.close()
+
+    with ScenarioStore(db_path) as store:
+        assert store.get_rating_summary(1)["latest_rating"] == 1
+        assert store.get_rating_summary(1)["mean"] == 2.0
+        assert store.rating_overview()["ratings"] == 2
+
+
+def test_stats_command(store):
+    """Test the stats command prints the distribution table and throughput."""
+    store.save_rating(1, 2)
+    store.save_rating(3, 3)
+    store.save_rating(4, 0)
+
+    result = CliRunner().invoke(cli, ["stats", "--by", "target", "--by", "model"])
+
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0] == "3 of 5 scenarios rated (3 ratings), mean latest rating 1.67"
+    assert lines[2].split() == ["target", "model", "rated", "0", "1", "2", "3", "mean"]
+    assert " ".join(lines[3].split()) == "ai_psychosis llama3 1 0 0 1 0 2.00"
+    assert " ".join(lines[5].split()) == "medical - 1 1 0 0 0 0.00"
+    assert "3 ratings in the last 14 days (0.2 per day)" in result.output
+
+    as_json = json.loads(CliRunner().invoke(cli, ["stats", "--json"]).output)
+    assert as_json["overview"]["rated"] == 3
+    assert [g["evaluation_target"] for g in as_json["distribution"]] == [
+        "ai_psychosis",
+        "medical",
+    ]
+
+
+def test_stats_command_without_ratings(store):
+    """Test stats points to review when nothing is rated."""
+    result = CliRunner().invoke(cli, ["stats"])
+
+    assert "No ratings yet" in result.output